@@ -0,0 +1,79 @@
+"""Convert gmsh (msh2, ASCII) meshes to the binary mesh format of
+:mod:`isolator_mesh`.
+
+The binary mesh holds the nodes, the element connectivity and the physical
+names (boundary tags) of the gmsh file as raw arrays, which the drivers map
+in place instead of parsing the text on every launch. ``get_mesh`` detects
+the format, so ``mesh_filename`` can point to either file.
+
+Usage: python convert_mesh.py data/oneX/isolator.msh
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import os
+import sys
+import time
+
+from isolator_mesh import read_gmsh_arrays, write_binary_mesh
+
+
+def main(mesh_filenames, output_filename=None):
+
+    if output_filename is not None and len(mesh_filenames) > 1:
+        raise RuntimeError("Only one mesh can be converted with --output")
+
+    for mesh_filename in mesh_filenames:
+        if output_filename is None:
+            binary_filename = os.path.splitext(mesh_filename)[0] + ".bmsh"
+        else:
+            binary_filename = output_filename
+
+        t_start = time.perf_counter()
+        mesh_data = read_gmsh_arrays(mesh_filename)
+        t_read = time.perf_counter() - t_start
+
+        write_binary_mesh(mesh_data, binary_filename)
+        tags = ", ".join(name for _, _, name in mesh_data["physical_names"])
+        print(f"{mesh_filename} -> {binary_filename}")
+        print(f"\tnodes = {mesh_data['nodes'].shape[0]}, "
+              f"elements = {mesh_data['element_types'].size}, "
+              f"read time = {t_read:.2f} s")
+        print(f"\tphysical names: {tags}")
+
+
+if __name__ == "__main__":
+
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Convert gmsh meshes to binary meshes")
+    parser.add_argument("mesh_files", type=str, nargs="+",
+                        help="gmsh (msh2, ASCII) mesh files")
+    parser.add_argument("-o", "--output", type=str, dest="output",
+                        help="binary mesh file name [mesh file with .bmsh]")
+
+    args = parser.parse_args()
+
+    print(f"Running {sys.argv[0]}\n")
+    main(args.mesh_files, output_filename=args.output)
@@ -36,7 +36,6 @@ import pyopencl as cl
 import numpy.linalg as la  # noqa
 import pyopencl.array as cla  # noqa
 import math
-from pytools.obj_array import make_obj_array
 from functools import partial
 
 from mirgecom.discretization import create_discretization_collection
@@ -57,7 +56,6 @@ from mirgecom.artificial_viscosity import \
     av_laplacian_operator, smoothness_indicator
 from mirgecom.simutil import (
     check_step,
-    generate_and_distribute_mesh,
     write_visfile,
     check_naninf_local,
     check_range_local,
@@ -70,7 +68,6 @@ from mirgecom.mpi import mpi_entry_point
 from mirgecom.integrators import (rk4_step, lsrk54_step, lsrk144_step,
                                   euler_step)
 
-from mirgecom.fluid import make_conserved
 from mirgecom.steppers import advance_state
 from mirgecom.boundary import (
     PrescribedFluidBoundary,
@@ -80,6 +77,18 @@ from mirgecom.boundary import (
 from mirgecom.eos import IdealSingleGas
 from mirgecom.transport import SimpleTransport
 from mirgecom.gas_model import GasModel, make_fluid_state
+from isolator_mesh import distribute_mesh
+from isolator_initializers import (
+    sponge,
+    InitSponge,
+    getIsentropicPressure,
+    getIsentropicTemperature,
+    getMachFromAreaRatio,
+    get_actii_gas_properties,
+    get_actii_stagnation_conditions,
+    InitACTII,
+    UniformModified
+)
 
 
 class SingleLevelFilter(logging.Filter):
@@ -123,574 +132,11 @@ class MyRuntimeError(RuntimeError):
     pass
 
 
-def get_mesh(dim, mesh_filename, read_mesh=True):
-    """Get the mesh."""
-    from meshmode.mesh.io import read_gmsh
-    mesh = partial(read_gmsh, filename=mesh_filename, force_ambient_dim=dim)
-
-    return mesh
-
-
-def sponge(cv, cv_ref, sigma):
-    return sigma*(cv_ref - cv)
-
-
-class InitSponge:
-    r"""Solution initializer for flow in the ACT-II facility
-
-    This initializer creates a physics-consistent flow solution
-    given the top and bottom geometry profiles and an EOS using isentropic
-    flow relations.
-
-    The flow is initialized from the inlet stagnations pressure, P0, and
-    stagnation temperature T0.
-
-    geometry locations are linearly interpolated between given data points
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-    def __init__(self, *, x0, thickness, amplitude):
-        r"""Initialize the sponge parameters.
-
-        Parameters
-        ----------
-        x0: float
-            sponge starting x location
-        thickness: float
-            sponge extent
-        amplitude: float
-            sponge strength modifier
-        """
-
-        self._x0 = x0
-        self._thickness = thickness
-        self._amplitude = amplitude
-
-    def __call__(self, x_vec, *, time=0.0):
-        """Create the sponge intensity at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        time: float
-            Time at which solution is desired. The strength is (optionally)
-            dependent on time
-        """
-        xpos = x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        x0 = zeros + self._x0
-
-        return self._amplitude * actx.np.where(
-            actx.np.greater(xpos, x0),
-            (zeros + ((xpos - self._x0)/self._thickness) *
-            ((xpos - self._x0)/self._thickness)),
-            zeros + 0.0
-        )
-
-
-def getIsentropicPressure(mach, P0, gamma):
-    pressure = (1. + (gamma - 1.)*0.5*mach**2)
-    pressure = P0*pressure**(-gamma / (gamma - 1.))
-    return pressure
-
-
-def getIsentropicTemperature(mach, T0, gamma):
-    temperature = (1. + (gamma - 1.)*0.5*mach**2)
-    temperature = T0/temperature
-    return temperature
-
-
-def getMachFromAreaRatio(area_ratio, gamma, mach_guess=0.01):
-    error = 1.0e-8
-    nextError = 1.0e8
-    g = gamma
-    M0 = mach_guess
-    while nextError > error:
-        R = (((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))/M0
-            - area_ratio)
-        dRdM = (2*((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               / (2*g - 2)*(g - 1)/(2/(g + 1) + ((g - 1)/(g + 1)*M0*M0)) -
-               ((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               * M0**(-2))
-        M1 = M0 - R/dRdM
-        nextError = abs(R)
-        M0 = M1
-
-    return M1
-
-
-def get_y_from_x(x, data):
-    """
-    Return the linearly interpolated the value of y
-    from the value in data(x,y) at x
-    """
-
-    if x <= data[0][0]:
-        y = data[0][1]
-    elif x >= data[-1][0]:
-        y = data[-1][1]
-    else:
-        ileft = 0
-        iright = data.shape[0]-1
-
-        # find the bracketing points, simple subdivision search
-        while iright - ileft > 1:
-            ind = int(ileft+(iright - ileft)/2)
-            if x < data[ind][0]:
-                iright = ind
-            else:
-                ileft = ind
-
-        leftx = data[ileft][0]
-        rightx = data[iright][0]
-        lefty = data[ileft][1]
-        righty = data[iright][1]
-
-        dx = rightx - leftx
-        dy = righty - lefty
-        y = lefty + (x - leftx)*dy/dx
-    return y
-
-
-def get_theta_from_data(data):
-    """
-    Calculate theta = arctan(dy/dx)
-    Where data[][0] = x and data[][1] = y
-    """
-
-    theta = data.copy()
-    for index in range(1, theta.shape[0]-1):
-        #print(f"index {index}")
-        theta[index][1] = np.arctan((data[index+1][1]-data[index-1][1]) /
-                          (data[index+1][0]-data[index-1][0]))
-    theta[0][1] = np.arctan(data[1][1]-data[0][1])/(data[1][0]-data[0][0])
-    theta[-1][1] = np.arctan(data[-1][1]-data[-2][1])/(data[-1][0]-data[-2][0])
-    return theta
-
-
-class InitACTII:
-    r"""Solution initializer for flow in the ACT-II facility
-
-    This initializer creates a physics-consistent flow solution
-    given the top and bottom geometry profiles and an EOS using isentropic
-    flow relations.
-
-    The flow is initialized from the inlet stagnations pressure, P0, and
-    stagnation temperature T0.
-
-    geometry locations are linearly interpolated between given data points
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-
-    def __init__(
-            self, *, dim=2, nspecies=0, geom_top, geom_bottom,
-            P0, T0, temp_wall, temp_sigma, vel_sigma
-    ):
-        r"""Initialize mixture parameters.
-
-        Parameters
-        ----------
-        dim: int
-            specifies the number of dimensions for the solution
-        P0: float
-            stagnation pressure
-        T0: float
-            stagnation temperature
-        temp_wall: float
-            wall temperature
-        temp_sigma: float
-            near-wall temperature relaxation parameter
-        vel_sigma: float
-            near-wall velocity relaxation parameter
-        geom_top: numpy.ndarray
-            coordinates for the top wall
-        geom_bottom: numpy.ndarray
-            coordinates for the bottom wall
-        """
-
-        # check number of points in the geometry
-        #top_size = geom_top.size
-        #bottom_size = geom_bottom.size
-
-        self._dim = dim
-        self._P0 = P0
-        self._T0 = T0
-        self._geom_top = geom_top
-        self._geom_bottom = geom_bottom
-        self._temp_wall = temp_wall
-        self._temp_sigma = temp_sigma
-        self._vel_sigma = vel_sigma
-        # TODO, calculate these from the geometry files
-        self._throat_height = 3.61909e-3
-        self._x_throat = 0.283718298
-
-    def __call__(self, dcoll, x_vec, eos, *, time=0.0):
-        """Create the solution state at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        eos:
-            Mixture-compatible equation-of-state object must provide
-            these functions:
-            `eos.get_density`
-            `eos.get_internal_energy`
-        time: float
-            Time at which solution is desired. The location is (optionally)
-            dependent on time
-        """
-        if x_vec.shape != (self._dim,):
-            raise ValueError(f"Position vector has unexpected dimensionality,"
-                             f" expected {self._dim}.")
-
-        xpos = x_vec[0]
-        ypos = x_vec[1]
-        if self._dim == 3:
-            zpos = x_vec[2]
-        ytop = 0*x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        ones = zeros + 1.0
-
-        gamma = eos.gamma()
-        gas_const = eos.gas_const()
-
-        mach = zeros
-        ytop = zeros
-        ybottom = zeros
-        theta = zeros
-
-        theta_geom_top = get_theta_from_data(self._geom_top)
-        theta_geom_bottom = get_theta_from_data(self._geom_bottom)
-
-        # process the mesh piecemeal, one interval at a time
-        # linearly interpolate between the data points
-        area_ratio = ((self._geom_top[0][1] - self._geom_bottom[0][1]) /
-                      self._throat_height)
-        if self._geom_top[0][0] < self._x_throat:
-            mach_left = getMachFromAreaRatio(area_ratio=area_ratio,
-                                             gamma=gamma,
-                                             mach_guess=0.01)
-        elif self._geom_top[0][0] > self._x_throat:
-            mach_left = getMachFromAreaRatio(area_ratio=area_ratio,
-                                             gamma=gamma,
-                                             mach_guess=1.01)
-        else:
-            mach_left = 1.0
-        x_left = self._geom_top[0][0]
-        ytop_left = self._geom_top[0][1]
-        ybottom_left = self._geom_bottom[0][1]
-        theta_top_left = theta_geom_top[0][1]
-        theta_bottom_left = theta_geom_bottom[0][1]
-
-        for ind in range(1, self._geom_top.shape[0]):
-            area_ratio = ((self._geom_top[ind][1] - self._geom_bottom[ind][1]) /
-                          self._throat_height)
-            if self._geom_top[ind][0] < self._x_throat:
-                mach_right = getMachFromAreaRatio(area_ratio=area_ratio,
-                                                 gamma=gamma,
-                                                 mach_guess=0.01)
-            elif self._geom_top[ind][0] > self._x_throat:
-                mach_right = getMachFromAreaRatio(area_ratio=area_ratio,
-                                                 gamma=gamma,
-                                                 mach_guess=1.01)
-            else:
-                mach_right = 1.0
-            ytop_right = self._geom_top[ind][1]
-            ybottom_right = self._geom_bottom[ind][1]
-            theta_top_right = theta_geom_top[ind][1]
-            theta_bottom_right = theta_geom_bottom[ind][1]
-
-            # interpolate our data
-            x_right = self._geom_top[ind][0]
-
-            dx = x_right - x_left
-            dm = mach_right - mach_left
-            dyt = ytop_right - ytop_left
-            dyb = ybottom_right - ybottom_left
-            dtb = theta_bottom_right - theta_bottom_left
-            dtt = theta_top_right - theta_top_left
-
-            local_mach = mach_left + (xpos - x_left)*dm/dx
-            local_ytop = ytop_left + (xpos - x_left)*dyt/dx
-            local_ybottom = ybottom_left + (xpos - x_left)*dyb/dx
-            local_theta_bottom = theta_bottom_left + (xpos - x_left)*dtb/dx
-            local_theta_top = theta_top_left + (xpos - x_left)*dtt/dx
-
-            local_theta = (local_theta_bottom +
-                           (local_theta_top - local_theta_bottom) /
-                           (local_ytop - local_ybottom)*(ypos - local_ybottom))
-
-            # extend just a a little bit to catch the edges
-            left_edge = actx.np.greater(xpos, x_left - 1.e-6)
-            right_edge = actx.np.less(xpos, x_right + 1.e-6)
-            inside_block = left_edge*right_edge
-
-            mach = actx.np.where(inside_block, local_mach, mach)
-            ytop = actx.np.where(inside_block, local_ytop, ytop)
-            ybottom = actx.np.where(inside_block, local_ybottom, ybottom)
-            theta = actx.np.where(inside_block, local_theta, theta)
-
-            mach_left = mach_right
-            ytop_left = ytop_right
-            ybottom_left = ybottom_right
-            theta_bottom_left = theta_bottom_right
-            theta_top_left = theta_top_right
-            x_left = x_right
-
-        pressure = getIsentropicPressure(
-            mach=mach,
-            P0=self._P0,
-            gamma=gamma
-        )
-        temperature = getIsentropicTemperature(
-            mach=mach,
-            T0=self._T0,
-            gamma=gamma
-        )
-
-        # modify the temperature in the near wall region to match the
-        # isothermal boundaries
-        sigma = self._temp_sigma
-        wall_temperature = self._temp_wall
-        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
-        smoothing_fore = ones
-        smoothing_aft = ones
-        z0 = 0.
-        z1 = 0.035
-        if self._dim == 3:
-            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
-            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
-
-        smooth_temperature = (wall_temperature +
-            (temperature - wall_temperature)*smoothing_top*smoothing_bottom *
-                                             smoothing_fore*smoothing_aft)
-
-        # make a little region along the top of the cavity where we don't want
-        # the temperature smoothed
-        xc_left = zeros + 0.65163 + 0.0004
-        xc_right = zeros + 0.72163 - 0.0004
-        yc_top = zeros - 0.006
-        yc_bottom = zeros - 0.01
-
-        left_edge = actx.np.greater(xpos, xc_left)
-        right_edge = actx.np.less(xpos, xc_right)
-        top_edge = actx.np.less(ypos, yc_top)
-        bottom_edge = actx.np.greater(ypos, yc_bottom)
-        inside_block = left_edge*right_edge*top_edge*bottom_edge
-        temperature = actx.np.where(inside_block, temperature, smooth_temperature)
-
-        mass = pressure/temperature/gas_const
-        velocity = np.zeros(self._dim, dtype=object)
-        # the magnitude
-        velocity[0] = mach*actx.np.sqrt(gamma*pressure/mass)
-
-        # modify the velocity in the near-wall region to have a tanh profile
-        # this approximates the BL velocity profile
-        sigma = self._vel_sigma
-        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
-        smoothing_fore = ones
-        smoothing_aft = ones
-        if self._dim == 3:
-            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
-            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
-        velocity[0] = (velocity[0]*smoothing_top*smoothing_bottom *
-                       smoothing_fore*smoothing_aft)
-
-        # split into x and y components
-        velocity[1] = velocity[0]*actx.np.sin(theta)
-        velocity[0] = velocity[0]*actx.np.cos(theta)
-
-        # zero out the velocity in the cavity region, let the flow develop naturally
-        # initially in pressure/temperature equilibrium with the exterior flow
-        zeros = 0*xpos
-        xc_left = zeros + 0.65163 - 0.000001
-        #xc_right = zeros + 0.72163 + 0.000001
-        xc_right = zeros + 0.73
-        yc_top = zeros - 0.0083245
-        yc_bottom = zeros - 0.0283245
-        xc_bottom = zeros + 0.70163
-        wall_theta = np.sqrt(2)/2.
-
-        left_edge = actx.np.greater(xpos, xc_left)
-        right_edge = actx.np.less(xpos, xc_right)
-        top_edge = actx.np.less(ypos, yc_top)
-        inside_cavity = left_edge*right_edge*top_edge
-
-        # smooth the temperature at the cavity walls
-        sigma = self._temp_sigma
-        smoothing_front = actx.np.tanh(sigma*(actx.np.abs(xpos-xc_left)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-yc_bottom)))
-        wall_dist = (wall_theta*(ypos - yc_bottom) -
-                     wall_theta*(xpos - xc_bottom))
-        smoothing_slant = actx.np.tanh(sigma*(actx.np.abs(wall_dist)))
-        cavity_temperature = (wall_temperature +
-            (temperature - wall_temperature) *
-             smoothing_front*smoothing_bottom*smoothing_slant)
-        temperature = actx.np.where(inside_cavity, cavity_temperature, temperature)
-
-        mass = pressure/temperature/gas_const
-
-        # zero of the velocity
-        velocity[0] = actx.np.where(inside_cavity, zeros, velocity[0])
-
-        mom = velocity*mass
-        energy = (pressure/(gamma - 1.0)) + np.dot(mom, mom)/(2.0*mass)
-        return make_conserved(
-            dim=self._dim,
-            mass=mass,
-            momentum=mom,
-            energy=energy
-        )
-
-
-class UniformModified:
-    r"""Solution initializer for a uniform flow with boundary layer smoothing.
-
-    Similar to the Uniform initializer, except the velocity profile is modified
-    so that the velocity goes to zero at y(min, max)
-
-    The smoothing comes from a hyperbolic tangent with weight sigma
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-
-    def __init__(
-            self, *, dim=1, nspecies=0, pressure=1.0, temperature=2.5,
-            velocity=None, mass_fracs=None,
-            temp_wall, temp_sigma, vel_sigma,
-            ymin=0., ymax=1.0
-    ):
-        r"""Initialize uniform flow parameters.
-
-        Parameters
-        ----------
-        dim: int
-            specify the number of dimensions for the flow
-        nspecies: int
-            specify the number of species in the flow
-        temperature: float
-            specifies the temperature
-        pressure: float
-            specifies the pressure
-        velocity: numpy.ndarray
-            specifies the flow velocity
-        temp_wall: float
-            wall temperature
-        temp_sigma: float
-            near-wall temperature relaxation parameter
-        vel_sigma: float
-            near-wall velocity relaxation parameter
-        ymin: flaot
-            minimum y-coordinate for smoothing
-        ymax: float
-            maximum y-coordinate for smoothing
-        """
-        if velocity is not None:
-            numvel = len(velocity)
-            myvel = velocity
-            if numvel > dim:
-                dim = numvel
-            elif numvel < dim:
-                myvel = np.zeros(shape=(dim,))
-                for i in range(numvel):
-                    myvel[i] = velocity[i]
-            self._velocity = myvel
-        else:
-            self._velocity = np.zeros(shape=(dim,))
-
-        if mass_fracs is not None:
-            self._nspecies = len(mass_fracs)
-            self._mass_fracs = mass_fracs
-        else:
-            self._nspecies = nspecies
-            self._mass_fracs = np.zeros(shape=(nspecies,))
-
-        if self._velocity.shape != (dim,):
-            raise ValueError(f"Expected {dim}-dimensional inputs.")
-
-        self._pressure = pressure
-        self._temperature = temperature
-        self._dim = dim
-        self._temp_wall = temp_wall
-        self._temp_sigma = temp_sigma
-        self._vel_sigma = vel_sigma
-        self._ymin = ymin
-        self._ymax = ymax
-
-    def __call__(self, x_vec, *, eos, **kwargs):
-        """
-        Create a uniform flow solution at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Nodal coordinates
-        eos: :class:`mirgecom.eos.IdealSingleGas`
-            Equation of state class with method to supply gas *gamma*.
-        """
-
-        ypos = x_vec[1]
-        actx = ypos.array_context
-        ymax = 0.0*x_vec[1] + self._ymax
-        ymin = 0.0*x_vec[1] + self._ymin
-        ones = (1.0 + x_vec[0]) - x_vec[0]
-
-        pressure = self._pressure * ones
-        temperature = self._temperature * ones
-
-        # modify the temperature in the near wall region to match
-        # the isothermal boundaries
-        sigma = self._temp_sigma
-        wall_temperature = self._temp_wall
-        smoothing_min = actx.np.tanh(sigma*(actx.np.abs(ypos-ymin)))
-        smoothing_max = actx.np.tanh(sigma*(actx.np.abs(ypos-ymax)))
-        temperature = (wall_temperature +
-                       (temperature - wall_temperature)*smoothing_min*smoothing_max)
-
-        velocity = make_obj_array([self._velocity[i] * ones
-                                   for i in range(self._dim)])
-        y = make_obj_array([self._mass_fracs[i] * ones
-                            for i in range(self._nspecies)])
-        if self._nspecies:
-            mass = eos.get_density(pressure, temperature, y)
-        else:
-            mass = pressure/temperature/eos.gas_const()
-        specmass = mass * y
-
-        sigma = self._vel_sigma
-        # modify the velocity profile from uniform
-        smoothing_max = actx.np.tanh(sigma*(actx.np.abs(ypos-ymax)))
-        smoothing_min = actx.np.tanh(sigma*(actx.np.abs(ypos-ymin)))
-        velocity[0] = velocity[0]*smoothing_max*smoothing_min
-
-        mom = mass*velocity
-        if self._nspecies:
-            internal_energy = eos.get_internal_energy(temperature=temperature,
-                                                      species_mass=specmass)
-        else:
-            internal_energy = pressure/(eos.gamma() - 1)
-        kinetic_energy = 0.5 * np.dot(mom, mom)/mass
-        energy = internal_energy + kinetic_energy
-
-        return make_conserved(dim=self._dim, mass=mass, energy=energy,
-                              momentum=mom, species_mass=specmass)
-
-
 @mpi_entry_point
 def main(ctx_factory=cl.create_some_context, restart_filename=None,
-         use_profiling=False, use_logmgr=True, user_input_file=None,
-         use_overintegration=False, actx_class=None, casename=None,
-         lazy=False):
+         target_filename=None, use_profiling=False, use_logmgr=True,
+         user_input_file=None, use_overintegration=False, actx_class=None,
+         casename=None, lazy=False):
 
     if actx_class is None:
         raise RuntimeError("Array context class missing.")
@@ -784,6 +230,11 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     kappa_sc = 0.5
     dim = 2
     mesh_filename = "data/isolator.msh"
+    # cache the mesh partitions in mesh_cache/
+    use_mesh_cache = True
+    # without a target file, relax the sponge towards the restart solution
+    # instead of the initial condition
+    sponge_target_restart = False
 
     # material properties
     mu = 1.0e-5
@@ -860,6 +311,14 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
             mesh_filename = input_data["mesh_filename"]
         except KeyError:
             pass
+        try:
+            use_mesh_cache = bool(input_data["use_mesh_cache"])
+        except KeyError:
+            pass
+        try:
+            sponge_target_restart = bool(input_data["sponge_target_restart"])
+        except KeyError:
+            pass
 
     # param sanity check
     allowed_integrators = ["rk4", "euler", "lsrk54", "lsrk144"]
@@ -899,15 +358,11 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     #   gamma = 1.4
     #   cp = 37.135 J/mol-K,
     #   rho= 1.977 kg/m^3 @298K
-    gamma = 1.4
-    mw_o2 = 15.999*2
-    mw_n2 = 14.0067*2
-    mf_o2 = 0.273
+    gamma, mf_o2, mw = get_actii_gas_properties()
     # visocsity @ 400C, Pa-s
     mu_o2 = 3.76e-5
     mu_n2 = 3.19e-5
     mu_mix = mu_o2*mf_o2 + mu_n2*(1-mu_o2)  # 3.3456e-5
-    mw = mw_o2*mf_o2 + mw_n2*(1.0 - mf_o2)
     r = 8314.59/mw
     cp = r*gamma/(gamma - 1)
     Pr = 0.75
@@ -938,8 +393,7 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     #
     vel_inflow = np.zeros(shape=(dim,))
     vel_outflow = np.zeros(shape=(dim,))
-    total_pres_inflow = 2.745e5
-    total_temp_inflow = 2076.43
+    total_pres_inflow, total_temp_inflow = get_actii_stagnation_conditions()
 
     throat_height = 3.61909e-3
     inlet_height = 54.129e-3
@@ -1036,32 +490,6 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
         ymax=0.011675488
     )
 
-    def _boundary_state_func(dcoll, dd_bdry, gas_model, actx, init_func, **kwargs):
-        bnd_discr = dcoll.discr_from_dd(dd_bdry)
-        nodes = actx.thaw(bnd_discr.nodes())
-        return make_fluid_state(init_func(x_vec=nodes, eos=gas_model.eos,
-                                          **kwargs), gas_model)
-
-    def _inflow_state_func(dcoll, dd_bdry, gas_model, state_minus, **kwargs):
-        return _boundary_state_func(dcoll, dd_bdry, gas_model,
-                                    state_minus.array_context,
-                                    _inflow_init, **kwargs)
-
-    def _outflow_state_func(dcoll, dd_bdry, gas_model, state_minus, **kwargs):
-        return _boundary_state_func(dcoll, dd_bdry, gas_model,
-                                    state_minus.array_context,
-                                    _outflow_init, **kwargs)
-
-    inflow = PrescribedFluidBoundary(boundary_state_func=_inflow_state_func)
-    outflow = PrescribedFluidBoundary(boundary_state_func=_outflow_state_func)
-    wall = IsothermalWallBoundary()
-
-    boundaries = {
-        BoundaryDomainTag("inflow"): inflow,
-        BoundaryDomainTag("outflow"): outflow,
-        BoundaryDomainTag("wall"): wall,
-    }
-
     viz_path = "viz_data/"
     vizname = viz_path + casename
     restart_path = "restart_data/"
@@ -1080,14 +508,27 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
         global_nelements = restart_data["global_nelements"]
         restart_order = int(restart_data["order"])
 
-        assert restart_data["nparts"] == nparts
+        assert restart_data["num_parts"] == nparts
     else:  # generate the grid from scratch
         if rank == 0:
             print(f"Reading mesh from {mesh_filename}")
-        local_mesh, global_nelements = generate_and_distribute_mesh(
-            comm, get_mesh(dim=dim, mesh_filename=mesh_filename))
+        local_mesh, global_nelements = distribute_mesh(
+            comm, dim=dim, mesh_filename=mesh_filename,
+            cache_path="mesh_cache/" if use_mesh_cache else None)
         local_nelements = local_mesh.nelements
 
+    if target_filename:  # read the sponge target from restart data
+        target_filename = f"{target_filename}-{rank:04d}.pkl"
+
+        from mirgecom.restart import read_restart_data
+        target_data = read_restart_data(actx, target_filename)
+        target_order = int(target_data["order"])
+
+        assert target_data["num_parts"] == nparts
+        assert target_data["global_nelements"] == global_nelements
+    elif restart_filename and sponge_target_restart:
+        logger.warning("No target file specied, using restart as target")
+
     if rank == 0:
         logger.info("Making discretization")
 
@@ -1103,6 +544,43 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     if rank == 0:
         logger.info("Done making discretization")
 
+    # the inflow and outflow states are steady, evaluate them once on each
+    # boundary discretization and reuse them in every rhs evaluation
+    from grudge.dof_desc import DISCR_TAG_BASE, as_dofdesc
+    bdry_discr_tags = {DISCR_TAG_BASE}
+    if quadrature_tag is not None:
+        bdry_discr_tags.add(quadrature_tag)
+
+    def get_boundary_states(btag, init_func):
+        bdry_states = {}
+        for discr_tag in bdry_discr_tags:
+            dd_bdry = as_dofdesc(btag).with_discr_tag(discr_tag)
+            nodes = actx.thaw(dcoll.discr_from_dd(dd_bdry).nodes())
+            bdry_states[discr_tag] = force_evaluation(actx, make_fluid_state(
+                init_func(x_vec=nodes, eos=eos), gas_model))
+        return bdry_states
+
+    inflow_states = get_boundary_states(BoundaryDomainTag("inflow"),
+                                        _inflow_init)
+    outflow_states = get_boundary_states(BoundaryDomainTag("outflow"),
+                                         _outflow_init)
+
+    def _inflow_state_func(dcoll, dd_bdry, gas_model, state_minus, **kwargs):
+        return inflow_states[as_dofdesc(dd_bdry).discretization_tag]
+
+    def _outflow_state_func(dcoll, dd_bdry, gas_model, state_minus, **kwargs):
+        return outflow_states[as_dofdesc(dd_bdry).discretization_tag]
+
+    inflow = PrescribedFluidBoundary(boundary_state_func=_inflow_state_func)
+    outflow = PrescribedFluidBoundary(boundary_state_func=_outflow_state_func)
+    wall = IsothermalWallBoundary()
+
+    boundaries = {
+        BoundaryDomainTag("inflow"): inflow,
+        BoundaryDomainTag("outflow"): outflow,
+        BoundaryDomainTag("wall"): wall,
+    }
+
     # initialize the sponge field
     sponge_thickness = 0.09
     sponge_amp = 1.0/current_dt/1000
@@ -1111,8 +589,6 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     sponge_init = InitSponge(x0=sponge_x0, thickness=sponge_thickness,
                              amplitude=sponge_amp)
     sponge_sigma = sponge_init(x_vec=actx.thaw(dcoll.nodes()))
-    ref_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
-                       eos=eos, time=0)
 
     vis_timer = None
 
@@ -1164,6 +640,28 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
         current_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
                                   eos=eos, time=0)
 
+    # the sponge relaxes towards the target, without a target file this is
+    # the initial condition, or the restart with sponge_target_restart
+    if target_filename:
+        if rank == 0:
+            logger.info("Reading target soln.")
+        ref_cv = target_data["cv"]
+        if target_order != order:
+            target_dcoll = create_discretization_collection(
+                actx, local_mesh, order=target_order, mpi_communicator=comm)
+            from meshmode.discretization.connection import make_same_mesh_connection
+            connection = make_same_mesh_connection(
+                actx,
+                dcoll.discr_from_dd("vol"),
+                target_dcoll.discr_from_dd("vol")
+            )
+            ref_cv = connection(target_data["cv"])
+    elif restart_filename and sponge_target_restart:
+        ref_cv = current_cv
+    else:
+        ref_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
+                           eos=eos, time=0)
+
     current_state = make_fluid_state(current_cv, gas_model)
 
     visualizer = make_visualizer(dcoll)
@@ -1470,6 +968,8 @@ if __name__ == "__main__":
         description="MIRGE-Com Isentropic Nozzle Driver")
     parser.add_argument("-r", "--restart_file", type=ascii, dest="restart_file",
                         nargs="?", action="store", help="simulation restart file")
+    parser.add_argument("-t", "--target_file", type=ascii, dest="target_file",
+                        nargs="?", action="store", help="simulation target file")
     parser.add_argument("-i", "--input_file", type=ascii, dest="input_file",
                         nargs="?", action="store", help="simulation config file")
     parser.add_argument("-c", "--casename", type=ascii, dest="casename", nargs="?",
@@ -1505,6 +1005,11 @@ if __name__ == "__main__":
         restart_filename = (args.restart_file).replace("'", "")
         print(f"Restarting from file: {restart_filename}")
 
+    target_filename = None
+    if args.target_file:
+        target_filename = (args.target_file).replace("'", "")
+        print(f"Target file specified: {target_filename}")
+
     input_file = None
     if args.input_file:
         input_file = args.input_file.replace("'", "")
@@ -1513,7 +1018,8 @@ if __name__ == "__main__":
         print("No user input file, using default values")
 
     print(f"Running {sys.argv[0]}\n")
-    main(restart_filename=restart_filename, user_input_file=input_file,
+    main(restart_filename=restart_filename, target_filename=target_filename,
+         user_input_file=input_file,
          use_profiling=args.profile, use_logmgr=args.log,
          use_overintegration=args.overintegration, lazy=lazy,
          actx_class=actx_class, casename=casename)
@@ -0,0 +1,282 @@
+"""mirgecom initialization driver for the Y0 isolator demonstration.
+
+Builds the initial solution of :mod:`isolator` and writes it out as restart
+data, so the run driver can be started with ``-r`` instead of evaluating
+the initialization on every launch. Supports lazy evaluation.
+
+Note: this example requires a *scaled* version of the Y0
+grid. A working grid example is located here:
+github.com:/illinois-ceesd/data@y0scaled
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import logging
+import sys
+import yaml
+import numpy as np
+import pyopencl as cl
+
+from mirgecom.discretization import create_discretization_collection
+from grudge.shortcuts import make_visualizer
+from mirgecom.simutil import (
+    write_visfile,
+    force_evaluation
+)
+from mirgecom.restart import write_restart_file
+from mirgecom.mpi import mpi_entry_point
+from mirgecom.eos import IdealSingleGas
+from mirgecom.gas_model import GasModel, make_fluid_state
+
+from isolator import SingleLevelFilter
+from isolator_mesh import distribute_mesh
+from isolator_initializers import (
+    get_actii_gas_properties,
+    get_actii_stagnation_conditions,
+    InitACTII
+)
+
+
+@mpi_entry_point
+def main(ctx_factory=cl.create_some_context, user_input_file=None,
+         actx_class=None, casename=None, lazy=False):
+
+    if actx_class is None:
+        raise RuntimeError("Array context class missing.")
+
+    # control log messages
+    logger = logging.getLogger(__name__)
+    logger.propagate = False
+
+    if (logger.hasHandlers()):
+        logger.handlers.clear()
+
+    # send info level messages to stdout
+    h1 = logging.StreamHandler(sys.stdout)
+    f1 = SingleLevelFilter(logging.INFO, False)
+    h1.addFilter(f1)
+    logger.addHandler(h1)
+
+    # send everything else to stderr
+    h2 = logging.StreamHandler(sys.stderr)
+    f2 = SingleLevelFilter(logging.INFO, True)
+    h2.addFilter(f2)
+    logger.addHandler(h2)
+
+    cl_ctx = ctx_factory()
+
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+    rank = comm.Get_rank()
+    nparts = comm.Get_size()
+
+    if casename is None:
+        casename = "mirgecom"
+
+    queue = cl.CommandQueue(cl_ctx)
+
+    # main array context for the simulation
+    from mirgecom.simutil import get_reasonable_memory_pool
+    alloc = get_reasonable_memory_pool(cl_ctx, queue)
+
+    if lazy:
+        actx = actx_class(comm, queue, mpi_base_tag=12000, allocator=alloc)
+    else:
+        actx = actx_class(comm, queue, allocator=alloc, force_device_scalars=True)
+
+    # discretization and model control
+    order = 1
+    dim = 2
+    mesh_filename = "data/isolator.msh"
+    # cache the mesh partitions in mesh_cache/
+    use_mesh_cache = True
+
+    if user_input_file:
+        input_data = None
+        if rank == 0:
+            with open(user_input_file) as f:
+                input_data = yaml.load(f, Loader=yaml.FullLoader)
+        input_data = comm.bcast(input_data, root=0)
+        try:
+            order = int(input_data["order"])
+        except KeyError:
+            pass
+        try:
+            dim = int(input_data["dimen"])
+        except KeyError:
+            pass
+        try:
+            mesh_filename = input_data["mesh_filename"]
+        except KeyError:
+            pass
+        try:
+            use_mesh_cache = bool(input_data["use_mesh_cache"])
+        except KeyError:
+            pass
+
+    if rank == 0:
+        print("\n#### Simluation control data: ####")
+        print(f"\torder = {order}")
+        print(f"\tdimen = {dim}")
+        print("#### Simluation control data: ####")
+
+    # }}}
+    # working gas: O2/N2 #
+    #   O2 mass fraction 0.273
+    #   gamma = 1.4
+    #   cp = 37.135 J/mol-K,
+    #   rho= 1.977 kg/m^3 @298K
+    gamma, _, mw = get_actii_gas_properties()
+    r = 8314.59/mw
+
+    eos = IdealSingleGas(gamma=gamma, gas_const=r)
+    gas_model = GasModel(eos=eos)
+
+    # ACTII flow properties
+    total_pres_inflow, total_temp_inflow = get_actii_stagnation_conditions()
+
+    # parameters to adjust the shape of the initialization
+    vel_sigma = 2000
+    temp_sigma = 2500
+    temp_wall = 300
+
+    # read geometry files
+    geometry_bottom = None
+    geometry_top = None
+    if rank == 0:
+        from numpy import loadtxt
+        geometry_bottom = loadtxt("nozzleBottom.dat", comments="#", unpack=False)
+        geometry_top = loadtxt("nozzleTop.dat", comments="#", unpack=False)
+    geometry_bottom = comm.bcast(geometry_bottom, root=0)
+    geometry_top = comm.bcast(geometry_top, root=0)
+
+    bulk_init = InitACTII(dim=dim,
+                          geom_top=geometry_top, geom_bottom=geometry_bottom,
+                          P0=total_pres_inflow, T0=total_temp_inflow,
+                          temp_wall=temp_wall, temp_sigma=temp_sigma,
+                          vel_sigma=vel_sigma)
+
+    viz_path = "viz_data/"
+    vizname = viz_path + casename
+    restart_path = "restart_data/"
+    restart_pattern = (
+        restart_path + "{cname}-{step:06d}-{rank:04d}.pkl"
+    )
+
+    if rank == 0:
+        print(f"Reading mesh from {mesh_filename}")
+    local_mesh, global_nelements = distribute_mesh(
+        comm, dim=dim, mesh_filename=mesh_filename,
+        cache_path="mesh_cache/" if use_mesh_cache else None)
+
+    if rank == 0:
+        logger.info("Making discretization")
+
+    dcoll = create_discretization_collection(
+        actx, local_mesh, order=order, mpi_communicator=comm)
+
+    if rank == 0:
+        logger.info("Done making discretization")
+
+    if rank == 0:
+        logger.info("Initializing solution")
+
+    current_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
+                           eos=eos, time=0)
+    current_state = force_evaluation(actx, make_fluid_state(current_cv, gas_model))
+
+    visualizer = make_visualizer(dcoll)
+
+    def my_write_viz(step, t, cv, dv):
+
+        mach = (actx.np.sqrt(np.dot(cv.velocity, cv.velocity)) /
+                            dv.speed_of_sound)
+        viz_fields = [("cv", cv),
+                      ("dv", dv),
+                      ("mach", mach),
+                      ("rank", rank),
+                      ("velocity", cv.velocity)]
+        write_visfile(dcoll=dcoll, io_fields=viz_fields, visualizer=visualizer,
+                      vizname=vizname, comm=comm, step=step, t=t, overwrite=True)
+
+    def my_write_restart(step, t, cv):
+        restart_fname = restart_pattern.format(cname=casename, step=step, rank=rank)
+        restart_data = {
+            "local_mesh": local_mesh,
+            "cv": cv,
+            "t": t,
+            "step": step,
+            "order": order,
+            "global_nelements": global_nelements,
+            "num_parts": nparts
+        }
+        write_restart_file(actx, restart_data, restart_fname, comm)
+
+    # write visualization and restart data
+    my_write_viz(step=0, t=0, cv=current_state.cv, dv=current_state.dv)
+    my_write_restart(step=0, t=0, cv=current_state.cv)
+
+
+if __name__ == "__main__":
+
+    logging.basicConfig(
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+        level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="MIRGE-Com Isentropic Nozzle Driver")
+    parser.add_argument("-i", "--input_file", type=ascii, dest="input_file",
+                        nargs="?", action="store", help="simulation config file")
+    parser.add_argument("-c", "--casename", type=ascii, dest="casename", nargs="?",
+                        action="store", help="simulation case name")
+    parser.add_argument("--lazy", action="store_true", default=False,
+                        help="enable lazy evaluation [OFF]")
+
+    args = parser.parse_args()
+    lazy = args.lazy
+
+    # for writing output
+    casename = "isolator_init"
+    if args.casename:
+        print(f"Custom casename {args.casename}")
+        casename = args.casename.replace("'", "")
+    else:
+        print(f"Default casename {casename}")
+
+    from grudge.array_context import get_reasonable_array_context_class
+    actx_class = get_reasonable_array_context_class(lazy=lazy, distributed=True)
+
+    input_file = None
+    if args.input_file:
+        input_file = args.input_file.replace("'", "")
+        print(f"Using user input from file: {input_file}")
+    else:
+        print("No user input file, using default values")
+
+    print(f"Running {sys.argv[0]}\n")
+    main(user_input_file=input_file, actx_class=actx_class, casename=casename,
+         lazy=lazy)
+
+# vim: foldmethod=marker
@@ -0,0 +1,1086 @@
+"""Initializers shared by the isolator drivers.
+
+Analytic solution initializers for the ACT-II isolator geometry, the
+boundary inflow/outflow states and the outlet sponge, with the isentropic
+flow relations they are built on. The initializers operate on DOF arrays
+of any array context, including lazy ones.
+
+.. autofunction:: sponge
+.. autoclass:: InitSponge
+.. autofunction:: getIsentropicPressure
+.. autofunction:: getIsentropicTemperature
+.. autofunction:: get_mach_area_table
+.. autofunction:: getMachFromAreaRatio
+.. autofunction:: get_y_from_x
+.. autofunction:: get_theta_from_data
+.. autofunction:: interpolate_from_data
+.. autoclass:: InitACTII
+.. autoclass:: UniformModified
+.. autoclass:: InitACTIIInjection
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import numpy as np
+from pytools.obj_array import make_obj_array
+
+from arraycontext import flatten, unflatten
+
+from mirgecom.fluid import make_conserved
+
+
+def sponge(cv, cv_ref, sigma):
+    return sigma*(cv_ref - cv)
+
+
+class InitSponge:
+    r"""Initialize sponge.
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    """
+
+    def __init__(self, *, x0, thickness, amplitude):
+        r"""Initialize the sponge parameters.
+
+        Parameters
+        ----------
+        x0: float
+            sponge starting x location
+        thickness: float
+            sponge extent
+        amplitude: float
+            sponge strength modifier
+        """
+        self._x0 = x0
+        self._thickness = thickness
+        self._amplitude = amplitude
+
+    def __call__(self, x_vec, *, time=0.0):
+        """Create the sponge intensity at locations *x_vec*.
+
+        Parameters
+        ----------
+        x_vec: numpy.ndarray
+            Coordinates at which solution is desired
+        time: float
+            Time at which solution is desired. The strength is (optionally)
+            dependent on time
+        """
+        xpos = x_vec[0]
+        actx = xpos.array_context
+        zeros = 0*xpos
+        x0 = zeros + self._x0
+
+        return self._amplitude * actx.np.where(
+            actx.np.greater(xpos, x0),
+            (zeros + ((xpos - self._x0)/self._thickness) *
+            ((xpos - self._x0)/self._thickness)),
+            zeros + 0.0
+        )
+
+
+def getIsentropicPressure(mach, P0, gamma):
+    pressure = (1. + (gamma - 1.)*0.5*mach**2)
+    pressure = P0*pressure**(-gamma / (gamma - 1.))
+    return pressure
+
+
+def getIsentropicTemperature(mach, T0, gamma):
+    temperature = (1. + (gamma - 1.)*0.5*mach**2)
+    temperature = T0/temperature
+    return temperature
+
+
+def get_actii_gas_properties():
+    """Return the ratio of specific heats, the O2 mass fraction and the
+    molecular weight of the O2/N2 working gas of the ACTII isolator.
+    """
+    gamma = 1.4
+    mw_o2 = 15.999*2
+    mw_n2 = 14.0067*2
+    mf_o2 = 0.273
+    mw = mw_o2*mf_o2 + mw_n2*(1.0 - mf_o2)
+    return gamma, mf_o2, mw
+
+
+def get_actii_stagnation_conditions():
+    """Return the stagnation pressure and temperature of the ACTII inflow."""
+    total_pres_inflow = 2.745e5
+    total_temp_inflow = 2076.43
+    return total_pres_inflow, total_temp_inflow
+
+
+# isentropic area ratio tables, keyed by gamma
+_mach_area_tables = {}
+
+
+def _get_area_ratio(mach, gamma):
+    """
+    Return the isentropic area ratio A/A* at mach and its derivative
+    """
+    g = gamma
+    base = 2/(g + 1) + (g - 1)/(g + 1)*mach*mach
+    area_ratio = base**((g + 1)/(2*g - 2))/mach
+    return area_ratio, area_ratio*(mach/base - 1/mach)
+
+
+def get_mach_area_table(gamma, npoints=256):
+    """
+    Return the tables (area_ratio, mach) of the subsonic and supersonic
+    branches of the isentropic area ratio, cached per gamma
+
+    Each branch is sampled from Mach 1 outward, so the area ratios
+    increase along both tables.
+    """
+    key = (float(gamma), npoints)
+    if key not in _mach_area_tables:
+        mach_sub = np.geomspace(1.0, 1.0e-4, npoints)
+        mach_sup = np.geomspace(1.0, 100.0, npoints)
+        _mach_area_tables[key] = (
+            (_get_area_ratio(mach_sub, gamma)[0], mach_sub),
+            (_get_area_ratio(mach_sup, gamma)[0], mach_sup))
+    return _mach_area_tables[key]
+
+
+def getMachFromAreaRatio(area_ratio, gamma, mach_guess=0.01):
+    """
+    Return the isentropic Mach number for the area ratio A/A*
+
+    The subsonic branch is used for mach_guess < 1 and the supersonic branch
+    otherwise. area_ratio and gamma may be arrays, broadcast against each
+    other, e.g. to sweep over gamma. The Mach number is interpolated in
+    log space from the table of each gamma, then refined with Newton
+    iterations on all of the entries at once.
+    """
+    area_ratio, gamma = np.broadcast_arrays(np.asarray(area_ratio, dtype=float),
+                                            np.asarray(gamma, dtype=float))
+    shape = area_ratio.shape
+    area_ratio = area_ratio.ravel()
+    gamma = gamma.ravel()
+    supersonic = mach_guess > 1
+
+    # the sonic point, or an area below the throat area
+    mach = np.ones(area_ratio.size)
+    active = area_ratio > 1.0
+    for g in np.unique(gamma[active]):
+        nodes = active & (gamma == g)
+        table_area, table_mach = get_mach_area_table(g)[int(supersonic)]
+        log_area = np.log(area_ratio[nodes])
+        mach[nodes] = np.exp(np.interp(log_area, np.log(table_area),
+                                       np.log(table_mach)))
+        if not supersonic:
+            # past the table A/A* ~ c/M, Newton would leave the branch
+            beyond = area_ratio[nodes] > table_area[-1]
+            mach[nodes] = np.where(
+                beyond, table_area[-1]*table_mach[-1]/area_ratio[nodes],
+                mach[nodes])
+
+    error = 1.0e-8
+    mach_a = mach[active]
+    for _ in range(100):
+        area, darea = _get_area_ratio(mach_a, gamma[active])
+        residual = area - area_ratio[active]
+        mach_a = mach_a - residual/darea
+        if np.all(np.abs(residual) <= error):
+            break
+    else:
+        raise RuntimeError("Area ratio Mach number iteration failed to converge")
+    mach[active] = mach_a
+
+    mach = mach.reshape(shape)
+    return float(mach) if mach.ndim == 0 else mach
+
+
+def get_y_from_x(x, data):
+    """
+    Return the linearly interpolated the value of y
+    from the value in data(x,y) at x
+    """
+
+    if x <= data[0][0]:
+        y = data[0][1]
+    elif x >= data[-1][0]:
+        y = data[-1][1]
+    else:
+        ileft = 0
+        iright = data.shape[0]-1
+
+        # find the bracketing points, simple subdivision search
+        while iright - ileft > 1:
+            ind = int(ileft+(iright - ileft)/2)
+            if x < data[ind][0]:
+                iright = ind
+            else:
+                ileft = ind
+
+        leftx = data[ileft][0]
+        rightx = data[iright][0]
+        lefty = data[ileft][1]
+        righty = data[iright][1]
+
+        dx = rightx - leftx
+        dy = righty - lefty
+        y = lefty + (x - leftx)*dy/dx
+    return y
+
+
+def get_theta_from_data(data):
+    """
+    Calculate theta = arctan(dy/dx)
+    Where data[][0] = x and data[][1] = y
+    """
+
+    theta = data.copy()
+    for index in range(1, theta.shape[0]-1):
+        #print(f"index {index}")
+        theta[index][1] = np.arctan((data[index+1][1]-data[index-1][1]) /
+                          (data[index+1][0]-data[index-1][0]))
+    theta[0][1] = np.arctan(data[1][1]-data[0][1])/(data[1][0]-data[0][0])
+    theta[-1][1] = np.arctan(data[-1][1]-data[-2][1])/(data[-1][0]-data[-2][0])
+    return theta
+
+
+def interpolate_from_data(actx, x, x_data, y_data):
+    """
+    Return the linear interpolants of the rows of y_data(x_data) at x
+
+    Each node finds its segment with a single searchsorted and gathers the
+    values and slopes of all of the rows at once, so the cost is independent
+    of the number of data points. x_data must be increasing, and x is held
+    to its range.
+    """
+
+    x_flat = actx.to_numpy(actx.freeze(flatten(x, actx)))
+    x_flat = np.clip(x_flat, x_data[0], x_data[-1])
+
+    # segment table, one column per segment: left x, left values, slopes
+    slopes = np.diff(y_data, axis=1)/np.diff(x_data)
+    table = np.vstack([x_data[:-1], y_data[:, :-1], slopes])
+
+    segment = np.searchsorted(x_data, x_flat, side="right") - 1
+    segment = np.clip(segment, 0, x_data.size - 2)
+    seg = table[:, segment]
+
+    nrows = y_data.shape[0]
+    y_flat = seg[1:nrows+1] + (x_flat - seg[0])*seg[nrows+1:]
+    return [unflatten(x, actx.from_numpy(np.ascontiguousarray(row)), actx)
+            for row in y_flat]
+
+
+class InitACTII:
+    r"""Solution initializer for flow in the ACT-II facility
+
+    This initializer creates a physics-consistent flow solution
+    given the top and bottom geometry profiles and an EOS using isentropic
+    flow relations.
+
+    The flow is initialized from the inlet stagnations pressure, P0, and
+    stagnation temperature T0.
+
+    geometry locations are linearly interpolated between given data points
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    """
+
+    def __init__(
+            self, *, dim=2, nspecies=0, geom_top, geom_bottom,
+            P0, T0, temp_wall, temp_sigma, vel_sigma
+    ):
+        r"""Initialize mixture parameters.
+
+        Parameters
+        ----------
+        dim: int
+            specifies the number of dimensions for the solution
+        P0: float
+            stagnation pressure
+        T0: float
+            stagnation temperature
+        temp_wall: float
+            wall temperature
+        temp_sigma: float
+            near-wall temperature relaxation parameter
+        vel_sigma: float
+            near-wall velocity relaxation parameter
+        geom_top: numpy.ndarray
+            coordinates for the top wall
+        geom_bottom: numpy.ndarray
+            coordinates for the bottom wall
+        """
+
+        # check number of points in the geometry
+        #top_size = geom_top.size
+        #bottom_size = geom_bottom.size
+
+        self._dim = dim
+        self._P0 = P0
+        self._T0 = T0
+        self._geom_top = geom_top
+        self._geom_bottom = geom_bottom
+        self._temp_wall = temp_wall
+        self._temp_sigma = temp_sigma
+        self._vel_sigma = vel_sigma
+        # TODO, calculate these from the geometry files
+        self._throat_height = 3.61909e-3
+        self._x_throat = 0.283718298
+
+    def _get_mach_from_geometry(self, gamma):
+        """Return the isentropic Mach number at the geometry data points."""
+        area_ratio = ((self._geom_top[:, 1] - self._geom_bottom[:, 1]) /
+                      self._throat_height)
+        x = self._geom_top[:, 0]
+        subsonic = x < self._x_throat
+        supersonic = x > self._x_throat
+
+        mach = np.ones(area_ratio.size)
+        mach[subsonic] = getMachFromAreaRatio(area_ratio=area_ratio[subsonic],
+                                              gamma=gamma, mach_guess=0.01)
+        mach[supersonic] = getMachFromAreaRatio(
+            area_ratio=area_ratio[supersonic], gamma=gamma, mach_guess=1.01)
+        return mach
+
+    def __call__(self, dcoll, x_vec, eos, *, time=0.0):
+        """Create the solution state at locations *x_vec*.
+
+        Parameters
+        ----------
+        x_vec: numpy.ndarray
+            Coordinates at which solution is desired
+        eos:
+            Mixture-compatible equation-of-state object must provide
+            these functions:
+            `eos.get_density`
+            `eos.get_internal_energy`
+        time: float
+            Time at which solution is desired. The location is (optionally)
+            dependent on time
+        """
+        if x_vec.shape != (self._dim,):
+            raise ValueError(f"Position vector has unexpected dimensionality,"
+                             f" expected {self._dim}.")
+
+        xpos = x_vec[0]
+        ypos = x_vec[1]
+        if self._dim == 3:
+            zpos = x_vec[2]
+        ytop = 0*x_vec[0]
+        actx = xpos.array_context
+        zeros = 0*xpos
+        ones = zeros + 1.0
+
+        gamma = eos.gamma()
+        gas_const = eos.gas_const()
+
+        # linearly interpolate the geometry and the isentropic Mach number
+        # between the data points, in a single pass over the nodes
+        geom_data = np.stack([
+            self._get_mach_from_geometry(gamma),
+            self._geom_top[:, 1],
+            self._geom_bottom[:, 1],
+            get_theta_from_data(self._geom_top)[:, 1],
+            get_theta_from_data(self._geom_bottom)[:, 1]])
+        mach, ytop, ybottom, theta_top, theta_bottom = interpolate_from_data(
+            actx, xpos, self._geom_top[:, 0], geom_data)
+        theta = (theta_bottom + (theta_top - theta_bottom) /
+                 (ytop - ybottom)*(ypos - ybottom))
+
+        pressure = getIsentropicPressure(
+            mach=mach,
+            P0=self._P0,
+            gamma=gamma
+        )
+        temperature = getIsentropicTemperature(
+            mach=mach,
+            T0=self._T0,
+            gamma=gamma
+        )
+
+        # modify the temperature in the near wall region to match the
+        # isothermal boundaries
+        sigma = self._temp_sigma
+        wall_temperature = self._temp_wall
+        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
+        smoothing_fore = ones
+        smoothing_aft = ones
+        z0 = 0.
+        z1 = 0.035
+        if self._dim == 3:
+            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
+            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
+
+        smooth_temperature = (wall_temperature +
+            (temperature - wall_temperature)*smoothing_top*smoothing_bottom *
+                                             smoothing_fore*smoothing_aft)
+
+        # make a little region along the top of the cavity where we don't want
+        # the temperature smoothed
+        xc_left = zeros + 0.65163 + 0.0004
+        xc_right = zeros + 0.72163 - 0.0004
+        yc_top = zeros - 0.006
+        yc_bottom = zeros - 0.01
+
+        left_edge = actx.np.greater(xpos, xc_left)
+        right_edge = actx.np.less(xpos, xc_right)
+        top_edge = actx.np.less(ypos, yc_top)
+        bottom_edge = actx.np.greater(ypos, yc_bottom)
+        inside_block = left_edge*right_edge*top_edge*bottom_edge
+        temperature = actx.np.where(inside_block, temperature, smooth_temperature)
+
+        mass = pressure/temperature/gas_const
+        velocity = np.zeros(self._dim, dtype=object)
+        # the magnitude
+        velocity[0] = mach*actx.np.sqrt(gamma*pressure/mass)
+
+        # modify the velocity in the near-wall region to have a tanh profile
+        # this approximates the BL velocity profile
+        sigma = self._vel_sigma
+        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
+        smoothing_fore = ones
+        smoothing_aft = ones
+        if self._dim == 3:
+            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
+            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
+        velocity[0] = (velocity[0]*smoothing_top*smoothing_bottom *
+                       smoothing_fore*smoothing_aft)
+
+        # split into x and y components
+        velocity[1] = velocity[0]*actx.np.sin(theta)
+        velocity[0] = velocity[0]*actx.np.cos(theta)
+
+        # zero out the velocity in the cavity region, let the flow develop naturally
+        # initially in pressure/temperature equilibrium with the exterior flow
+        zeros = 0*xpos
+        xc_left = zeros + 0.65163 - 0.000001
+        #xc_right = zeros + 0.72163 + 0.000001
+        xc_right = zeros + 0.73
+        yc_top = zeros - 0.0083245
+        yc_bottom = zeros - 0.0283245
+        xc_bottom = zeros + 0.70163
+        wall_theta = np.sqrt(2)/2.
+
+        left_edge = actx.np.greater(xpos, xc_left)
+        right_edge = actx.np.less(xpos, xc_right)
+        top_edge = actx.np.less(ypos, yc_top)
+        inside_cavity = left_edge*right_edge*top_edge
+
+        # smooth the temperature at the cavity walls
+        sigma = self._temp_sigma
+        smoothing_front = actx.np.tanh(sigma*(actx.np.abs(xpos-xc_left)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-yc_bottom)))
+        wall_dist = (wall_theta*(ypos - yc_bottom) -
+                     wall_theta*(xpos - xc_bottom))
+        smoothing_slant = actx.np.tanh(sigma*(actx.np.abs(wall_dist)))
+        cavity_temperature = (wall_temperature +
+            (temperature - wall_temperature) *
+             smoothing_front*smoothing_bottom*smoothing_slant)
+        temperature = actx.np.where(inside_cavity, cavity_temperature, temperature)
+
+        mass = pressure/temperature/gas_const
+
+        # zero of the velocity
+        velocity[0] = actx.np.where(inside_cavity, zeros, velocity[0])
+
+        mom = velocity*mass
+        energy = (pressure/(gamma - 1.0)) + np.dot(mom, mom)/(2.0*mass)
+        return make_conserved(
+            dim=self._dim,
+            mass=mass,
+            momentum=mom,
+            energy=energy
+        )
+
+
+class UniformModified:
+    r"""Solution initializer for a uniform flow with boundary layer smoothing.
+
+    Similar to the Uniform initializer, except the velocity profile is modified
+    so that the velocity goes to zero at y(min, max)
+
+    The smoothing comes from a hyperbolic tangent with weight sigma
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    """
+
+    def __init__(
+            self, *, dim=1, nspecies=0, pressure=1.0, temperature=2.5,
+            velocity=None, mass_fracs=None,
+            temp_wall, temp_sigma, vel_sigma,
+            ymin=0., ymax=1.0
+    ):
+        r"""Initialize uniform flow parameters.
+
+        Parameters
+        ----------
+        dim: int
+            specify the number of dimensions for the flow
+        nspecies: int
+            specify the number of species in the flow
+        temperature: float
+            specifies the temperature
+        pressure: float
+            specifies the pressure
+        velocity: numpy.ndarray
+            specifies the flow velocity
+        temp_wall: float
+            wall temperature
+        temp_sigma: float
+            near-wall temperature relaxation parameter
+        vel_sigma: float
+            near-wall velocity relaxation parameter
+        ymin: flaot
+            minimum y-coordinate for smoothing
+        ymax: float
+            maximum y-coordinate for smoothing
+        """
+        if velocity is not None:
+            numvel = len(velocity)
+            myvel = velocity
+            if numvel > dim:
+                dim = numvel
+            elif numvel < dim:
+                myvel = np.zeros(shape=(dim,))
+                for i in range(numvel):
+                    myvel[i] = velocity[i]
+            self._velocity = myvel
+        else:
+            self._velocity = np.zeros(shape=(dim,))
+
+        if mass_fracs is not None:
+            self._nspecies = len(mass_fracs)
+            self._mass_fracs = mass_fracs
+        else:
+            self._nspecies = nspecies
+            self._mass_fracs = np.zeros(shape=(nspecies,))
+
+        if self._velocity.shape != (dim,):
+            raise ValueError(f"Expected {dim}-dimensional inputs.")
+
+        self._pressure = pressure
+        self._temperature = temperature
+        self._dim = dim
+        self._temp_wall = temp_wall
+        self._temp_sigma = temp_sigma
+        self._vel_sigma = vel_sigma
+        self._ymin = ymin
+        self._ymax = ymax
+
+    def __call__(self, x_vec, *, eos, **kwargs):
+        """
+        Create a uniform flow solution at locations *x_vec*.
+
+        Parameters
+        ----------
+        x_vec: numpy.ndarray
+            Nodal coordinates
+        eos: :class:`mirgecom.eos.IdealSingleGas`
+            Equation of state class with method to supply gas *gamma*.
+        """
+
+        ypos = x_vec[1]
+        actx = ypos.array_context
+        ymax = 0.0*x_vec[1] + self._ymax
+        ymin = 0.0*x_vec[1] + self._ymin
+        ones = (1.0 + x_vec[0]) - x_vec[0]
+
+        pressure = self._pressure * ones
+        temperature = self._temperature * ones
+
+        # modify the temperature in the near wall region to match
+        # the isothermal boundaries
+        sigma = self._temp_sigma
+        wall_temperature = self._temp_wall
+        smoothing_min = actx.np.tanh(sigma*(actx.np.abs(ypos-ymin)))
+        smoothing_max = actx.np.tanh(sigma*(actx.np.abs(ypos-ymax)))
+        temperature = (wall_temperature +
+                       (temperature - wall_temperature)*smoothing_min*smoothing_max)
+
+        velocity = make_obj_array([self._velocity[i] * ones
+                                   for i in range(self._dim)])
+        y = make_obj_array([self._mass_fracs[i] * ones
+                            for i in range(self._nspecies)])
+        if self._nspecies:
+            mass = eos.get_density(pressure, temperature, y)
+        else:
+            mass = pressure/temperature/eos.gas_const()
+        specmass = mass * y
+
+        sigma = self._vel_sigma
+        # modify the velocity profile from uniform
+        smoothing_max = actx.np.tanh(sigma*(actx.np.abs(ypos-ymax)))
+        smoothing_min = actx.np.tanh(sigma*(actx.np.abs(ypos-ymin)))
+        velocity[0] = velocity[0]*smoothing_max*smoothing_min
+
+        mom = mass*velocity
+        if self._nspecies:
+            internal_energy = eos.get_internal_energy(temperature=temperature,
+                                                      species_mass=specmass)
+        else:
+            internal_energy = pressure/(eos.gamma() - 1)
+        kinetic_energy = 0.5 * np.dot(mom, mom)/mass
+        energy = internal_energy + kinetic_energy
+
+        return make_conserved(dim=self._dim, mass=mass, energy=energy,
+                              momentum=mom, species_mass=specmass)
+
+
+class InitACTIIInjection(InitACTII):
+    r"""Solution initializer for flow in the ACT-II facility with fuel injection
+
+    Extends :class:`InitACTII` with species mass fractions, initialized
+    through the EOS, and the flow in the cavity fuel injector.
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    """
+
+    def __init__(
+            self, *, dim=2, nspecies=0, geom_top, geom_bottom,
+            P0, T0, temp_wall, temp_sigma, vel_sigma, gamma_guess,
+            mass_frac=None,
+            inj_pres, inj_temp, inj_vel, inj_mass_frac=None,
+            inj_gamma_guess,
+            inj_temp_sigma, inj_vel_sigma,
+            inj_ytop, inj_ybottom,
+            inj_mach
+    ):
+        r"""Initialize mixture parameters.
+
+        Parameters
+        ----------
+        dim: int
+            specifies the number of dimensions for the solution
+        nspecies: int
+            number of species
+        P0: float
+            stagnation pressure
+        T0: float
+            stagnation temperature
+        gamma_guess: float
+            guesstimate for gamma
+        temp_wall: float
+            wall temperature
+        temp_sigma: float
+            near-wall temperature relaxation parameter
+        vel_sigma: float
+            near-wall velocity relaxation parameter
+        geom_top: numpy.ndarray
+            coordinates for the top wall
+        geom_bottom: numpy.ndarray
+            coordinates for the bottom wall
+        mass_frac: numpy.ndarray
+            species mass fractions of the free stream
+        inj_pres: float
+            injector stagnation pressure
+        inj_temp: float
+            injector stagnation temperature
+        inj_vel: numpy.ndarray
+            injector velocity
+        inj_mass_frac: numpy.ndarray
+            species mass fractions of the injected fuel
+        inj_gamma_guess: float
+            guesstimate for gamma of the injected fuel
+        inj_temp_sigma: float
+            near-wall temperature relaxation parameter in the injector
+        inj_vel_sigma: float
+            near-wall velocity relaxation parameter in the injector
+        inj_ytop: float
+            injector top wall location
+        inj_ybottom: float
+            injector bottom wall location
+        inj_mach: float
+            injector Mach number
+        """
+        super().__init__(dim=dim, nspecies=nspecies, geom_top=geom_top,
+                         geom_bottom=geom_bottom, P0=P0, T0=T0,
+                         temp_wall=temp_wall, temp_sigma=temp_sigma,
+                         vel_sigma=vel_sigma)
+
+        if mass_frac is None:
+            if nspecies > 0:
+                mass_frac = np.zeros(shape=(nspecies,))
+
+        if inj_mass_frac is None:
+            if nspecies > 0:
+                inj_mass_frac = np.zeros(shape=(nspecies,))
+
+        if inj_vel is None:
+            inj_vel = np.zeros(shape=(dim,))
+
+        self._nspecies = nspecies
+        self._gamma_guess = gamma_guess
+        self._mass_frac = mass_frac
+
+        self._inj_P0 = inj_pres
+        self._inj_T0 = inj_temp
+        self._inj_vel = inj_vel
+        self._inj_gamma_guess = inj_gamma_guess
+
+        self._temp_sigma_injection = inj_temp_sigma
+        self._vel_sigma_injection = inj_vel_sigma
+        self._inj_mass_frac = inj_mass_frac
+        self._inj_ytop = inj_ytop
+        self._inj_ybottom = inj_ybottom
+        self._inj_mach = inj_mach
+
+    def __call__(self, dcoll, x_vec, eos, *, time=0.0):
+        """Create the solution state at locations *x_vec*.
+
+        Parameters
+        ----------
+        x_vec: numpy.ndarray
+            Coordinates at which solution is desired
+        eos:
+            Mixture-compatible equation-of-state object must provide
+            these functions:
+            `eos.get_density`
+            `eos.get_internal_energy`
+        time: float
+            Time at which solution is desired. The location is (optionally)
+            dependent on time
+        """
+        if x_vec.shape != (self._dim,):
+            raise ValueError(f"Position vector has unexpected dimensionality,"
+                             f" expected {self._dim}.")
+
+        xpos = x_vec[0]
+        ypos = x_vec[1]
+        if self._dim == 3:
+            zpos = x_vec[2]
+        ytop = 0*x_vec[0]
+        actx = xpos.array_context
+        zeros = 0*xpos
+        ones = zeros + 1.0
+
+        gamma = self._gamma_guess
+
+        # linearly interpolate the geometry and the isentropic Mach number
+        # between the data points, in a single pass over the nodes
+        geom_data = np.stack([
+            self._get_mach_from_geometry(gamma),
+            self._geom_top[:, 1],
+            self._geom_bottom[:, 1],
+            get_theta_from_data(self._geom_top)[:, 1],
+            get_theta_from_data(self._geom_bottom)[:, 1]])
+        mach, ytop, ybottom, theta_top, theta_bottom = interpolate_from_data(
+            actx, xpos, self._geom_top[:, 0], geom_data)
+        theta = (theta_bottom + (theta_top - theta_bottom) /
+                 (ytop - ybottom)*(ypos - ybottom))
+
+        pressure = getIsentropicPressure(
+            mach=mach,
+            P0=self._P0,
+            gamma=gamma
+        )
+        temperature = getIsentropicTemperature(
+            mach=mach,
+            T0=self._T0,
+            gamma=gamma
+        )
+
+        # save the unsmoothed temerature, so we can use it with the injector init
+        unsmoothed_temperature = temperature
+
+        # modify the temperature in the near wall region to match the
+        # isothermal boundaries
+        sigma = self._temp_sigma
+        wall_temperature = self._temp_wall
+        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
+
+        smooth_temperature = (wall_temperature +
+            (temperature - wall_temperature)*smoothing_top*smoothing_bottom)
+
+        # make a little region along the top of the cavity where we don't want
+        # the temperature smoothed
+        xc_left = zeros + 0.65163 + 0.0004
+        xc_right = zeros + 0.72163 - 0.0004
+        yc_top = zeros - 0.006
+        yc_bottom = zeros - 0.01
+
+        left_edge = actx.np.greater(xpos, xc_left)
+        right_edge = actx.np.less(xpos, xc_right)
+        top_edge = actx.np.less(ypos, yc_top)
+        bottom_edge = actx.np.greater(ypos, yc_bottom)
+        inside_block = left_edge*right_edge*top_edge*bottom_edge
+        temperature = actx.np.where(inside_block, temperature, smooth_temperature)
+
+        # smooth on fore and aft boundaries if 3D
+        smoothing_fore = ones
+        smoothing_aft = ones
+        z0 = 0.
+        z1 = 0.035
+        if self._dim == 3:
+            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
+            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
+        temperature = (wall_temperature +
+            (temperature - wall_temperature)*smoothing_fore*smoothing_aft)
+
+        y = ones*self._mass_frac
+
+        mass = eos.get_density(pressure=pressure, temperature=temperature,
+                               species_mass_fractions=y)
+        energy = mass*eos.get_internal_energy(temperature=temperature,
+                                              species_mass_fractions=y)
+
+        velocity = ones*np.zeros(self._dim, dtype=object)
+        mom = mass*velocity
+        cv = make_conserved(dim=self._dim, mass=mass, momentum=mom, energy=energy,
+                            species_mass=mass*y)
+        velocity[0] = mach*eos.sound_speed(cv, temperature)
+
+        # modify the velocity in the near-wall region to have a tanh profile
+        # this approximates the BL velocity profile
+        sigma = self._vel_sigma
+        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
+        smoothing_fore = ones
+        smoothing_aft = ones
+        if self._dim == 3:
+            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
+            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
+        velocity[0] = (velocity[0]*smoothing_top*smoothing_bottom *
+                       smoothing_fore*smoothing_aft)
+
+        # split into x and y components
+        velocity[1] = velocity[0]*actx.np.sin(theta)
+        velocity[0] = velocity[0]*actx.np.cos(theta)
+
+        # zero out the velocity in the cavity region, let the flow develop naturally
+        # initially in pressure/temperature equilibrium with the exterior flow
+        zeros = 0*xpos
+        xc_left = zeros + 0.65163 - 0.000001
+        #xc_right = zeros + 0.72163 + 0.000001
+        xc_right = zeros + 0.726 + 0.000001
+        yc_top = zeros - 0.0083245
+        yc_bottom = zeros - 0.0283245
+        xc_bottom = zeros + 0.70163
+        wall_theta = np.sqrt(2)/2.
+
+        left_edge = actx.np.greater(xpos, xc_left)
+        right_edge = actx.np.less(xpos, xc_right)
+        top_edge = actx.np.less(ypos, yc_top)
+        inside_cavity = left_edge*right_edge*top_edge
+
+        # smooth the temperature at the cavity walls
+        sigma = self._temp_sigma
+        smoothing_front = actx.np.tanh(sigma*(actx.np.abs(xpos-xc_left)))
+        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-yc_bottom)))
+        wall_dist = (wall_theta*(ypos - yc_bottom) -
+                     wall_theta*(xpos - xc_bottom))
+        smoothing_slant = actx.np.tanh(sigma*(actx.np.abs(wall_dist)))
+        cavity_temperature = (wall_temperature +
+            (temperature - wall_temperature) *
+             smoothing_front*smoothing_bottom*smoothing_slant)
+        temperature = actx.np.where(inside_cavity, cavity_temperature, temperature)
+
+        # zero out the velocity
+        for i in range(self._dim):
+            velocity[i] = actx.np.where(inside_cavity, zeros, velocity[i])
+
+        # fuel stream initialization
+        # initially in pressure/temperature equilibrium with the cavity
+        #inj_left = 0.71
+        # even with the bottom corner
+        inj_left = 0.70563
+        # even with the top corner
+        #inj_left = 0.7074
+        #inj_left = 0.65
+        inj_right = 0.73
+        inj_top = -0.0226
+        inj_bottom = -0.025
+        inj_fore = 0.035/2. + 1.59e-3
+        inj_aft = 0.035/2. - 1.59e-3
+        xc_left = zeros + inj_left
+        xc_right = zeros + inj_right
+        yc_top = zeros + inj_top
+        yc_bottom = zeros + inj_bottom
+        zc_fore = zeros + inj_fore
+        zc_aft = zeros + inj_aft
+
+        yc_center = zeros - 0.0283245 + 4e-3 + 1.59e-3/2.
+        zc_center = zeros + 0.035/2.
+        inj_radius = 1.59e-3/2.
+
+        if self._dim == 3:
+            radius = actx.np.sqrt((ypos - yc_center)**2 + (zpos - zc_center)**2)
+
+        left_edge = actx.np.greater(xpos, xc_left)
+        right_edge = actx.np.less(xpos, xc_right)
+        bottom_edge = actx.np.greater(ypos, yc_bottom)
+        top_edge = actx.np.less(ypos, yc_top)
+        aft_edge = ones
+        fore_edge = ones
+        if self._dim == 3:
+            aft_edge = actx.np.greater(zpos, zc_aft)
+            fore_edge = actx.np.less(zpos, zc_fore)
+        inside_injector = (left_edge*right_edge*top_edge*bottom_edge *
+                           aft_edge*fore_edge)
+
+        inj_y = ones*self._inj_mass_frac
+
+        inj_velocity = mach*np.zeros(self._dim, dtype=object)
+        inj_velocity[0] = self._inj_vel[0]
+
+        inj_mach = mach*0. + self._inj_mach
+
+        # smooth out the injection profile
+        # relax to the cavity temperature/pressure/velocity
+        inj_x0 = 0.712
+        # the entrace to the injector
+        #inj_fuel_x0 = 0.7085
+        # back inside the injector
+        #inj_fuel_x0 = 0.717
+        # out in the cavity
+        inj_fuel_x0 = 0.712 - 0.002
+        #inj_fuel_y0 = -0.0243245 - 3.e-3
+        #inj_fuel_y1 = -0.0227345 + 3.e-3
+        #inj_fuel_z0 = 0.035/2. - 3.e-3
+        #inj_fuel_z1 = 0.035/2. + 3.e-3
+        inj_sigma = 1500
+        #gamma_guess_inj = gamma
+
+        # seperate the fuel from the flow, allow the fuel to spill out into the
+        # cavity ahead of hte injection flow, see if this helps startup
+        # left extent
+        inj_tanh = inj_sigma*(inj_fuel_x0 - xpos)
+        inj_weight = 0.5*(1.0 - actx.np.tanh(inj_tanh))
+        for i in range(self._nspecies):
+            inj_y[i] = y[i] + (inj_y[i] - y[i])*inj_weight
+
+        # transition the mach number from 0 (cavitiy) to 1 (injection)
+        inj_tanh = inj_sigma*(inj_x0 - xpos)
+        inj_weight = 0.5*(1.0 - actx.np.tanh(inj_tanh))
+        inj_mach = inj_weight*inj_mach
+
+        # assume a smooth transition in gamma, could calculate it
+        inj_gamma = (self._gamma_guess +
+            (self._inj_gamma_guess - self._gamma_guess)*inj_weight)
+
+        inj_pressure = getIsentropicPressure(
+            mach=inj_mach,
+            P0=self._inj_P0,
+            gamma=inj_gamma
+        )
+        inj_temperature = getIsentropicTemperature(
+            mach=inj_mach,
+            T0=self._inj_T0,
+            gamma=inj_gamma
+        )
+
+        inj_mass = eos.get_density(pressure=inj_pressure,
+                                   temperature=inj_temperature,
+                                   species_mass_fractions=inj_y)
+        inj_energy = inj_mass*eos.get_internal_energy(temperature=inj_temperature,
+                                                      species_mass_fractions=inj_y)
+
+        inj_velocity = mach*np.zeros(self._dim, dtype=object)
+        inj_mom = inj_mass*inj_velocity
+
+        # the velocity magnitude
+        inj_cv = make_conserved(dim=self._dim, mass=inj_mass, momentum=inj_mom,
+                                energy=inj_energy, species_mass=inj_mass*inj_y)
+
+        inj_velocity[0] = -inj_mach*eos.sound_speed(inj_cv, inj_temperature)
+
+        # relax the pressure at the cavity/injector interface
+        inj_pressure = pressure + (inj_pressure - pressure)*inj_weight
+        inj_temperature = (unsmoothed_temperature +
+            (inj_temperature - unsmoothed_temperature)*inj_weight)
+
+        # we need to calculate the velocity from a prescribed mass flow rate
+        # this will need to take into account the velocity relaxation at the
+        # injector walls
+        #inj_velocity[0] = velocity[0] + (self._inj_vel[0] - velocity[0])*inj_weight
+
+        # modify the temperature in the near wall region to match the
+        # isothermal boundaries
+        sigma = self._temp_sigma_injection
+        wall_temperature = self._temp_wall
+        if sigma > 0:
+            smoothing_top = actx.np.tanh(
+                sigma*(actx.np.abs(ypos - self._inj_ytop)))
+            smoothing_bottom = actx.np.tanh(
+                sigma*(actx.np.abs(ypos - self._inj_ybottom)))
+
+            if self._dim == 2:
+                inj_temperature = (wall_temperature +
+                    (inj_temperature - wall_temperature) *
+                    smoothing_top*smoothing_bottom)
+            else:
+                smoothing_radius = actx.np.tanh(
+                    sigma*(actx.np.abs(radius - inj_radius)))
+                inj_temperature = (wall_temperature +
+                    (inj_temperature - wall_temperature)*smoothing_radius)
+
+        inj_mass = eos.get_density(pressure=inj_pressure,
+                                   temperature=inj_temperature,
+                                   species_mass_fractions=inj_y)
+        inj_energy = inj_mass*eos.get_internal_energy(temperature=inj_temperature,
+                                                  species_mass_fractions=inj_y)
+
+        # modify the velocity in the near-wall region to have a tanh profile
+        # this approximates the BL velocity profile
+        sigma = self._vel_sigma_injection
+        if sigma > 0:
+            smoothing_top = actx.np.tanh(
+                sigma*(actx.np.abs(ypos - self._inj_ytop)))
+            smoothing_bottom = actx.np.tanh(
+                sigma*(actx.np.abs(ypos - self._inj_ybottom)))
+            if self._dim == 2:
+                inj_velocity[0] = inj_velocity[0]*smoothing_top*smoothing_bottom
+            else:
+                smoothing_radius = actx.np.tanh(
+                    sigma*(actx.np.abs(radius - inj_radius)))
+                inj_velocity[0] = inj_velocity[0]*smoothing_radius
+
+        # use the species field with fuel added everywhere
+        for i in range(self._nspecies):
+            y[i] = actx.np.where(inside_injector, inj_y[i], y[i])
+
+        # recompute the mass and energy (outside the injector) to account for
+        # the change in mass fraction
+        mass = eos.get_density(pressure=pressure,
+                               temperature=temperature,
+                               species_mass_fractions=y)
+        energy = mass*eos.get_internal_energy(temperature=temperature,
+                                              species_mass_fractions=y)
+
+        mass = actx.np.where(inside_injector, inj_mass, mass)
+        velocity[0] = actx.np.where(inside_injector, inj_velocity[0], velocity[0])
+        energy = actx.np.where(inside_injector, inj_energy, energy)
+
+        mom = mass*velocity
+        energy = (energy + np.dot(mom, mom)/(2.0*mass))
+        return make_conserved(
+            dim=self._dim,
+            mass=mass,
+            momentum=mom,
+            energy=energy,
+            species_mass=mass*y
+        )
@@ -84,6 +84,15 @@ from mirgecom.boundary import (
 from mirgecom.eos import IdealSingleGas
 from mirgecom.transport import SimpleTransport
 from mirgecom.gas_model import GasModel, make_fluid_state
+from isolator_initializers import (
+    sponge,
+    InitSponge,
+    getIsentropicPressure,
+    getIsentropicTemperature,
+    getMachFromAreaRatio,
+    get_y_from_x,
+    get_theta_from_data
+)
 
 
 class SingleLevelFilter(logging.Filter):
@@ -134,146 +143,6 @@ def get_mesh(dim, read_mesh=True):
     return mesh
 
 
-def sponge(cv, cv_ref, sigma):
-    return sigma*(cv_ref - cv)
-
-
-class InitSponge:
-    r"""Solution initializer for flow in the ACT-II facility
-
-    This initializer creates a physics-consistent flow solution
-    given the top and bottom geometry profiles and an EOS using isentropic
-    flow relations.
-
-    The flow is initialized from the inlet stagnations pressure, P0, and
-    stagnation temperature T0.
-
-    geometry locations are linearly interpolated between given data points
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-    def __init__(self, *, x0, thickness, amplitude):
-        r"""Initialize the sponge parameters.
-
-        Parameters
-        ----------
-        x0: float
-            sponge starting x location
-        thickness: float
-            sponge extent
-        amplitude: float
-            sponge strength modifier
-        """
-
-        self._x0 = x0
-        self._thickness = thickness
-        self._amplitude = amplitude
-
-    def __call__(self, x_vec, *, time=0.0):
-        """Create the sponge intensity at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        time: float
-            Time at which solution is desired. The strength is (optionally)
-            dependent on time
-        """
-        xpos = x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        x0 = zeros + self._x0
-
-        return self._amplitude * actx.np.where(
-            actx.np.greater(xpos, x0),
-            (zeros + ((xpos - self._x0)/self._thickness) *
-            ((xpos - self._x0)/self._thickness)),
-            zeros + 0.0
-        )
-
-
-def getIsentropicPressure(mach, P0, gamma):
-    pressure = (1. + (gamma - 1.)*0.5*mach**2)
-    pressure = P0*pressure**(-gamma / (gamma - 1.))
-    return pressure
-
-
-def getIsentropicTemperature(mach, T0, gamma):
-    temperature = (1. + (gamma - 1.)*0.5*mach**2)
-    temperature = T0/temperature
-    return temperature
-
-
-def getMachFromAreaRatio(area_ratio, gamma, mach_guess=0.01):
-    error = 1.0e-8
-    nextError = 1.0e8
-    g = gamma
-    M0 = mach_guess
-    while nextError > error:
-        R = (((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))/M0
-            - area_ratio)
-        dRdM = (2*((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               / (2*g - 2)*(g - 1)/(2/(g + 1) + ((g - 1)/(g + 1)*M0*M0)) -
-               ((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               * M0**(-2))
-        M1 = M0 - R/dRdM
-        nextError = abs(R)
-        M0 = M1
-
-    return M1
-
-
-def get_y_from_x(x, data):
-    """
-    Return the linearly interpolated the value of y
-    from the value in data(x,y) at x
-    """
-
-    if x <= data[0][0]:
-        y = data[0][1]
-    elif x >= data[-1][0]:
-        y = data[-1][1]
-    else:
-        ileft = 0
-        iright = data.shape[0]-1
-
-        # find the bracketing points, simple subdivision search
-        while iright - ileft > 1:
-            ind = int(ileft+(iright - ileft)/2)
-            if x < data[ind][0]:
-                iright = ind
-            else:
-                ileft = ind
-
-        leftx = data[ileft][0]
-        rightx = data[iright][0]
-        lefty = data[ileft][1]
-        righty = data[iright][1]
-
-        dx = rightx - leftx
-        dy = righty - lefty
-        y = lefty + (x - leftx)*dy/dx
-    return y
-
-
-def get_theta_from_data(data):
-    """
-    Calculate theta = arctan(dy/dx)
-    Where data[][0] = x and data[][1] = y
-    """
-
-    theta = data.copy()
-    for index in range(1, theta.shape[0]-1):
-        #print(f"index {index}")
-        theta[index][1] = np.arctan((data[index+1][1]-data[index-1][1]) /
-                          (data[index+1][0]-data[index-1][0]))
-    theta[0][1] = np.arctan(data[1][1]-data[0][1])/(data[1][0]-data[0][0])
-    theta[-1][1] = np.arctan(data[-1][1]-data[-2][1])/(data[-1][0]-data[-2][0])
-    return(theta)
-
-
 class InitACTII:
     r"""Solution initializer for flow in the ACT-II facility
 
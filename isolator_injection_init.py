@@ -36,24 +36,33 @@ import pyopencl as cl
 import numpy.linalg as la  # noqa
 import pyopencl.array as cla  # noqa
 import math
-from functools import partial
+import time
+from pytools.obj_array import make_obj_array
+
+from arraycontext import flatten, unflatten, rec_multimap_array_container
+from meshmode.dof_array import DOFArray
 
 from mirgecom.discretization import create_discretization_collection
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 from grudge.shortcuts import make_visualizer
 
 from mirgecom.simutil import (
-    generate_and_distribute_mesh,
     write_visfile,
     force_evaluation
 )
 from mirgecom.restart import write_restart_file
 from mirgecom.mpi import mpi_entry_point
 
-from mirgecom.fluid import make_conserved
 from mirgecom.eos import IdealSingleGas, PyrometheusMixture
 from mirgecom.transport import SimpleTransport
 from mirgecom.gas_model import GasModel, make_fluid_state
+from isolator_mesh import distribute_mesh
+from isolator_initializers import (
+    getIsentropicPressure,
+    getIsentropicTemperature,
+    getMachFromAreaRatio,
+    InitACTIIInjection
+)
 
 
 class SingleLevelFilter(logging.Filter):
@@ -74,659 +83,10 @@ class MyRuntimeError(RuntimeError):
     pass
 
 
-def get_mesh(dim, read_mesh=True):
-    """Get the mesh."""
-    from meshmode.mesh.io import read_gmsh
-    mesh_filename = "data/isolator.msh"
-    mesh = partial(read_gmsh, filename=mesh_filename,
-                   force_ambient_dim=dim)
-
-    return mesh
-
-
-def sponge(cv, cv_ref, sigma):
-    return sigma*(cv_ref - cv)
-
-
-class InitSponge:
-    r"""Solution initializer for flow in the ACT-II facility
-
-    This initializer creates a physics-consistent flow solution
-    given the top and bottom geometry profiles and an EOS using isentropic
-    flow relations.
-
-    The flow is initialized from the inlet stagnations pressure, P0, and
-    stagnation temperature T0.
-
-    geometry locations are linearly interpolated between given data points
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-    def __init__(self, *, x0, thickness, amplitude):
-        r"""Initialize the sponge parameters.
-
-        Parameters
-        ----------
-        x0: float
-            sponge starting x location
-        thickness: float
-            sponge extent
-        amplitude: float
-            sponge strength modifier
-        """
-
-        self._x0 = x0
-        self._thickness = thickness
-        self._amplitude = amplitude
-
-    def __call__(self, x_vec, *, time=0.0):
-        """Create the sponge intensity at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        time: float
-            Time at which solution is desired. The strength is (optionally)
-            dependent on time
-        """
-        xpos = x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        x0 = zeros + self._x0
-
-        return self._amplitude * actx.np.where(
-            actx.np.greater(xpos, x0),
-            (zeros + ((xpos - self._x0)/self._thickness) *
-            ((xpos - self._x0)/self._thickness)),
-            zeros + 0.0
-        )
-
-
-def getIsentropicPressure(mach, P0, gamma):
-    pressure = (1. + (gamma - 1.)*0.5*mach**2)
-    pressure = P0*pressure**(-gamma / (gamma - 1.))
-    return pressure
-
-
-def getIsentropicTemperature(mach, T0, gamma):
-    temperature = (1. + (gamma - 1.)*0.5*mach**2)
-    temperature = T0/temperature
-    return temperature
-
-
-def getMachFromAreaRatio(area_ratio, gamma, mach_guess=0.01):
-    error = 1.0e-8
-    nextError = 1.0e8
-    g = gamma
-    M0 = mach_guess
-    while nextError > error:
-        R = (((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))/M0
-            - area_ratio)
-        dRdM = (2*((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               / (2*g - 2)*(g - 1)/(2/(g + 1) + ((g - 1)/(g + 1)*M0*M0)) -
-               ((2/(g + 1) + ((g - 1)/(g + 1)*M0*M0))**(((g + 1)/(2*g - 2))))
-               * M0**(-2))
-        M1 = M0 - R/dRdM
-        nextError = abs(R)
-        M0 = M1
-
-    return M1
-
-
-def get_y_from_x(x, data):
-    """
-    Return the linearly interpolated the value of y
-    from the value in data(x,y) at x
-    """
-
-    if x <= data[0][0]:
-        y = data[0][1]
-    elif x >= data[-1][0]:
-        y = data[-1][1]
-    else:
-        ileft = 0
-        iright = data.shape[0]-1
-
-        # find the bracketing points, simple subdivision search
-        while iright - ileft > 1:
-            ind = int(ileft+(iright - ileft)/2)
-            if x < data[ind][0]:
-                iright = ind
-            else:
-                ileft = ind
-
-        leftx = data[ileft][0]
-        rightx = data[iright][0]
-        lefty = data[ileft][1]
-        righty = data[iright][1]
-
-        dx = rightx - leftx
-        dy = righty - lefty
-        y = lefty + (x - leftx)*dy/dx
-    return y
-
-
-def get_theta_from_data(data):
-    """
-    Calculate theta = arctan(dy/dx)
-    Where data[][0] = x and data[][1] = y
-    """
-
-    theta = data.copy()
-    for index in range(1, theta.shape[0]-1):
-        #print(f"index {index}")
-        theta[index][1] = np.arctan((data[index+1][1]-data[index-1][1]) /
-                          (data[index+1][0]-data[index-1][0]))
-    theta[0][1] = np.arctan(data[1][1]-data[0][1])/(data[1][0]-data[0][0])
-    theta[-1][1] = np.arctan(data[-1][1]-data[-2][1])/(data[-1][0]-data[-2][0])
-    return theta
-
-
-class InitACTII:
-    r"""Solution initializer for flow in the ACT-II facility
-
-    This initializer creates a physics-consistent flow solution
-    given the top and bottom geometry profiles and an EOS using isentropic
-    flow relations.
-
-    The flow is initialized from the inlet stagnations pressure, P0, and
-    stagnation temperature T0.
-
-    geometry locations are linearly interpolated between given data points
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-
-    def __init__(
-            self, *, dim=2, nspecies=0, geom_top, geom_bottom,
-            P0, T0, temp_wall, temp_sigma, vel_sigma, gamma_guess,
-            mass_frac=None,
-            inj_pres, inj_temp, inj_vel, inj_mass_frac=None,
-            inj_gamma_guess,
-            inj_temp_sigma, inj_vel_sigma,
-            inj_ytop, inj_ybottom,
-            inj_mach
-    ):
-        r"""Initialize mixture parameters.
-
-        Parameters
-        ----------
-        dim: int
-            specifies the number of dimensions for the solution
-        P0: float
-            stagnation pressure
-        T0: float
-            stagnation temperature
-        gamma_guess: float
-            guesstimate for gamma
-        temp_wall: float
-            wall temperature
-        temp_sigma: float
-            near-wall temperature relaxation parameter
-        vel_sigma: float
-            near-wall velocity relaxation parameter
-        geom_top: numpy.ndarray
-            coordinates for the top wall
-        geom_bottom: numpy.ndarray
-            coordinates for the bottom wall
-        """
-
-        # check number of points in the geometry
-        #top_size = geom_top.size
-        #bottom_size = geom_bottom.size
-
-        if mass_frac is None:
-            if nspecies > 0:
-                mass_frac = np.zeros(shape=(nspecies,))
-
-        if inj_mass_frac is None:
-            if nspecies > 0:
-                inj_mass_frac = np.zeros(shape=(nspecies,))
-
-        if inj_vel is None:
-            inj_vel = np.zeros(shape=(dim,))
-
-        self._dim = dim
-        self._nspecies = nspecies
-        self._P0 = P0
-        self._T0 = T0
-        self._geom_top = geom_top
-        self._geom_bottom = geom_bottom
-        self._temp_wall = temp_wall
-        self._temp_sigma = temp_sigma
-        self._vel_sigma = vel_sigma
-        self._gamma_guess = gamma_guess
-        # TODO, calculate these from the geometry files
-        self._throat_height = 3.61909e-3
-        self._x_throat = 0.283718298
-        self._mass_frac = mass_frac
-
-        self._inj_P0 = inj_pres
-        self._inj_T0 = inj_temp
-        self._inj_vel = inj_vel
-        self._inj_gamma_guess = inj_gamma_guess
-
-        self._temp_sigma_injection = inj_temp_sigma
-        self._vel_sigma_injection = inj_vel_sigma
-        self._inj_mass_frac = inj_mass_frac
-        self._inj_ytop = inj_ytop
-        self._inj_ybottom = inj_ybottom
-        self._inj_mach = inj_mach
-
-    def __call__(self, dcoll, x_vec, eos, *, time=0.0):
-        """Create the solution state at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        eos:
-            Mixture-compatible equation-of-state object must provide
-            these functions:
-            `eos.get_density`
-            `eos.get_internal_energy`
-        time: float
-            Time at which solution is desired. The location is (optionally)
-            dependent on time
-        """
-        if x_vec.shape != (self._dim,):
-            raise ValueError(f"Position vector has unexpected dimensionality,"
-                             f" expected {self._dim}.")
-
-        xpos = x_vec[0]
-        ypos = x_vec[1]
-        if self._dim == 3:
-            zpos = x_vec[2]
-        ytop = 0*x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        ones = zeros + 1.0
-
-        mach = zeros
-        ytop = zeros
-        ybottom = zeros
-        theta = zeros
-        gamma = self._gamma_guess
-
-        theta_geom_top = get_theta_from_data(self._geom_top)
-        theta_geom_bottom = get_theta_from_data(self._geom_bottom)
-
-        # process the mesh piecemeal, one interval at a time
-        # linearly interpolate between the data points
-        area_ratio = ((self._geom_top[0][1] - self._geom_bottom[0][1]) /
-                      self._throat_height)
-        if self._geom_top[0][0] < self._x_throat:
-            mach_left = getMachFromAreaRatio(area_ratio=area_ratio,
-                                             gamma=gamma,
-                                             mach_guess=0.01)
-        elif self._geom_top[0][0] > self._x_throat:
-            mach_left = getMachFromAreaRatio(area_ratio=area_ratio,
-                                             gamma=gamma,
-                                             mach_guess=1.01)
-        else:
-            mach_left = 1.0
-        x_left = self._geom_top[0][0]
-        ytop_left = self._geom_top[0][1]
-        ybottom_left = self._geom_bottom[0][1]
-        theta_top_left = theta_geom_top[0][1]
-        theta_bottom_left = theta_geom_bottom[0][1]
-
-        for ind in range(1, self._geom_top.shape[0]):
-            area_ratio = ((self._geom_top[ind][1] - self._geom_bottom[ind][1]) /
-                          self._throat_height)
-            if self._geom_top[ind][0] < self._x_throat:
-                mach_right = getMachFromAreaRatio(area_ratio=area_ratio,
-                                                 gamma=gamma,
-                                                 mach_guess=0.01)
-            elif self._geom_top[ind][0] > self._x_throat:
-                mach_right = getMachFromAreaRatio(area_ratio=area_ratio,
-                                                 gamma=gamma,
-                                                 mach_guess=1.01)
-            else:
-                mach_right = 1.0
-            ytop_right = self._geom_top[ind][1]
-            ybottom_right = self._geom_bottom[ind][1]
-            theta_top_right = theta_geom_top[ind][1]
-            theta_bottom_right = theta_geom_bottom[ind][1]
-
-            # interpolate our data
-            x_right = self._geom_top[ind][0]
-
-            dx = x_right - x_left
-            dm = mach_right - mach_left
-            dyt = ytop_right - ytop_left
-            dyb = ybottom_right - ybottom_left
-            dtb = theta_bottom_right - theta_bottom_left
-            dtt = theta_top_right - theta_top_left
-
-            local_mach = mach_left + (xpos - x_left)*dm/dx
-            local_ytop = ytop_left + (xpos - x_left)*dyt/dx
-            local_ybottom = ybottom_left + (xpos - x_left)*dyb/dx
-            local_theta_bottom = theta_bottom_left + (xpos - x_left)*dtb/dx
-            local_theta_top = theta_top_left + (xpos - x_left)*dtt/dx
-
-            local_theta = (local_theta_bottom +
-                           (local_theta_top - local_theta_bottom) /
-                           (local_ytop - local_ybottom)*(ypos - local_ybottom))
-
-            # extend just a a little bit to catch the edges
-            left_edge = actx.np.greater(xpos, x_left - 1.e-6)
-            right_edge = actx.np.less(xpos, x_right + 1.e-6)
-            inside_block = left_edge*right_edge
-
-            mach = actx.np.where(inside_block, local_mach, mach)
-            ytop = actx.np.where(inside_block, local_ytop, ytop)
-            ybottom = actx.np.where(inside_block, local_ybottom, ybottom)
-            theta = actx.np.where(inside_block, local_theta, theta)
-
-            mach_left = mach_right
-            ytop_left = ytop_right
-            ybottom_left = ybottom_right
-            theta_bottom_left = theta_bottom_right
-            theta_top_left = theta_top_right
-            x_left = x_right
-
-        pressure = getIsentropicPressure(
-            mach=mach,
-            P0=self._P0,
-            gamma=gamma
-        )
-        temperature = getIsentropicTemperature(
-            mach=mach,
-            T0=self._T0,
-            gamma=gamma
-        )
-
-        # save the unsmoothed temerature, so we can use it with the injector init
-        unsmoothed_temperature = temperature
-
-        # modify the temperature in the near wall region to match the
-        # isothermal boundaries
-        sigma = self._temp_sigma
-        wall_temperature = self._temp_wall
-        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
-
-        smooth_temperature = (wall_temperature +
-            (temperature - wall_temperature)*smoothing_top*smoothing_bottom)
-
-        # make a little region along the top of the cavity where we don't want
-        # the temperature smoothed
-        xc_left = zeros + 0.65163 + 0.0004
-        xc_right = zeros + 0.72163 - 0.0004
-        yc_top = zeros - 0.006
-        yc_bottom = zeros - 0.01
-
-        left_edge = actx.np.greater(xpos, xc_left)
-        right_edge = actx.np.less(xpos, xc_right)
-        top_edge = actx.np.less(ypos, yc_top)
-        bottom_edge = actx.np.greater(ypos, yc_bottom)
-        inside_block = left_edge*right_edge*top_edge*bottom_edge
-        temperature = actx.np.where(inside_block, temperature, smooth_temperature)
-
-        # smooth on fore and aft boundaries if 3D
-        smoothing_fore = ones
-        smoothing_aft = ones
-        z0 = 0.
-        z1 = 0.035
-        if self._dim == 3:
-            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
-            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
-        temperature = (wall_temperature +
-            (temperature - wall_temperature)*smoothing_fore*smoothing_aft)
-
-        y = ones*self._mass_frac
-
-        mass = eos.get_density(pressure=pressure, temperature=temperature,
-                               species_mass_fractions=y)
-        energy = mass*eos.get_internal_energy(temperature=temperature,
-                                              species_mass_fractions=y)
-
-        velocity = ones*np.zeros(self._dim, dtype=object)
-        mom = mass*velocity
-        cv = make_conserved(dim=self._dim, mass=mass, momentum=mom, energy=energy,
-                            species_mass=mass*y)
-        velocity[0] = mach*eos.sound_speed(cv, temperature)
-
-        # modify the velocity in the near-wall region to have a tanh profile
-        # this approximates the BL velocity profile
-        sigma = self._vel_sigma
-        smoothing_top = actx.np.tanh(sigma*(actx.np.abs(ypos-ytop)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-ybottom)))
-        smoothing_fore = ones
-        smoothing_aft = ones
-        if self._dim == 3:
-            smoothing_fore = actx.np.tanh(sigma*(actx.np.abs(zpos-z0)))
-            smoothing_aft = actx.np.tanh(sigma*(actx.np.abs(zpos-z1)))
-        velocity[0] = (velocity[0]*smoothing_top*smoothing_bottom *
-                       smoothing_fore*smoothing_aft)
-
-        # split into x and y components
-        velocity[1] = velocity[0]*actx.np.sin(theta)
-        velocity[0] = velocity[0]*actx.np.cos(theta)
-
-        # zero out the velocity in the cavity region, let the flow develop naturally
-        # initially in pressure/temperature equilibrium with the exterior flow
-        zeros = 0*xpos
-        xc_left = zeros + 0.65163 - 0.000001
-        #xc_right = zeros + 0.72163 + 0.000001
-        xc_right = zeros + 0.726 + 0.000001
-        yc_top = zeros - 0.0083245
-        yc_bottom = zeros - 0.0283245
-        xc_bottom = zeros + 0.70163
-        wall_theta = np.sqrt(2)/2.
-
-        left_edge = actx.np.greater(xpos, xc_left)
-        right_edge = actx.np.less(xpos, xc_right)
-        top_edge = actx.np.less(ypos, yc_top)
-        inside_cavity = left_edge*right_edge*top_edge
-
-        # smooth the temperature at the cavity walls
-        sigma = self._temp_sigma
-        smoothing_front = actx.np.tanh(sigma*(actx.np.abs(xpos-xc_left)))
-        smoothing_bottom = actx.np.tanh(sigma*(actx.np.abs(ypos-yc_bottom)))
-        wall_dist = (wall_theta*(ypos - yc_bottom) -
-                     wall_theta*(xpos - xc_bottom))
-        smoothing_slant = actx.np.tanh(sigma*(actx.np.abs(wall_dist)))
-        cavity_temperature = (wall_temperature +
-            (temperature - wall_temperature) *
-             smoothing_front*smoothing_bottom*smoothing_slant)
-        temperature = actx.np.where(inside_cavity, cavity_temperature, temperature)
-
-        # zero out the velocity
-        for i in range(self._dim):
-            velocity[i] = actx.np.where(inside_cavity, zeros, velocity[i])
-
-        # fuel stream initialization
-        # initially in pressure/temperature equilibrium with the cavity
-        #inj_left = 0.71
-        # even with the bottom corner
-        inj_left = 0.70563
-        # even with the top corner
-        #inj_left = 0.7074
-        #inj_left = 0.65
-        inj_right = 0.73
-        inj_top = -0.0226
-        inj_bottom = -0.025
-        inj_fore = 0.035/2. + 1.59e-3
-        inj_aft = 0.035/2. - 1.59e-3
-        xc_left = zeros + inj_left
-        xc_right = zeros + inj_right
-        yc_top = zeros + inj_top
-        yc_bottom = zeros + inj_bottom
-        zc_fore = zeros + inj_fore
-        zc_aft = zeros + inj_aft
-
-        yc_center = zeros - 0.0283245 + 4e-3 + 1.59e-3/2.
-        zc_center = zeros + 0.035/2.
-        inj_radius = 1.59e-3/2.
-
-        if self._dim == 3:
-            radius = actx.np.sqrt((ypos - yc_center)**2 + (zpos - zc_center)**2)
-
-        left_edge = actx.np.greater(xpos, xc_left)
-        right_edge = actx.np.less(xpos, xc_right)
-        bottom_edge = actx.np.greater(ypos, yc_bottom)
-        top_edge = actx.np.less(ypos, yc_top)
-        aft_edge = ones
-        fore_edge = ones
-        if self._dim == 3:
-            aft_edge = actx.np.greater(zpos, zc_aft)
-            fore_edge = actx.np.less(zpos, zc_fore)
-        inside_injector = (left_edge*right_edge*top_edge*bottom_edge *
-                           aft_edge*fore_edge)
-
-        inj_y = ones*self._inj_mass_frac
-
-        inj_velocity = mach*np.zeros(self._dim, dtype=object)
-        inj_velocity[0] = self._inj_vel[0]
-
-        inj_mach = mach*0. + self._inj_mach
-
-        # smooth out the injection profile
-        # relax to the cavity temperature/pressure/velocity
-        inj_x0 = 0.712
-        # the entrace to the injector
-        #inj_fuel_x0 = 0.7085
-        # back inside the injector
-        #inj_fuel_x0 = 0.717
-        # out in the cavity
-        inj_fuel_x0 = 0.712 - 0.002
-        #inj_fuel_y0 = -0.0243245 - 3.e-3
-        #inj_fuel_y1 = -0.0227345 + 3.e-3
-        #inj_fuel_z0 = 0.035/2. - 3.e-3
-        #inj_fuel_z1 = 0.035/2. + 3.e-3
-        inj_sigma = 1500
-        #gamma_guess_inj = gamma
-
-        # seperate the fuel from the flow, allow the fuel to spill out into the
-        # cavity ahead of hte injection flow, see if this helps startup
-        # left extent
-        inj_tanh = inj_sigma*(inj_fuel_x0 - xpos)
-        inj_weight = 0.5*(1.0 - actx.np.tanh(inj_tanh))
-        for i in range(self._nspecies):
-            inj_y[i] = y[i] + (inj_y[i] - y[i])*inj_weight
-
-        # transition the mach number from 0 (cavitiy) to 1 (injection)
-        inj_tanh = inj_sigma*(inj_x0 - xpos)
-        inj_weight = 0.5*(1.0 - actx.np.tanh(inj_tanh))
-        inj_mach = inj_weight*inj_mach
-
-        # assume a smooth transition in gamma, could calculate it
-        inj_gamma = (self._gamma_guess +
-            (self._inj_gamma_guess - self._gamma_guess)*inj_weight)
-
-        inj_pressure = getIsentropicPressure(
-            mach=inj_mach,
-            P0=self._inj_P0,
-            gamma=inj_gamma
-        )
-        inj_temperature = getIsentropicTemperature(
-            mach=inj_mach,
-            T0=self._inj_T0,
-            gamma=inj_gamma
-        )
-
-        inj_mass = eos.get_density(pressure=inj_pressure,
-                                   temperature=inj_temperature,
-                                   species_mass_fractions=inj_y)
-        inj_energy = inj_mass*eos.get_internal_energy(temperature=inj_temperature,
-                                                      species_mass_fractions=inj_y)
-
-        inj_velocity = mach*np.zeros(self._dim, dtype=object)
-        inj_mom = inj_mass*inj_velocity
-
-        # the velocity magnitude
-        inj_cv = make_conserved(dim=self._dim, mass=inj_mass, momentum=inj_mom,
-                                energy=inj_energy, species_mass=inj_mass*inj_y)
-
-        inj_velocity[0] = -inj_mach*eos.sound_speed(inj_cv, inj_temperature)
-
-        # relax the pressure at the cavity/injector interface
-        inj_pressure = pressure + (inj_pressure - pressure)*inj_weight
-        inj_temperature = (unsmoothed_temperature +
-            (inj_temperature - unsmoothed_temperature)*inj_weight)
-
-        # we need to calculate the velocity from a prescribed mass flow rate
-        # this will need to take into account the velocity relaxation at the
-        # injector walls
-        #inj_velocity[0] = velocity[0] + (self._inj_vel[0] - velocity[0])*inj_weight
-
-        # modify the temperature in the near wall region to match the
-        # isothermal boundaries
-        sigma = self._temp_sigma_injection
-        wall_temperature = self._temp_wall
-        if sigma > 0:
-            smoothing_top = actx.np.tanh(
-                sigma*(actx.np.abs(ypos - self._inj_ytop)))
-            smoothing_bottom = actx.np.tanh(
-                sigma*(actx.np.abs(ypos - self._inj_ybottom)))
-
-            if self._dim == 2:
-                inj_temperature = (wall_temperature +
-                    (inj_temperature - wall_temperature) *
-                    smoothing_top*smoothing_bottom)
-            else:
-                smoothing_radius = actx.np.tanh(
-                    sigma*(actx.np.abs(radius - inj_radius)))
-                inj_temperature = (wall_temperature +
-                    (inj_temperature - wall_temperature)*smoothing_radius)
-
-        inj_mass = eos.get_density(pressure=inj_pressure,
-                                   temperature=inj_temperature,
-                                   species_mass_fractions=inj_y)
-        inj_energy = inj_mass*eos.get_internal_energy(temperature=inj_temperature,
-                                                  species_mass_fractions=inj_y)
-
-        # modify the velocity in the near-wall region to have a tanh profile
-        # this approximates the BL velocity profile
-        sigma = self._vel_sigma_injection
-        if sigma > 0:
-            smoothing_top = actx.np.tanh(
-                sigma*(actx.np.abs(ypos - self._inj_ytop)))
-            smoothing_bottom = actx.np.tanh(
-                sigma*(actx.np.abs(ypos - self._inj_ybottom)))
-            if self._dim == 2:
-                inj_velocity[0] = inj_velocity[0]*smoothing_top*smoothing_bottom
-            else:
-                smoothing_radius = actx.np.tanh(
-                    sigma*(actx.np.abs(radius - inj_radius)))
-                inj_velocity[0] = inj_velocity[0]*smoothing_radius
-
-        # use the species field with fuel added everywhere
-        for i in range(self._nspecies):
-            y[i] = actx.np.where(inside_injector, inj_y[i], y[i])
-
-        # recompute the mass and energy (outside the injector) to account for
-        # the change in mass fraction
-        mass = eos.get_density(pressure=pressure,
-                               temperature=temperature,
-                               species_mass_fractions=y)
-        energy = mass*eos.get_internal_energy(temperature=temperature,
-                                              species_mass_fractions=y)
-
-        mass = actx.np.where(inside_injector, inj_mass, mass)
-        velocity[0] = actx.np.where(inside_injector, inj_velocity[0], velocity[0])
-        energy = actx.np.where(inside_injector, inj_energy, energy)
-
-        mom = mass*velocity
-        energy = (energy + np.dot(mom, mom)/(2.0*mass))
-        return make_conserved(
-            dim=self._dim,
-            mass=mass,
-            momentum=mom,
-            energy=energy,
-            species_mass=mass*y
-        )
-
-
 @mpi_entry_point
 def main(ctx_factory=cl.create_some_context, user_input_file=None,
          use_overintegration=False, actx_class=None, casename=None,
-         lazy=False):
+         lazy=False, use_streaming=False, chunk_nelements=10000):
 
     if actx_class is None:
         raise RuntimeError("Array context class missing.")
@@ -777,6 +137,9 @@ def main(ctx_factory=cl.create_some_context, user_input_file=None,
     # discretization and model control
     order = 1
     dim = 2
+    mesh_filename = "data/isolator.msh"
+    # cache the mesh partitions in mesh_cache/
+    use_mesh_cache = True
 
     # material properties
     mu = 1.0e-5
@@ -845,6 +208,14 @@ def main(ctx_factory=cl.create_some_context, user_input_file=None,
             temp_sigma_inj = float(input_data["temp_sigma_inj"])
         except KeyError:
             pass
+        try:
+            mesh_filename = input_data["mesh_filename"]
+        except KeyError:
+            pass
+        try:
+            use_mesh_cache = bool(input_data["use_mesh_cache"])
+        except KeyError:
+            pass
 
     if rank == 0:
         print("\n#### Simluation control data: ####")
@@ -1070,19 +441,21 @@ def main(ctx_factory=cl.create_some_context, user_input_file=None,
 
     inj_ymin = -0.0243245
     inj_ymax = -0.0227345
-    bulk_init = InitACTII(dim=dim,
-                          geom_top=geometry_top, geom_bottom=geometry_bottom,
-                          P0=total_pres_inflow, T0=total_temp_inflow,
-                          temp_wall=temp_wall, temp_sigma=temp_sigma,
-                          vel_sigma=vel_sigma, nspecies=nspecies,
-                          mass_frac=y, gamma_guess=gamma, inj_gamma_guess=gamma_inj,
-                          inj_pres=total_pres_inj,
-                          inj_temp=total_temp_inj,
-                          inj_vel=vel_injection, inj_mass_frac=y_fuel,
-                          inj_temp_sigma=temp_sigma_inj,
-                          inj_vel_sigma=vel_sigma_inj,
-                          inj_ytop=inj_ymax, inj_ybottom=inj_ymin,
-                          inj_mach=mach_inj)
+    bulk_init = InitACTIIInjection(dim=dim,
+                                   geom_top=geometry_top,
+                                   geom_bottom=geometry_bottom,
+                                   P0=total_pres_inflow, T0=total_temp_inflow,
+                                   temp_wall=temp_wall, temp_sigma=temp_sigma,
+                                   vel_sigma=vel_sigma, nspecies=nspecies,
+                                   mass_frac=y, gamma_guess=gamma,
+                                   inj_gamma_guess=gamma_inj,
+                                   inj_pres=total_pres_inj,
+                                   inj_temp=total_temp_inj,
+                                   inj_vel=vel_injection, inj_mass_frac=y_fuel,
+                                   inj_temp_sigma=temp_sigma_inj,
+                                   inj_vel_sigma=vel_sigma_inj,
+                                   inj_ytop=inj_ymax, inj_ybottom=inj_ymin,
+                                   inj_mach=mach_inj)
 
     viz_path = "viz_data/"
     vizname = viz_path + casename
@@ -1091,31 +464,92 @@ def main(ctx_factory=cl.create_some_context, user_input_file=None,
         restart_path + "{cname}-{step:06d}-{rank:04d}.pkl"
     )
 
-    local_mesh, global_nelements = generate_and_distribute_mesh(
-        comm, get_mesh(dim=dim))
+    # wall clock time of each stage of the initialization
+    timings = {}
+
+    def start_timer():
+        comm.Barrier()
+        return time.perf_counter()
+
+    t_start = start_timer()
+    local_mesh, global_nelements, element_ids = distribute_mesh(
+        comm, dim=dim, mesh_filename=mesh_filename,
+        cache_path="mesh_cache/" if use_mesh_cache else None,
+        return_element_ids=True)
     #local_nelements = local_mesh.nelements
+    timings["mesh distribution"] = time.perf_counter() - t_start
 
     if rank == 0:
         logging.info("Making discretization")
 
+    t_start = start_timer()
     dcoll = create_discretization_collection(
         actx, local_mesh, order=order, mpi_communicator=comm)
+    timings["discretization"] = time.perf_counter() - t_start
 
     if rank == 0:
         logging.info("Done making discretization")
 
+    def init_in_chunks():
+        """Initialize the solution over chunks of *chunk_nelements* elements.
+
+        Each chunk is evaluated on the nodes of its elements, flattened into
+        a single group, and copied back to the host, which caps the device
+        memory held by the initializer temporaries. The chunks are assembled
+        on the host and transferred to the device once.
+        """
+        nodes = actx.thaw(dcoll.nodes())
+        nodes_flat = [actx.to_numpy(actx.freeze(flatten(nodes[i], actx)))
+                      for i in range(dim)]
+
+        # contiguous ranges of whole elements in the flattened nodes
+        bounds = []
+        offset = 0
+        for grp in dcoll.discr_from_dd("vol").groups:
+            for ielem in range(0, grp.nelements, chunk_nelements):
+                nchunk = min(chunk_nelements, grp.nelements - ielem)
+                bounds.append((offset + ielem*grp.nunit_dofs,
+                               offset + (ielem + nchunk)*grp.nunit_dofs))
+            offset = offset + grp.ndofs
+
+        chunks = []
+        for start, end in bounds:
+            x_vec = np.empty(dim, dtype=object)
+            for i in range(dim):
+                x_vec[i] = DOFArray(actx, (actx.from_numpy(
+                    nodes_flat[i][start:end].reshape(-1, 1)),))
+            cv = bulk_init(dcoll=dcoll, x_vec=x_vec, eos=eos, time=0)
+            temperature = eos.temperature(
+                cv, temperature_seed=init_temperature + 0.*cv.mass)
+            chunks.append(actx.to_numpy(actx.freeze(
+                make_obj_array([cv, temperature]))))
+
+        def assemble(*ary):
+            flat = np.concatenate([chunk[0].ravel() for chunk in ary])
+            return unflatten(nodes[0], actx.from_numpy(flat), actx)
+
+        cv, temperature = rec_multimap_array_container(assemble, *chunks,
+                                                       leaf_class=DOFArray)
+        return force_evaluation(actx, cv), force_evaluation(actx, temperature)
+
     if rank == 0:
         logging.info("Initializing solution")
 
-    current_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
-                           eos=eos, time=0)
-    smoothness = 0.*current_cv.mass
-    current_state = force_evaluation(actx,
-        make_fluid_state(current_cv, gas_model, init_temperature, smoothness))
-
-    visualizer = make_visualizer(dcoll)
+    t_start = start_timer()
+    if use_streaming:
+        current_cv, temperature_seed = init_in_chunks()
+    else:
+        current_cv = bulk_init(dcoll=dcoll, x_vec=actx.thaw(dcoll.nodes()),
+                               eos=eos, time=0)
+        smoothness = 0.*current_cv.mass
+        current_state = force_evaluation(actx,
+            make_fluid_state(current_cv, gas_model, init_temperature, smoothness))
+        current_cv = current_state.cv
+        temperature_seed = current_state.dv.temperature
+    timings["initialization"] = time.perf_counter() - t_start
 
     def my_write_viz(step, t, cv, dv):
+        visualizer = make_visualizer(dcoll)
 
         mach = (actx.np.sqrt(np.dot(cv.velocity, cv.velocity)) /
                             dv.speed_of_sound)
@@ -1142,14 +576,32 @@ def main(ctx_factory=cl.create_some_context, user_input_file=None,
             "step": step,
             "order": order,
             "global_nelements": global_nelements,
-            "num_parts": nparts
+            "num_parts": nparts,
+            "element_ids": element_ids
         }
         write_restart_file(actx, restart_data, restart_fname, comm)
 
     # write visualization and restart data
-    my_write_viz(step=0, t=0, cv=current_state.cv, dv=current_state.dv)
-    my_write_restart(step=0, t=0, cv=current_state.cv,
-                     temperature_seed=current_state.dv.temperature)
+    if not use_streaming:
+        t_start = start_timer()
+        my_write_viz(step=0, t=0, cv=current_state.cv, dv=current_state.dv)
+        timings["visualization"] = time.perf_counter() - t_start
+
+    t_start = start_timer()
+    my_write_restart(step=0, t=0, cv=current_cv,
+                     temperature_seed=temperature_seed)
+    timings["restart"] = time.perf_counter() - t_start
+
+    # the slowest rank sets the pace
+    from mpi4py import MPI
+    timings = {stage: comm.reduce(timings[stage], op=MPI.MAX, root=0)
+               for stage in timings}
+    if rank == 0:
+        print("\n#### Initialization timings (s): ####")
+        for stage, t_stage in timings.items():
+            print(f"\t{stage} = {t_stage:.4e}")
+        print(f"\ttotal = {sum(timings.values()):.4e}")
+        print("#### Initialization timings (s): ####")
 
 
 if __name__ == "__main__":
@@ -1167,6 +619,11 @@ if __name__ == "__main__":
                         action="store", help="simulation case name")
     parser.add_argument("--lazy", action="store_true", default=False,
                         help="enable lazy evaluation [OFF]")
+    parser.add_argument("--stream", action="store_true", default=False,
+                        help="initialize in element chunks straight to restart,"
+                        " without visualization [OFF]")
+    parser.add_argument("--chunk_nelements", type=int, default=10000,
+                        help="number of elements per chunk with --stream")
 
     args = parser.parse_args()
     lazy = args.lazy
@@ -1191,6 +648,7 @@ if __name__ == "__main__":
 
     print(f"Running {sys.argv[0]}\n")
     main(user_input_file=input_file, actx_class=actx_class, casename=casename,
-         lazy=lazy)
+         lazy=lazy, use_streaming=args.stream,
+         chunk_nelements=args.chunk_nelements)
 
 # vim: foldmethod=marker
@@ -32,13 +32,14 @@ import numpy.linalg as la  # noqa
 import pyopencl.array as cla  # noqa
 from functools import partial
 from pytools.obj_array import make_obj_array
+from arraycontext import flatten, unflatten
 
 from mirgecom.discretization import create_discretization_collection
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 from grudge.shortcuts import make_visualizer
 from grudge.dof_desc import BoundaryDomainTag
 #from grudge.op import nodal_max, nodal_min
-from logpyle import IntervalTimer, set_dt
+from logpyle import IntervalTimer, PushLogQuantity, set_dt
 from mirgecom.logging_quantities import (
     initialize_logmgr,
     logmgr_add_cl_device_info,
@@ -57,7 +58,6 @@ from mirgecom.simutil import (
     get_sim_timestep,
     force_evaluation
 )
-from mirgecom.restart import write_restart_file
 from mirgecom.io import make_init_message
 from mirgecom.mpi import mpi_entry_point
 from mirgecom.integrators import (rk4_step, lsrk54_step, lsrk144_step,
@@ -78,11 +78,22 @@ from mirgecom.transport import (SimpleTransport,
                                 PowerLawTransport,
                                 ArtificialViscosityTransport,
                                 ArtificialViscosityTransportDiv)
-from mirgecom.gas_model import GasModel, make_fluid_state
+from mirgecom.gas_model import GasModel, ViscousFluidState, make_fluid_state
 from mirgecom.fluid import make_conserved
 from mirgecom.limiter import bound_preserving_limiter
 from mirgecom.gas_model import make_operator_fluid_states
 from mirgecom.navierstokes import grad_cv_operator
+from isolator_initializers import InitSponge
+from isolator_mesh import distribute_mesh
+from isolator_restart import (
+    get_restart_filename,
+    get_restart_num_parts,
+    read_restart_file,
+    read_restart_parts,
+    read_repartitioned_restart,
+    interpolate_restart_data,
+    RestartWriter
+)
 #from dataclasses import replace
 
 
@@ -284,59 +295,12 @@ class SparkSource:
                               momentum=momentum, species_mass=species_mass)
 
 
-class InitSponge:
-    r"""Initialize sponge.
-
-    .. automethod:: __init__
-    .. automethod:: __call__
-    """
-
-    def __init__(self, *, x0, thickness, amplitude):
-        r"""Initialize the sponge parameters.
-
-        Parameters
-        ----------
-        x0: float
-            sponge starting x location
-        thickness: float
-            sponge extent
-        amplitude: float
-            sponge strength modifier
-        """
-        self._x0 = x0
-        self._thickness = thickness
-        self._amplitude = amplitude
-
-    def __call__(self, x_vec, *, time=0.0):
-        """Create the sponge intensity at locations *x_vec*.
-
-        Parameters
-        ----------
-        x_vec: numpy.ndarray
-            Coordinates at which solution is desired
-        time: float
-            Time at which solution is desired. The strength is (optionally)
-            dependent on time
-        """
-        xpos = x_vec[0]
-        actx = xpos.array_context
-        zeros = 0*xpos
-        x0 = zeros + self._x0
-
-        return self._amplitude * actx.np.where(
-            actx.np.greater(xpos, x0),
-            (zeros + ((xpos - self._x0)/self._thickness) *
-            ((xpos - self._x0)/self._thickness)),
-            zeros + 0.0
-        )
-
-
 @mpi_entry_point
 def main(ctx_factory=cl.create_some_context,
          restart_filename=None, target_filename=None,
          use_profiling=False, use_logmgr=True, user_input_file=None,
          use_overintegration=False, actx_class=False, casename=None,
-         lazy=False):
+         lazy=False, interpolate_restart=False):
 
     """Drive the isolator case."""
     if actx_class is None:
@@ -409,6 +373,23 @@ def main(ctx_factory=cl.create_some_context,
     nrestart = 5000
     nstatus = 1
     nlimit = 0
+    # restart format
+    #    pickle - pickled restart data, one file per rank and step
+    #    binary - raw DOF arrays, the mesh is written once per run
+    #    shared - binary, one file of all of the ranks per step written
+    #             with MPI-IO
+    restart_format = "pickle"
+    restart_single_precision = False  # binary restart DOF arrays as float32
+    # write the restarts from a background thread, with at most
+    # restart_async_pending restarts waiting to be written
+    restart_async = False
+    restart_async_pending = 2
+    # lossless compression of the binary restart DOF arrays, none or zlib
+    restart_compression = "none"
+    # keep only the last restart_keep_last restarts (0 keeps all of them),
+    # plus those at multiples of restart_keep_interval steps
+    restart_keep_last = 0
+    restart_keep_interval = 0
 
     # default timestepping control
     integrator = "rk4"
@@ -435,6 +416,9 @@ def main(ctx_factory=cl.create_some_context,
     kappa_sc = 0.5
     dim = 2
     inv_num_flux = "rusanov"
+    # mesh for restarts interpolated from another mesh (--interpolate)
+    mesh_filename = "data/isolator.msh"
+    use_mesh_cache = True
 
     # material properties
     mu = 1.0e-5
@@ -443,13 +427,31 @@ def main(ctx_factory=cl.create_some_context,
     nspecies = 0
     pyro_temp_iter = 3  # for pyrometheus, number of newton iterations
     pyro_temp_tol = 1.e-4  # for pyrometheus, toleranace for temperature residual
+    # for pyrometheus, stop the pre-step temperature solve once converged
+    pyro_temp_early_exit = False
     transport_type = 0
+    # the transport properties of the output steps are reused for up to this
+    # many steps, only for the reported cfl and the viz output, the rhs always
+    # evaluates them, ignored with constant_cfl as the timestep needs them
+    output_transport_interval = 1
 
     # rhs control
     use_ignition = 0
     use_sponge = True
     use_combustion = True
 
+    # chemistry activity control, skip chemistry where the mixture is frozen
+    chem_skip_frozen = False
+    chem_active_temp = 500.  # min temperature for chemically active elements
+    chem_active_y = 1.e-5  # min fuel/oxidizer overlap or product mass fraction
+
+    # chemistry time integration
+    #    coupled - chemical source terms in the rhs, integrated with the flow
+    #    split - Strang split, pointwise implicit chemistry between flow steps
+    chemistry_integration = "coupled"
+    chem_split_substeps = 1  # backward Euler substeps per split chemistry stage
+    chem_split_newton_iter = 4  # newton iterations per substep
+
     # artificial viscosity control
     #    0 - none
     #    1 - laplacian diffusion
@@ -485,6 +487,34 @@ def main(ctx_factory=cl.create_some_context,
             nrestart = int(input_data["nrestart"])
         except KeyError:
             pass
+        try:
+            restart_format = input_data["restart_format"]
+        except KeyError:
+            pass
+        try:
+            restart_single_precision = bool(input_data["restart_single_precision"])
+        except KeyError:
+            pass
+        try:
+            restart_async = bool(input_data["restart_async"])
+        except KeyError:
+            pass
+        try:
+            restart_async_pending = int(input_data["restart_async_pending"])
+        except KeyError:
+            pass
+        try:
+            restart_compression = input_data["restart_compression"]
+        except KeyError:
+            pass
+        try:
+            restart_keep_last = int(input_data["restart_keep_last"])
+        except KeyError:
+            pass
+        try:
+            restart_keep_interval = int(input_data["restart_keep_interval"])
+        except KeyError:
+            pass
         try:
             nhealth = int(input_data["nhealth"])
         except KeyError:
@@ -534,6 +564,11 @@ def main(ctx_factory=cl.create_some_context,
             transport_type = int(input_data["transport"])
         except KeyError:
             pass
+        try:
+            output_transport_interval = int(
+                input_data["output_transport_interval"])
+        except KeyError:
+            pass
         try:
             pyro_temp_iter = int(input_data["pyro_temp_iter"])
         except KeyError:
@@ -542,6 +577,10 @@ def main(ctx_factory=cl.create_some_context,
             pyro_temp_tol = float(input_data["pyro_temp_tol"])
         except KeyError:
             pass
+        try:
+            pyro_temp_early_exit = bool(input_data["pyro_temp_early_exit"])
+        except KeyError:
+            pass
         try:
             order = int(input_data["order"])
         except KeyError:
@@ -627,10 +666,42 @@ def main(ctx_factory=cl.create_some_context,
             use_combustion = bool(input_data["use_combustion"])
         except KeyError:
             pass
+        try:
+            chem_skip_frozen = bool(input_data["chem_skip_frozen"])
+        except KeyError:
+            pass
+        try:
+            chem_active_temp = float(input_data["chem_active_temp"])
+        except KeyError:
+            pass
+        try:
+            chem_active_y = float(input_data["chem_active_y"])
+        except KeyError:
+            pass
+        try:
+            chemistry_integration = input_data["chemistry_integration"]
+        except KeyError:
+            pass
+        try:
+            chem_split_substeps = int(input_data["chem_split_substeps"])
+        except KeyError:
+            pass
+        try:
+            chem_split_newton_iter = int(input_data["chem_split_newton_iter"])
+        except KeyError:
+            pass
         try:
             vel_sigma_inj = float(input_data["vel_sigma_inj"])
         except KeyError:
             pass
+        try:
+            mesh_filename = input_data["mesh_filename"]
+        except KeyError:
+            pass
+        try:
+            use_mesh_cache = bool(input_data["use_mesh_cache"])
+        except KeyError:
+            pass
 
     # param sanity check
     allowed_integrators = ["rk4", "euler", "lsrk54", "lsrk144", "compiled_lsrk54"]
@@ -638,6 +709,31 @@ def main(ctx_factory=cl.create_some_context,
         error_message = "Invalid time integrator: {}".format(integrator)
         raise RuntimeError(error_message)
 
+    allowed_restart_formats = ["pickle", "binary", "shared"]
+    if restart_format not in allowed_restart_formats:
+        error_message = "Invalid restart format: {}".format(restart_format)
+        raise RuntimeError(error_message)
+
+    if nspecies > 2 and pyro_temp_iter < 1:
+        error_message = \
+            "pyro_temp_iter must be at least 1, got {}".format(pyro_temp_iter)
+        raise RuntimeError(error_message)
+
+    allowed_restart_compressions = ["none", "zlib"]
+    if restart_compression not in allowed_restart_compressions:
+        error_message = \
+            "Invalid restart compression: {}".format(restart_compression)
+        raise RuntimeError(error_message)
+    if restart_compression != "none" and restart_format == "pickle":
+        error_message = "Restart compression requires a binary restart format"
+        raise RuntimeError(error_message)
+
+    allowed_chemistry_integration = ["coupled", "split"]
+    if chemistry_integration not in allowed_chemistry_integration:
+        error_message = \
+            "Invalid chemistry integration: {}".format(chemistry_integration)
+        raise RuntimeError(error_message)
+
     allowed_inv_num_flux = ["rusanov", "hll"]
     if inv_num_flux not in allowed_inv_num_flux:
         error_message = "Invalid inviscid flux function: {}".format(inv_num_flux)
@@ -681,6 +777,11 @@ def main(ctx_factory=cl.create_some_context,
         print("\n#### Simluation control data: ####")
         print(f"\tnviz = {nviz}")
         print(f"\tnrestart = {nrestart}")
+        print(f"\trestart_format = {restart_format}")
+        print(f"\trestart_async = {restart_async}")
+        print(f"\trestart_compression = {restart_compression}")
+        print(f"\trestart_keep_last = {restart_keep_last}")
+        print(f"\trestart_keep_interval = {restart_keep_interval}")
         print(f"\tnhealth = {nhealth}")
         print(f"\tnstatus = {nstatus}")
         print(f"\tcurrent_dt = {current_dt}")
@@ -765,6 +866,11 @@ def main(ctx_factory=cl.create_some_context,
     if nspecies < 3:
         use_combustion = False
 
+    if not use_combustion:
+        chem_skip_frozen = False
+        chemistry_integration = "coupled"
+    chem_split = chemistry_integration == "split"
+
     if rank == 0:
         print("\n#### Simluation material properties: ####")
         print(f"\tPrandtl Number  = {Pr}")
@@ -775,8 +881,19 @@ def main(ctx_factory=cl.create_some_context,
             print("\tpassive scalars to track air/fuel mixture, ideal gas eos")
         else:
             print("\tfull multi-species initialization with pyrometheus eos")
+            if pyro_temp_early_exit:
+                print(f"\ttemperature solve stops once the residual is below "
+                      f"{pyro_temp_tol}, at most {pyro_temp_iter} iterations")
         if nlimit > 0:
             print(f"\tSpecies mass fractions limited to [0:1] over {nlimit} steps")
+        if chem_split:
+            print("\tChemistry Strang split from the flow, backward Euler with "
+                  f"{chem_split_substeps} substep(s) of {chem_split_newton_iter} "
+                  "newton iterations")
+        if chem_skip_frozen:
+            print("\tChemistry skipped where frozen, active elements have")
+            print(f"\t\tT > {chem_active_temp} and fuel/oxidizer overlap or "
+                  f"products > {chem_active_y}")
 
         transport_alpha = 0.6
         transport_beta = 4.093e-7
@@ -799,7 +916,7 @@ def main(ctx_factory=cl.create_some_context,
             print(f"\tspecies diffusivity = {spec_diff}")
         elif transport_type == 2:
             print("\t Pyrometheus transport model:")
-            print("\t\t temperature/mass fraction dependence")
+            print("\t\t mixture-averaged, temperature/mass fraction dependence")
         else:
             error_message = "Unknown transport_type {}".format(transport_type)
             raise RuntimeError(error_message)
@@ -834,9 +951,19 @@ def main(ctx_factory=cl.create_some_context,
     else:
         from mirgecom.thermochemistry import get_pyrometheus_wrapper_class
         from uiuc import Thermochemistry
-        pyro_mech = get_pyrometheus_wrapper_class(
-            pyro_class=Thermochemistry, temperature_niter=pyro_temp_iter,
-            zero_level=chem_source_tol)(actx.np)
+        pyro_class = Thermochemistry
+
+        pyro_wrapper_class = get_pyrometheus_wrapper_class(
+            pyro_class=pyro_class, temperature_niter=pyro_temp_iter,
+            zero_level=chem_source_tol)
+
+        class PyroFusedThermo(pyro_wrapper_class):
+            """Newton temperature update using the mechanism's fused kernel."""
+
+            get_temperature_update_energy = \
+                Thermochemistry.get_temperature_update_energy
+
+        pyro_mech = PyroFusedThermo(actx.np)
         eos = PyrometheusMixture(pyro_mech, temperature_guess=init_temperature)
         species_names = pyro_mech.species_names
 
@@ -878,7 +1005,13 @@ def main(ctx_factory=cl.create_some_context,
             print(f"\tLewis Number = {transport_lewis}")
         elif transport_type == 2:
             print("\t Pyrometheus transport model:")
-            print("\t\t temperature/mass fraction dependence")
+            print("\t\t mixture-averaged, temperature/mass fraction dependence")
+            print(f"\ttransport_alpha = {transport_alpha}")
+            if output_transport_interval > 1 and not constant_cfl:
+                print("\toutput transport properties refreshed every "
+                      f"{output_transport_interval} steps, not used by the rhs")
+                print("\t\t the reported cfl lags by up to "
+                      f"{output_transport_interval - 1} steps")
         else:
             error_message = "Unknown transport_type {}".format(transport_type)
             raise RuntimeError(error_message)
@@ -894,6 +1027,14 @@ def main(ctx_factory=cl.create_some_context,
             sigma=transport_sigma, n=transport_n,
             species_diffusivity=spec_diffusivity,
             lewis=transport_lewis)
+    if transport_type == 2:
+        if nspecies < 3:
+            error_message = ("Pyrometheus transport (transport_type = 2) "
+                             "requires a pyrometheus mixture, nspecies > 2")
+            raise RuntimeError(error_message)
+        from mixture_transport import MixtureAveragedTransport
+        physical_transport_model = MixtureAveragedTransport(
+            pyro_mech, alpha=transport_alpha)
 
     if use_av == 0 or use_av == 1:
         transport_model = physical_transport_model
@@ -908,41 +1049,107 @@ def main(ctx_factory=cl.create_some_context,
 
     gas_model = GasModel(eos=eos, transport=transport_model)
 
+    # evaluates the fluid state at an already solved temperature, taking the
+    # temperature seed as the temperature
+    gas_model_given_temperature = gas_model
+    # and without the transport properties, for when they are not used
+    gas_model_given_temperature_no_transport = GasModel(eos=eos)
+    if nspecies > 2:
+        given_temperature_mech = get_pyrometheus_wrapper_class(
+            pyro_class=pyro_class, temperature_niter=0,
+            zero_level=chem_source_tol)(actx.np)
+        given_temperature_eos = PyrometheusMixture(
+            given_temperature_mech, temperature_guess=init_temperature)
+        gas_model_given_temperature = GasModel(
+            eos=given_temperature_eos, transport=transport_model)
+        gas_model_given_temperature_no_transport = GasModel(
+            eos=given_temperature_eos)
+
     viz_path = "viz_data/"
     vizname = viz_path + casename
     restart_path = "restart_data/"
-    restart_pattern = (
-        restart_path + "{cname}-{step:06d}-{rank:04d}.pkl"
-    )
-    if restart_filename:  # read the grid from restart data
-        restart_filename = f"{restart_filename}-{rank:04d}.pkl"
-
-        from mirgecom.restart import read_restart_data
-        restart_data = read_restart_data(actx, restart_filename)
+    restart_extension = {"pickle": ".pkl", "binary": ".rst"}
+    if restart_format == "shared":
+        restart_pattern = restart_path + "{cname}-{step:06d}.srst"
+    else:
+        restart_pattern = (
+            restart_path + "{cname}-{step:06d}-{rank:04d}"
+            + restart_extension[restart_format]
+        )
+    if restart_filename and interpolate_restart:  # interpolate to a new grid
+        if rank == 0:
+            print(f"Interpolating the restart onto {mesh_filename}")
+        restart_parts = read_restart_parts(actx, restart_filename)
+        restart_filename = get_restart_filename(restart_filename, rank)
+        restart_data = restart_parts[0]
+        current_step = restart_data["step"]
+        current_t = restart_data["t"]
+        local_mesh, global_nelements, element_ids = distribute_mesh(
+            comm, dim=dim, mesh_filename=mesh_filename,
+            cache_path="mesh_cache/" if use_mesh_cache else None,
+            return_element_ids=True)
+        local_nelements = local_mesh.nelements
+
+        assert restart_data["nspecies"] == nspecies
+    elif restart_filename:  # read the grid from restart data
+        restart_num_parts = get_restart_num_parts(comm, restart_filename)
+        if restart_num_parts != nparts:
+            # written on a different number of ranks, repartition the mesh
+            if rank == 0:
+                print(f"Repartitioning the restart from {restart_num_parts} "
+                      f"to {nparts} ranks using {mesh_filename}")
+            local_mesh, global_nelements, element_ids = distribute_mesh(
+                comm, dim=dim, mesh_filename=mesh_filename,
+                cache_path="mesh_cache/" if use_mesh_cache else None,
+                return_element_ids=True)
+            restart_data = read_repartitioned_restart(
+                actx, comm, restart_filename, restart_num_parts, local_mesh,
+                element_ids)
+            # don't overwrite the parts of the original restart at this step
+            restart_filename = restart_pattern.format(
+                cname=casename, step=restart_data["step"], rank=rank)
+        else:
+            restart_filename = get_restart_filename(restart_filename, rank)
+            restart_data = read_restart_file(actx, restart_filename, rank)
+            local_mesh = restart_data["local_mesh"]
+            # global element ids, if known
+            element_ids = restart_data.get("element_ids")
+            global_nelements = restart_data["global_nelements"]
         current_step = restart_data["step"]
         current_t = restart_data["t"]
-        local_mesh = restart_data["local_mesh"]
         local_nelements = local_mesh.nelements
-        global_nelements = restart_data["global_nelements"]
         restart_order = int(restart_data["order"])
         # will use this later
         #restart_nspecies = int(restart_data["nspecies"])
 
-        assert restart_data["num_parts"] == nparts
+        assert restart_data["global_nelements"] == global_nelements
         assert restart_data["nspecies"] == nspecies
     else:
         error_message = "Driver only supports restart. Start with -r <filename>"
         raise RuntimeError(error_message)
 
-    if target_filename:  # read the grid from restart data
-        target_filename = f"{target_filename}-{rank:04d}.pkl"
-
-        from mirgecom.restart import read_restart_data
-        target_data = read_restart_data(actx, target_filename)
+    if target_filename and interpolate_restart:
+        target_parts = read_restart_parts(actx, target_filename)
+        target_filename = get_restart_filename(target_filename, rank)
+
+        assert target_parts[0]["nspecies"] == nspecies
+    elif target_filename:  # read the grid from restart data
+        target_num_parts = get_restart_num_parts(comm, target_filename)
+        # follow the partition of the restart
+        if target_num_parts != nparts or restart_num_parts != nparts:
+            if element_ids is None:
+                error_message = ("Repartitioning the target requires the global "
+                                 "element ids of the restart, use --interpolate")
+                raise RuntimeError(error_message)
+            target_data = read_repartitioned_restart(
+                actx, comm, target_filename, target_num_parts, local_mesh,
+                element_ids)
+        else:
+            target_filename = get_restart_filename(target_filename, rank)
+            target_data = read_restart_file(actx, target_filename, rank)
         target_order = int(target_data["order"])
         # will use this later
 
-        assert restart_data["num_parts"] == nparts
         assert restart_data["nspecies"] == nspecies
         assert restart_data["global_nelements"] == target_data["global_nelements"]
     else:
@@ -964,6 +1171,7 @@ def main(ctx_factory=cl.create_some_context,
         logging.info("Done making discretization")
 
     vis_timer = None
+    log_chem_active = None
 
     if logmgr:
         logmgr_add_cl_device_info(logmgr, queue)
@@ -994,6 +1202,13 @@ def main(ctx_factory=cl.create_some_context,
         vis_timer = IntervalTimer("t_vis", "Time spent visualizing")
         logmgr.add_quantity(vis_timer)
 
+        if chem_skip_frozen:
+            log_chem_active = PushLogQuantity(
+                "chem_active_elements", "1", "Chemically active elements")
+            logmgr.add_quantity(log_chem_active)
+            logmgr.add_watches([
+                ("chem_active_elements.max", "chem active elements: {value:g}")])
+
     if rank == 0:
         logging.info("Before restart/init")
 
@@ -1012,6 +1227,39 @@ def main(ctx_factory=cl.create_some_context,
 
     get_temperature_update_compiled = actx.compile(get_temperature_update)
 
+    def get_fluid_state_given_temperature(cv, temperature, smoothness=None):
+        return make_fluid_state(cv=cv, gas_model=gas_model_given_temperature,
+                                temperature_seed=temperature,
+                                smoothness=smoothness)
+
+    create_fluid_state_given_temperature = \
+        actx.compile(get_fluid_state_given_temperature)
+
+    def get_fluid_state_given_temperature_no_transport(cv, temperature,
+                                                       smoothness=None):
+        return make_fluid_state(
+            cv=cv, gas_model=gas_model_given_temperature_no_transport,
+            temperature_seed=temperature, smoothness=smoothness)
+
+    create_fluid_state_given_temperature_no_transport = \
+        actx.compile(get_fluid_state_given_temperature_no_transport)
+
+    def get_temperature_solve(cv, temperature_seed):
+        y = cv.species_mass_fractions
+        e = gas_model.eos.internal_energy(cv)/cv.mass
+        return make_obj_array(pyro_mech.get_temperature_and_residual(
+            e, temperature_seed, y, num_iter=pyro_temp_iter))
+
+    get_temperature_solve_compiled = actx.compile(get_temperature_solve)
+
+    def get_temperature_residual(cv, temperature):
+        y = cv.species_mass_fractions
+        e = gas_model.eos.internal_energy(cv)/cv.mass
+        return make_obj_array(pyro_mech.get_temperature_and_residual(
+            e, temperature, y, num_iter=0))
+
+    get_temperature_residual_compiled = actx.compile(get_temperature_residual)
+
     from grudge.dt_utils import characteristic_lengthscales
     length_scales = characteristic_lengthscales(actx, dcoll)
 
@@ -1066,9 +1314,13 @@ def main(ctx_factory=cl.create_some_context,
     if restart_filename:
         if rank == 0:
             logging.info("Restarting soln.")
-        restart_cv = restart_data["cv"]
-        temperature_seed = restart_data["temperature_seed"]
-        if restart_order != order:
+        if interpolate_restart:
+            restart_cv, temperature_seed = interpolate_restart_data(
+                actx, dcoll, restart_parts)
+        else:
+            restart_cv = restart_data["cv"]
+            temperature_seed = restart_data["temperature_seed"]
+        if not interpolate_restart and restart_order != order:
             restart_dcoll = create_discretization_collection(
                 actx, local_mesh, order=restart_order)
             from meshmode.discretization.connection import make_same_mesh_connection
@@ -1089,8 +1341,11 @@ def main(ctx_factory=cl.create_some_context,
     if target_filename:
         if rank == 0:
             logging.info("Reading target soln.")
-        target_cv = target_data["cv"]
-        if target_order != order:
+        if interpolate_restart:
+            target_cv, _ = interpolate_restart_data(actx, dcoll, target_parts)
+        else:
+            target_cv = target_data["cv"]
+        if not interpolate_restart and target_order != order:
             target_dcoll = create_discretization_collection(
                 actx, local_mesh, order=target_order)
             from meshmode.discretization.connection import make_same_mesh_connection
@@ -1255,7 +1510,55 @@ def main(ctx_factory=cl.create_some_context,
         return global_reduce(
             check_range_local(dcoll, "vol", array, min_val, max_val), op="lor")
 
-    def my_write_status(cv, dv, dt, cfl):
+    def solve_fluid_state(cv, temperature_seed, smoothness, transport_vars=None,
+                          with_transport=True):
+        """Return the fluid state, the temperature residual and the
+        temperature seed for the next solve.
+
+        For pyrometheus mixtures the temperature is solved here with
+        *pyro_temp_iter* Newton iterations, or fewer with
+        *pyro_temp_early_exit*, stopping once the global maximum residual is
+        below *pyro_temp_tol*. The residual is the relative size of the Newton
+        update evaluated at the solved temperature, and the seed has that
+        update applied. For other equations of state, the residual is *None*
+        and the seed is the temperature.
+
+        For pyrometheus mixtures, the given *transport_vars* are used instead
+        of evaluating the transport properties, and the state has no
+        transport properties at all if *with_transport* is *False*.
+        """
+        if nspecies < 3:
+            fluid_state = create_fluid_state(cv=cv,
+                                             temperature_seed=temperature_seed,
+                                             smoothness=smoothness)
+            return fluid_state, None, fluid_state.temperature
+
+        if pyro_temp_early_exit:
+            # each residual evaluation gives the update of the next iteration
+            temperature, temp_resid, next_temperature_seed = \
+                get_temperature_residual_compiled(cv, temperature_seed)
+            for _ in range(pyro_temp_iter):
+                if vol_max(temp_resid) < pyro_temp_tol:
+                    break
+                temperature, temp_resid, next_temperature_seed = \
+                    get_temperature_residual_compiled(cv, next_temperature_seed)
+        else:
+            temperature, temp_resid, next_temperature_seed = \
+                get_temperature_solve_compiled(cv, temperature_seed)
+
+        if not with_transport or transport_vars is not None:
+            fluid_state = create_fluid_state_given_temperature_no_transport(
+                cv=cv, temperature=temperature, smoothness=smoothness)
+            if with_transport:
+                fluid_state = ViscousFluidState(cv=fluid_state.cv,
+                                                dv=fluid_state.dv,
+                                                tv=transport_vars)
+        else:
+            fluid_state = create_fluid_state_given_temperature(
+                cv=cv, temperature=temperature, smoothness=smoothness)
+        return fluid_state, temp_resid, next_temperature_seed
+
+    def my_write_status(cv, dv, dt, cfl, temp_resid=None):
         status_msg = f"-------- dt = {dt:1.3e}, cfl = {cfl:1.4f}"
         p_min = vol_min(dv.pressure)
         p_max = vol_max(dv.pressure)
@@ -1277,8 +1580,9 @@ def main(ctx_factory=cl.create_some_context,
             # check the temperature convergence
             # a single call to get_temperature_update is like taking an additional
             # Newton iteration and gives us a residual
-            temp_resid = get_temperature_update_compiled(
-                cv, dv.temperature)/dv.temperature
+            if temp_resid is None:
+                temp_resid = get_temperature_update_compiled(
+                    cv, dv.temperature)/dv.temperature
             temp_err_min = vol_min(temp_resid)
             temp_err_max = vol_max(temp_resid)
             dv_status_msg += (
@@ -1300,6 +1604,104 @@ def main(ctx_factory=cl.create_some_context,
 
     compute_production_rates = actx.compile(get_production_rates)
 
+    def get_chemistry_activity(cv, temperature):
+        """Return 1 on chemically active elements and 0 on frozen ones.
+
+        A node is active if it is hotter than *chem_active_temp* and either
+        fuel and oxidizer or combustion products are present above
+        *chem_active_y*. An element is active if any of its nodes are.
+        """
+        y = cv.species_mass_fractions
+        y_fuel = (y[pyro_mech.species_index("C2H4")]
+                  + y[pyro_mech.species_index("H2")]
+                  + y[pyro_mech.species_index("CO")])
+        y_ox = y[pyro_mech.species_index("O2")]
+        y_prod = (y[pyro_mech.species_index("CO2")]
+                  + y[pyro_mech.species_index("H2O")])
+        reactants = actx.np.maximum(actx.np.minimum(y_fuel, y_ox), y_prod)
+
+        zeros = 0.*temperature
+        ones = zeros + 1.
+        active = actx.np.where(
+            actx.np.greater(temperature, chem_active_temp),
+            actx.np.where(actx.np.greater(reactants, chem_active_y), ones, zeros),
+            zeros)
+
+        from grudge.op import elementwise_max
+        return elementwise_max(dcoll, active)
+
+    get_chemistry_activity_compiled = actx.compile(get_chemistry_activity)
+
+    def get_chemistry_indices(activity):
+        """Return the index arrays that compact the nodes of the chemically
+        active elements in *activity*, or *None* if there are none, and the
+        local number of active elements.
+
+        The index arrays, for :func:`gather_nodes` and :func:`scatter_nodes`,
+        hold the active nodes, padded to a power of two with the first node
+        so that few compacted sizes get compiled, the position of each node
+        in the compacted array, and a mask of the active nodes. Compiling is
+        collective in lazy distributed runs, so there all of the ranks pad to
+        the size of the rank with the most active nodes.
+        """
+        activity = actx.to_numpy(activity)
+        local_active = sum(np.count_nonzero(grp_activity[:, 0])
+                           for grp_activity in activity)
+        node_activity = np.concatenate([grp_activity.reshape(-1)
+                                        for grp_activity in activity])
+        active_nodes = np.flatnonzero(node_activity)
+
+        nactive_nodes = active_nodes.size
+        if lazy:
+            nactive_nodes = global_reduce(nactive_nodes, op="max")
+        if nactive_nodes == 0:
+            return None, local_active
+
+        # at least 1024 nodes, smaller sizes are not worth compiling
+        ngather = 2**int(np.ceil(np.log2(max(nactive_nodes, 1024))))
+        gather_indices = np.zeros(ngather, dtype=np.int64)
+        gather_indices[:active_nodes.size] = active_nodes
+        scatter_indices = np.zeros(node_activity.size, dtype=np.int64)
+        scatter_indices[active_nodes] = np.arange(active_nodes.size)
+        scatter_mask = np.where(node_activity > 0, 1., 0.)
+
+        return make_obj_array([actx.from_numpy(gather_indices),
+                               actx.from_numpy(scatter_indices),
+                               actx.from_numpy(scatter_mask)]), local_active
+
+    def gather_nodes(field, gather_indices):
+        """Return the nodal values of the DOF array *field* at
+        *gather_indices*, as a compacted array.
+        """
+        return flatten(field, actx)[gather_indices]
+
+    def scatter_nodes(template, values, scatter_indices, scatter_mask):
+        """Return the compacted *values* as a DOF array like *template*,
+        zero on the nodes outside of *scatter_mask*.
+        """
+        return unflatten(template, values[scatter_indices]*scatter_mask, actx)
+
+    def chemistry_split_stage(state, dt):
+        """Advance the chemistry pointwise by *dt* at constant density and
+        internal energy, for the Strang split chemistry integration.
+        """
+        from implicit_chemistry import implicit_chemistry_step
+
+        cv, tseed = state
+        temperature = eos.temperature(cv, temperature_seed=tseed)
+        y, temperature = implicit_chemistry_step(
+            pyro_mech, cv.mass, temperature, cv.species_mass_fractions, dt,
+            num_substeps=chem_split_substeps, newton_iter=chem_split_newton_iter)
+        cv = make_conserved(dim=dim, mass=cv.mass, energy=cv.energy,
+                            momentum=cv.momentum, species_mass=cv.mass*y)
+        return make_obj_array([cv, temperature])
+
+    chemistry_split_stage_compiled = actx.compile(chemistry_split_stage)
+
+    # with chem_skip_frozen, the index arrays of the chemically active nodes
+    # of this step (see get_chemistry_indices), None if there are none
+    chemistry_indices = None
+
     def my_write_viz(step, t, fluid_state, ts_field, alpha_field, cv_limited):
 
         cv = fluid_state.cv
@@ -1395,6 +1797,14 @@ def main(ctx_factory=cl.create_some_context,
         write_visfile(dcoll=dcoll, io_fields=viz_fields, visualizer=visualizer,
                       vizname=vizname, comm=comm, step=step, t=t, overwrite=True)
 
+    restart_writer = RestartWriter(
+        actx, comm, restart_format=restart_format,
+        dtype=np.float32 if restart_single_precision else np.float64,
+        compression=None if restart_compression == "none" else restart_compression,
+        keep_last=restart_keep_last, keep_interval=restart_keep_interval,
+        asynchronous=restart_async, max_pending=restart_async_pending,
+        logger=logger)
+
     def my_write_restart(step, t, cv, temperature_seed):
         restart_fname = restart_pattern.format(cname=casename, step=step, rank=rank)
         if restart_fname != restart_filename:
@@ -1407,11 +1817,12 @@ def main(ctx_factory=cl.create_some_context,
                 "step": step,
                 "order": order,
                 "global_nelements": global_nelements,
-                "num_parts": nparts
+                "num_parts": nparts,
+                "element_ids": element_ids
             }
-            write_restart_file(actx, restart_data, restart_fname, comm)
+            restart_writer.write(restart_data, restart_fname)
 
-    def my_health_check(fluid_state):
+    def my_health_check(fluid_state, temp_resid=None):
         health_error = False
         cv = fluid_state.cv
         dv = fluid_state.dv
@@ -1449,8 +1860,9 @@ def main(ctx_factory=cl.create_some_context,
             # check the temperature convergence
             # a single call to get_temperature_update is like taking an additional
             # Newton iteration and gives us a residual
-            temp_resid = get_temperature_update_compiled(
-                cv, dv.temperature)/dv.temperature
+            if temp_resid is None:
+                temp_resid = get_temperature_update_compiled(
+                    cv, dv.temperature)/dv.temperature
             temp_err = vol_max(temp_resid)
             if temp_err > pyro_temp_tol:
                 health_error = True
@@ -1541,7 +1953,7 @@ def main(ctx_factory=cl.create_some_context,
 
     sc_scale = get_sc_scale_compiled()
 
-    def limit_species_source(cv, pressure, temperature, species_enthalpies):
+    def limited_mass_fractions(cv):
         spec_lim = make_obj_array([
             bound_preserving_limiter(dcoll, cv.species_mass_fractions[i],
                                      mmin=0.0, mmax=1.0, modify_average=True)
@@ -1553,7 +1965,10 @@ def main(ctx_factory=cl.create_some_context,
         aux = cv.mass*0.0
         for i in range(nspecies):
             aux = aux + spec_lim[i]
-        spec_lim = spec_lim/aux
+        return spec_lim/aux
+
+    def limit_species_source(cv, pressure, temperature, species_enthalpies):
+        spec_lim = limited_mass_fractions(cv)
 
         kin_energy = 0.5*np.dot(cv.velocity, cv.velocity)
 
@@ -1586,7 +2001,91 @@ def main(ctx_factory=cl.create_some_context,
 
     limit_species_source_compiled = actx.compile(limit_species_source)
 
+    def get_compacted_chemistry_state(cv, tseed, gather_indices):
+        """Return the density, temperature and mass fractions the rhs uses
+        for the chemistry, at the nodes *gather_indices*.
+        """
+        def gather(field):
+            return gather_nodes(field, gather_indices)
+
+        rho = gather(cv.mass)
+        y = make_obj_array([gather(y_i) for y_i in cv.species_mass_fractions])
+        temperature = pyro_mech.get_temperature(
+            gather(eos.internal_energy(cv)/cv.mass), gather(tseed), y)
+        if limit_species:
+            # the limited state has the same pressure and temperature
+            y_lim = make_obj_array([gather(y_i)
+                                    for y_i in limited_mass_fractions(cv)])
+            rho = (rho*pyro_mech.get_specific_gas_constant(y)
+                   / pyro_mech.get_specific_gas_constant(y_lim))
+            y = y_lim
+        return rho, temperature, y
+
+    def get_compacted_chemistry_rhs(state, indices):
+        """Return the chemistry part of the rhs, evaluated on the compacted
+        chemically active nodes given by *indices* and zero elsewhere.
+        """
+        cv, tseed = state
+        gather_indices, scatter_indices, scatter_mask = indices
+
+        rho, temperature, y = get_compacted_chemistry_state(
+            cv, tseed, gather_indices)
+        omega = pyro_mech.get_net_production_rates(rho, temperature, y)
+        species_source = make_obj_array([
+            scatter_nodes(cv.mass, pyro_mech.wts[i]*omega[i], scatter_indices,
+                          scatter_mask)
+            for i in range(nspecies)])
+
+        chem_rhs = make_conserved(dim=dim, mass=0*cv.mass, energy=0*cv.energy,
+                                  momentum=0*cv.momentum,
+                                  species_mass=species_source)
+        return make_obj_array([chem_rhs, 0*tseed])
+
+    get_compacted_chemistry_rhs_compiled = actx.compile(
+        get_compacted_chemistry_rhs)
+
+    def chemistry_split_stage_compacted(state, dt, indices):
+        """Do :func:`chemistry_split_stage` on the compacted chemically
+        active nodes given by *indices* only, the other nodes are unchanged.
+        """
+        from implicit_chemistry import implicit_chemistry_step
+
+        cv, tseed = state
+        gather_indices, scatter_indices, scatter_mask = indices
+
+        def gather(field):
+            return gather_nodes(field, gather_indices)
+
+        def update(field, values):
+            return (field*(1. - unflatten(field, scatter_mask, actx))
+                    + scatter_nodes(field, values, scatter_indices, scatter_mask))
+
+        rho = gather(cv.mass)
+        y = make_obj_array([gather(y_i) for y_i in cv.species_mass_fractions])
+        temperature = pyro_mech.get_temperature(
+            gather(eos.internal_energy(cv)/cv.mass), gather(tseed), y)
+        y, temperature = implicit_chemistry_step(
+            pyro_mech, rho, temperature, y, dt,
+            num_substeps=chem_split_substeps, newton_iter=chem_split_newton_iter)
+
+        species_mass_fractions = make_obj_array([
+            update(y_i, y[i])
+            for i, y_i in enumerate(cv.species_mass_fractions)])
+        cv = make_conserved(dim=dim, mass=cv.mass, energy=cv.energy,
+                            momentum=cv.momentum,
+                            species_mass=cv.mass*species_mass_fractions)
+        return make_obj_array([cv, update(tseed, temperature)])
+
+    chemistry_split_stage_compacted_compiled = actx.compile(
+        chemistry_split_stage_compacted)
+
+    # pre-step transport properties and the step they were computed at
+    cached_transport_vars = None
+    transport_refresh_step = 0
+
     def my_pre_step(step, t, dt, state):
+        nonlocal chemistry_indices
+        nonlocal cached_transport_vars, transport_refresh_step
 
         cv, tseed = state
         try:
@@ -1598,11 +2097,38 @@ def main(ctx_factory=cl.create_some_context,
             do_health = check_step(step=step, interval=nhealth)
             do_status = check_step(step=step, interval=nstatus)
 
+            # the transport properties are only used for output, and reused
+            # from the last refresh within output_transport_interval steps,
+            # the health check does not use them, and with constant_cfl they
+            # set the timestep so they are always evaluated for the current cv
+            do_output = any([do_viz, do_restart, do_health, do_status])
+            transport_vars = None
+            if (not do_viz and not constant_cfl
+                    and cached_transport_vars is not None
+                    and step - transport_refresh_step < output_transport_interval):
+                transport_vars = cached_transport_vars
+
             # do this all the time so we can update tseed
-            fluid_state = create_fluid_state(cv=cv,
-                                             temperature_seed=tseed,
-                                             smoothness=no_smoothness)
-            state = make_obj_array([cv, fluid_state.temperature])
+            fluid_state, temp_resid, next_tseed = solve_fluid_state(
+                cv=cv, temperature_seed=tseed, smoothness=no_smoothness,
+                transport_vars=transport_vars, with_transport=do_output)
+            temperature = fluid_state.temperature
+            if do_output and transport_vars is None and nspecies > 2:
+                cached_transport_vars = fluid_state.tv
+                transport_refresh_step = step
+            state = make_obj_array([cv, next_tseed])
+
+            if chem_skip_frozen:
+                activity = get_chemistry_activity_compiled(
+                    cv, fluid_state.temperature)
+                chemistry_indices, local_active = get_chemistry_indices(activity)
+                global_active = global_reduce(local_active, op="sum")
+                if log_chem_active is not None:
+                    log_chem_active.push_value(global_active)
+
+                if do_status and rank == 0:
+                    logger.info(f"-------- chemically active elements = "
+                                f"{global_active}/{global_nelements}")
 
             if any([do_viz, do_restart, do_health, do_status]):
 
@@ -1615,21 +2141,19 @@ def main(ctx_factory=cl.create_some_context,
                         temperature=fluid_state.temperature,
                         species_enthalpies=fluid_state.species_enthalpies)
 
-                if use_av == 0 or use_av == 1:
-                    fluid_state = create_fluid_state(cv=cv,
-                                                     smoothness=no_smoothness,
-                                                     temperature_seed=tseed)
-                elif use_av == 2:
+                # the temperature of the unlimited cv is already solved for
+                if use_av == 2:
                     smoothness = smoothness_indicator_compiled(cv_limited)
                     # unlimited cv here as that is what gets written
-                    fluid_state = create_fluid_state(cv=cv,
-                                                     smoothness=smoothness,
-                                                     temperature_seed=tseed)
+                    fluid_state = create_fluid_state_given_temperature(
+                        cv=cv, smoothness=smoothness, temperature=temperature)
                 elif use_av == 3:
                     # limited cv here to compute smoothness
                     fluid_state = create_fluid_state(cv=cv_limited,
                                                      smoothness=no_smoothness,
                                                      temperature_seed=tseed)
+                    # the residual is recomputed for the limited state
+                    temp_resid = None
 
                     # recompute the dv to have the correct smoothness
                     if do_viz:
@@ -1643,9 +2167,8 @@ def main(ctx_factory=cl.create_some_context,
                                                                  grad_cv=grad_cv)
 
                         # unlimited cv here as that is what gets written
-                        fluid_state = create_fluid_state(cv=cv,
-                                                         smoothness=smoothness,
-                                                         temperature_seed=tseed)
+                        fluid_state = create_fluid_state_given_temperature(
+                            cv=cv, smoothness=smoothness, temperature=temperature)
                         """
                         # avoid recomputation of temperature
                         force_evaluation(actx, smoothness)
@@ -1665,14 +2188,15 @@ def main(ctx_factory=cl.create_some_context,
                 ts_field, cfl, dt = my_get_timestep(t, dt, fluid_state, alpha_field)
 
             if do_health:
-                health_errors = global_reduce(my_health_check(fluid_state), op="lor")
+                health_errors = global_reduce(
+                    my_health_check(fluid_state, temp_resid=temp_resid), op="lor")
                 if health_errors:
                     if rank == 0:
                         logger.warning("Fluid solution failed health check.")
                     raise MyRuntimeError("Failed simulation health check.")
 
             if do_status:
-                my_write_status(dt=dt, cfl=cfl, dv=dv, cv=cv)
+                my_write_status(dt=dt, cfl=cfl, dv=dv, cv=cv, temp_resid=temp_resid)
 
             if do_restart:
                 my_write_restart(step=step, t=t, cv=cv, temperature_seed=tseed)
@@ -1688,6 +2212,7 @@ def main(ctx_factory=cl.create_some_context,
             my_write_viz(step=step, t=t, fluid_state=fluid_state, ts_field=ts_field,
                          alpha_field=alpha_field, cv_limited=cv_limited)
             my_write_restart(step=step, t=t, cv=cv, temperature_seed=tseed)
+            restart_writer.flush()
             raise
 
         return state, dt
@@ -1699,7 +2224,7 @@ def main(ctx_factory=cl.create_some_context,
 
         return state, dt
 
-    def my_rhs(t, state):
+    def my_rhs(t, state, use_chemistry=use_combustion and not chem_split):
         cv, tseed = state
 
         limit_species_rhs = 0*cv
@@ -1781,7 +2306,7 @@ def main(ctx_factory=cl.create_some_context,
                 grad_cv=grad_fluid_cv)
 
         chem_rhs = 0*cv
-        if use_combustion:  # conditionals evaluated only once at compile time
+        if use_chemistry:  # conditionals evaluated only once at compile time
             chem_rhs =  \
                 eos.get_species_source_terms(cv, temperature=fluid_state.temperature)
 
@@ -1808,6 +2333,47 @@ def main(ctx_factory=cl.create_some_context,
                   limit_species_rhs)
         return make_obj_array([cv_rhs, tseed_rhs])
 
+    if chem_skip_frozen and not chem_split:
+        def my_rhs_frozen(t, state):
+            return my_rhs(t, state, use_chemistry=False)
+
+        my_rhs_frozen_compiled = actx.compile(my_rhs_frozen)
+        flow_timestepper = timestepper
+
+        def _chemistry_gated_rhs(t, state):
+            # the flow rhs is the same on all ranks, the chemistry is only
+            # evaluated on the active nodes
+            rhs = my_rhs_frozen_compiled(t, state)
+            if chemistry_indices is not None:
+                rhs = rhs + get_compacted_chemistry_rhs_compiled(
+                    state, chemistry_indices)
+            return rhs
+
+        def _chemistry_gated_stepper(state, t, dt, rhs):
+            return flow_timestepper(state=state, t=t, dt=dt,
+                                    rhs=_chemistry_gated_rhs)
+
+        timestepper = _chemistry_gated_stepper
+
+    if chem_split:
+        flow_timestepper = timestepper
+
+        def _chemistry_half_step(state, dt):
+            if not chem_skip_frozen:
+                return chemistry_split_stage_compiled(state, dt)
+            if chemistry_indices is None:
+                return state
+            return chemistry_split_stage_compacted_compiled(
+                state, dt, chemistry_indices)
+
+        def _strang_split_stepper(state, t, dt, rhs):
+            # chemistry half steps around the full flow step
+            state = _chemistry_half_step(state, dt/2)
+            state = flow_timestepper(state=state, t=t, dt=dt, rhs=rhs)
+            return _chemistry_half_step(state, dt/2)
+
+        timestepper = _strang_split_stepper
+
     current_dt = get_sim_timestep(dcoll, current_state, current_t, current_dt,
                                   current_cfl, t_final, constant_cfl)
 
@@ -1872,6 +2438,7 @@ def main(ctx_factory=cl.create_some_context,
                  cv_limited=current_cv_limited)
     my_write_restart(step=current_step, t=current_t, cv=current_state.cv,
                      temperature_seed=tseed)
+    restart_writer.close()
 
     if logmgr:
         logmgr.close()
@@ -1907,6 +2474,9 @@ if __name__ == "__main__":
                         help="enable lazy evaluation [OFF]")
     parser.add_argument("--overintegration", action="store_true",
         help="use overintegration in the RHS computations")
+    parser.add_argument("--interpolate", action="store_true", default=False,
+                        help="interpolate the restart (and target) from "
+                        "another mesh onto mesh_filename [OFF]")
 
     args = parser.parse_args()
 
@@ -1948,6 +2518,7 @@ if __name__ == "__main__":
          user_input_file=input_file,
          use_profiling=args.profile, use_logmgr=args.log,
          use_overintegration=args.overintegration, lazy=lazy,
-         actx_class=actx_class, casename=casename)
+         actx_class=actx_class, casename=casename,
+         interpolate_restart=args.interpolate)
 
 # vim: foldmethod=marker
@@ -56,6 +56,7 @@ from mirgecom.fluid import make_conserved
 from mirgecom.eos import IdealSingleGas, PyrometheusMixture
 from mirgecom.transport import SimpleTransport
 from mirgecom.gas_model import GasModel, make_fluid_state
+from isolator_restart import get_restart_filename, read_restart_file
 
 
 class SingleLevelFilter(logging.Filter):
@@ -246,13 +247,12 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
     )
 
     if restart_filename:  # read the grid from restart data
-        restart_filename = f"{restart_filename}-{rank:04d}.pkl"
-
-        from mirgecom.restart import read_restart_data
-        restart_data = read_restart_data(actx, restart_filename)
+        restart_filename = get_restart_filename(restart_filename, rank)
+        restart_data = read_restart_file(actx, restart_filename, rank)
         current_step = restart_data["step"]
         current_t = restart_data["t"]
         local_mesh = restart_data["local_mesh"]
+        restart_element_ids = restart_data.get("element_ids")
         local_nelements = local_mesh.nelements
         global_nelements = restart_data["global_nelements"]
         restart_order = int(restart_data["order"])
@@ -373,7 +373,8 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
             "step": step,
             "order": order,
             "global_nelements": global_nelements,
-            "num_parts": nparts
+            "num_parts": nparts,
+            "element_ids": restart_element_ids
         }
         write_restart_file(actx, restart_data, restart_fname, comm)
 
@@ -0,0 +1,671 @@
+"""Mesh input shared by the isolator drivers.
+
+.. autofunction:: get_mesh
+.. autofunction:: get_mesh_hash
+.. autofunction:: read_gmsh_arrays
+.. autofunction:: make_mesh_from_gmsh_arrays
+.. autofunction:: has_magic
+.. autofunction:: compress_array
+.. autofunction:: decompress_array
+.. autofunction:: write_binary_arrays
+.. autofunction:: read_binary_arrays
+.. autofunction:: is_binary_mesh
+.. autofunction:: write_binary_mesh
+.. autofunction:: read_binary_mesh
+.. autofunction:: get_global_element_ids
+.. autofunction:: get_mesh_cache_filename
+.. autofunction:: split_mesh
+.. autofunction:: distribute_mesh
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import os
+import mmap
+import json
+import zlib
+import pickle
+import hashlib
+import numpy as np
+from functools import partial
+
+from mirgecom.simutil import generate_and_distribute_mesh
+
+
+def get_mesh(dim, mesh_filename):
+    """Get the mesh, from a gmsh file or a binary mesh made by
+    :func:`write_binary_mesh`.
+    """
+    if is_binary_mesh(mesh_filename):
+        def mesh():
+            return make_mesh_from_gmsh_arrays(read_binary_mesh(mesh_filename), dim)
+        return mesh
+
+    from meshmode.mesh.io import read_gmsh
+    mesh = partial(read_gmsh, filename=mesh_filename, force_ambient_dim=dim)
+
+    return mesh
+
+
+def get_mesh_hash(mesh_filename, block_size=1 << 20):
+    """Return the SHA-256 hex digest of the contents of *mesh_filename*."""
+    sha = hashlib.sha256()
+    with open(mesh_filename, "rb") as f:
+        for block in iter(partial(f.read, block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def _get_gmsh_sections(buf):
+    """Return the byte range of the body of each section of a msh2 file."""
+    sections = {}
+    pos = buf.find(b"$")
+    while pos >= 0:
+        name_end = buf.find(b"\n", pos)
+        name = buf[pos+1:name_end].strip().decode()
+        end = buf.find(b"\n$End" + name.encode(), name_end)
+        if end < 0:
+            error_message = f"Unterminated gmsh section ${name}"
+            raise RuntimeError(error_message)
+        sections[name] = (name_end + 1, end + 1)
+        pos = buf.find(b"$", buf.find(b"\n", end + 1))
+    return sections
+
+
+def _count_line_tokens(chunk):
+    """Return the number of whitespace separated tokens on each line."""
+    b = np.frombuffer(chunk, dtype=np.uint8)
+    space = (b == ord(" ")) | (b == ord("\t")) | (b == ord("\r"))
+    newline = b == ord("\n")
+    blank = space | newline
+    token_start = ~blank & np.concatenate(([True], blank[:-1]))
+    line = np.cumsum(newline) - newline
+    nlines = int(np.count_nonzero(newline))
+    if b.size and not newline[-1]:
+        nlines = nlines + 1
+    return np.bincount(line[token_start], minlength=nlines)[:nlines]
+
+
+def _parse_gmsh_nodes(chunk):
+    """Return the ids and coordinates of the nodes on the lines of *chunk*."""
+    values = np.fromstring(chunk, sep=" ").reshape(-1, 4)
+    return values[:, 0].astype(np.int64), values[:, 1:]
+
+
+def _parse_gmsh_elements(chunk):
+    """Return the elements on the lines of *chunk* as arrays.
+
+    The element ids, types and physical tags (0 if untagged) have one entry
+    per element, the node ids of all of the elements are concatenated and
+    the number of nodes of each element is returned to split them.
+    """
+    ntokens = _count_line_tokens(chunk)
+    ntokens = ntokens[ntokens > 0]
+    if ntokens.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, empty, empty
+    values = np.fromstring(chunk, sep=" ", dtype=np.int64)
+    first = np.concatenate(([0], np.cumsum(ntokens)[:-1]))
+
+    ntags = values[first + 2]
+    physical = np.where(ntags > 0, values[np.minimum(first + 3, values.size - 1)],
+                        0)
+    nnodes = ntokens - 3 - ntags
+    node_first = first + 3 + ntags
+    node_index = (np.repeat(node_first - np.cumsum(nnodes) + nnodes, nnodes)
+                  + np.arange(np.sum(nnodes)))
+    return values[first], values[first + 1], physical, nnodes, values[node_index]
+
+
+def read_gmsh_arrays(mesh_filename):
+    """Read a gmsh (msh2, ASCII) file into arrays.
+
+    The node and element sections are parsed with vectorized numpy parsing
+    from a map of the file. Returns a :class:`dict` with the node
+    coordinates ``nodes``, the element ``element_types``, physical tags
+    ``element_tags``, ``element_offsets`` into the concatenated zero-based
+    ``element_nodes`` and the ``physical_names`` as tuples
+    ``(dimension, tag, name)``.
+    """
+    with open(mesh_filename, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        sections = _get_gmsh_sections(buf)
+        fmt_start, fmt_end = sections["MeshFormat"]
+        version, file_type = buf[fmt_start:fmt_end].split()[:2]
+        if not version.startswith(b"2") or file_type != b"0":
+            error_message = (f"Unsupported gmsh format in {mesh_filename}, "
+                             "expected msh2 ASCII")
+            raise RuntimeError(error_message)
+
+        def get_body(name):
+            # skip the count line
+            start, end = sections[name]
+            return buf.find(b"\n", start) + 1, end
+
+        start, end = get_body("Nodes")
+        node_ids, coords = _parse_gmsh_nodes(buf[start:end])
+        start, end = get_body("Elements")
+        _, types, tags, nnodes, element_nodes = _parse_gmsh_elements(
+            buf[start:end])
+
+        physical_names = []
+        if "PhysicalNames" in sections:
+            start, end = get_body("PhysicalNames")
+            for line in buf[start:end].decode().splitlines():
+                dimension, tag, name = line.split(maxsplit=2)
+                physical_names.append((int(dimension), int(tag), name.strip('"')))
+
+        buf.close()
+
+    if not np.array_equal(node_ids, np.arange(1, node_ids.size + 1)):
+        error_message = f"Non-contiguous node numbering in {mesh_filename}"
+        raise RuntimeError(error_message)
+
+    return {
+        "nodes": coords,
+        "element_types": types,
+        "element_tags": tags,
+        "element_offsets": np.concatenate(([0], np.cumsum(nnodes))),
+        "element_nodes": element_nodes - 1,
+        "physical_names": physical_names
+    }
+
+
+def make_mesh_from_gmsh_arrays(mesh_data, dim):
+    """Build the :class:`meshmode.mesh.Mesh` from the arrays of
+    :func:`read_gmsh_arrays`, as :func:`meshmode.mesh.io.read_gmsh` does
+    from the file.
+
+    The vertex numbering, the element groups and the boundary tags are
+    built with array operations, element type by element type, instead of
+    passing each node and element through
+    :class:`meshmode.mesh.io.GmshMeshReceiver`.
+    """
+    import modepy as mp
+    from gmsh_interop.reader import (
+        _gmsh_element_type_to_info_map as type_map,
+        GmshSimplexElementBase, GmshTensorProductElementBase)
+    from meshmode.mesh import (
+        make_mesh, SimplexElementGroup, TensorProductElementGroup)
+
+    points = np.ascontiguousarray(mesh_data["nodes"][:, :dim], dtype=np.float64)
+    types = np.asarray(mesh_data["element_types"])
+    tags = np.asarray(mesh_data["element_tags"])
+    offsets = np.asarray(mesh_data["element_offsets"], dtype=np.intp)
+    element_nodes = np.asarray(mesh_data["element_nodes"], dtype=np.intp)
+
+    if types.size == 0:
+        raise RuntimeError("empty mesh in gmsh input")
+
+    # element types in the order of their first element
+    type_ids, type_first = np.unique(types, return_index=True)
+    type_ids = type_ids[np.argsort(type_first)]
+    el_types = {int(type_id): type_map[int(type_id)] for type_id in type_ids}
+    mesh_bulk_dim = max(el_type.dimensions for el_type in el_types.values())
+
+    def get_type_element_nodes(type_id):
+        element_indices = np.flatnonzero(types == type_id)
+        return element_indices, element_nodes[
+            offsets[element_indices, np.newaxis]
+            + np.arange(el_types[type_id].node_count())]
+
+    # number the vertices in the order they first appear in the elements
+    vertex_counts = np.zeros(max(el_types) + 1, dtype=np.intp)
+    for type_id, el_type in el_types.items():
+        vertex_counts[type_id] = el_type.vertex_count()
+    nel_vertices = vertex_counts[types]
+    el_vertex_starts = np.cumsum(nel_vertices) - nel_vertices
+    gmsh_vertices = element_nodes[
+        np.repeat(offsets[:-1] - el_vertex_starts, nel_vertices)
+        + np.arange(np.sum(nel_vertices))]
+    gmsh_vertex_indices, vertex_first = np.unique(gmsh_vertices,
+                                                  return_index=True)
+    gmsh_vertex_indices = gmsh_vertex_indices[np.argsort(vertex_first)]
+    vertex_gmsh_index_to_mine = np.full(points.shape[0], -1, dtype=np.intp)
+    vertex_gmsh_index_to_mine[gmsh_vertex_indices] = np.arange(
+        gmsh_vertex_indices.size)
+    vertices = np.ascontiguousarray(points[gmsh_vertex_indices].T)
+
+    # the physical tags of the boundary elements become the boundary tags
+    face_vertex_indices_to_tags = None
+    if mesh_data["physical_names"]:
+        tag_names = {}
+        for dimension, tag, name in mesh_data["physical_names"]:
+            tag_names[tag] = (name, dimension)
+        face_vertex_indices_to_tags = {}
+        for type_id, el_type in el_types.items():
+            if el_type.dimensions != mesh_bulk_dim - 1:
+                continue
+            element_indices, el_nodes = get_type_element_nodes(type_id)
+            face_vertices = vertex_gmsh_index_to_mine[
+                el_nodes[:, :el_type.vertex_count()]]
+            for tag, face in zip(tags[element_indices], face_vertices):
+                name, dimension = tag_names.get(int(tag), (None, None))
+                face_tags = face_vertex_indices_to_tags.setdefault(
+                    frozenset(face.tolist()), [])
+                if dimension == mesh_bulk_dim - 1:
+                    face_tags.append(name)
+
+    groups = []
+    for type_id, el_type in el_types.items():
+        if el_type.dimensions != mesh_bulk_dim:
+            continue
+
+        _, el_nodes = get_type_element_nodes(type_id)
+        vertex_indices = vertex_gmsh_index_to_mine[
+            el_nodes[:, :el_type.vertex_count()]].astype(np.int32)
+        nodes = points[
+            el_nodes[:, el_type.get_lexicographic_gmsh_node_indices()]
+        ].transpose(2, 0, 1).copy()
+
+        if isinstance(el_type, GmshSimplexElementBase):
+            shape = mp.Simplex(el_type.dimensions)
+        elif isinstance(el_type, GmshTensorProductElementBase):
+            shape = mp.Hypercube(el_type.dimensions)
+        else:
+            raise NotImplementedError(
+                f"gmsh element type: {type(el_type).__name__}")
+        unit_nodes = mp.equispaced_nodes_for_space(
+            mp.space_for_shape(shape, el_type.order), shape)
+
+        if isinstance(el_type, GmshSimplexElementBase):
+            group = SimplexElementGroup.make_group(
+                el_type.order, vertex_indices, nodes, unit_nodes=unit_nodes)
+            if group.dim == 2:
+                from meshmode.mesh.processing import flip_simplex_element_group
+                group = flip_simplex_element_group(
+                    vertices, group, np.ones(group.nelements, bool))
+        else:
+            vertex_shuffle = type(el_type)(
+                order=1).get_lexicographic_gmsh_node_indices()
+            group = TensorProductElementGroup.make_group(
+                el_type.order, vertex_indices[:, vertex_shuffle], nodes,
+                unit_nodes=unit_nodes)
+        groups.append(group)
+
+    # same heuristic as GmshMeshReceiver
+    is_conforming = len(groups) == 1 or mesh_bulk_dim < 3
+
+    return make_mesh(vertices, groups, is_conforming=is_conforming,
+                     face_vertex_indices_to_tags=face_vertex_indices_to_tags)
+
+
+_binary_alignment = 64
+_binary_mesh_magic = b"ISOMESH1"
+
+
+def _align(pos):
+    return -(-pos // _binary_alignment)*_binary_alignment
+
+
+def has_magic(filename, magic):
+    """Return *True* if the file *filename* starts with *magic*."""
+    with open(filename, "rb") as f:
+        return f.read(len(magic)) == magic
+
+
+_compressions = ["zlib"]
+
+
+def compress_array(ary, compression="zlib"):
+    """Return the bytes of *ary* compressed losslessly with *compression*.
+
+    The bytes of the array entries are shuffled before the compression,
+    all of the first bytes followed by all of the second bytes and so on,
+    which compresses floating point data much better.
+    """
+    if compression not in _compressions:
+        error_message = f"Unknown compression: {compression}"
+        raise RuntimeError(error_message)
+    ary = np.ascontiguousarray(ary)
+    shuffled = ary.reshape(-1).view(np.uint8).reshape(-1, ary.itemsize).T
+    # level 1, the fastest, gives most of the size reduction
+    return zlib.compress(shuffled.tobytes(), 1)
+
+
+def decompress_array(data, dtype, shape, compression="zlib"):
+    """Return the array of *dtype* and *shape* compressed in *data* by
+    :func:`compress_array`.
+    """
+    if compression not in _compressions:
+        error_message = f"Unknown compression: {compression}"
+        raise RuntimeError(error_message)
+    dtype = np.dtype(dtype)
+    shuffled = np.frombuffer(zlib.decompress(data), dtype=np.uint8)
+    return (shuffled.reshape(dtype.itemsize, -1).T.copy().view(dtype)
+            .reshape(shape))
+
+
+def write_binary_arrays(filename, magic, header, arrays, compression=None):
+    """Write the :mod:`numpy` *arrays*, a :class:`dict`, to *filename*.
+
+    The file holds *magic*, the length of a JSON header, made of *header*
+    and the description of the arrays, and the raw arrays, each aligned to
+    64 bytes so they can be mapped in place. With *compression*, the arrays
+    are stored compressed by :func:`compress_array` instead.
+    """
+    if compression is None:
+        array_bytes = {name: np.ascontiguousarray(ary).tobytes()
+                       for name, ary in arrays.items()}
+    else:
+        array_bytes = {name: compress_array(ary, compression)
+                       for name, ary in arrays.items()}
+
+    header = dict(header, arrays={})
+    offset = 0
+    for name, ary in arrays.items():
+        # array offsets are relative to the end of the header
+        header["arrays"][name] = {"dtype": ary.dtype.str, "shape": ary.shape,
+                                  "offset": offset}
+        if compression is not None:
+            header["arrays"][name]["compression"] = compression
+            header["arrays"][name]["nbytes"] = len(array_bytes[name])
+        offset = _align(offset + len(array_bytes[name]))
+
+    header_bytes = json.dumps(header).encode()
+    data_start = _align(len(magic) + 8 + len(header_bytes))
+
+    with open(filename, "wb") as f:
+        f.write(magic)
+        f.write(np.uint64(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        for name in arrays:
+            f.seek(data_start + header["arrays"][name]["offset"])
+            f.write(array_bytes[name])
+
+
+def read_binary_arrays(filename, magic):
+    """Map the file written by :func:`write_binary_arrays` and return the
+    header and a :class:`dict` of the arrays, as read-only views of the
+    mapped file. Compressed arrays are decompressed into memory.
+    """
+    with open(filename, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buf[:len(magic)] != magic:
+        error_message = f"{filename} does not start with {magic}"
+        raise RuntimeError(error_message)
+    header_len = int(np.frombuffer(buf, dtype=np.uint64, count=1,
+                                   offset=len(magic))[0])
+    header = json.loads(buf[len(magic) + 8:len(magic) + 8 + header_len])
+    data_start = _align(len(magic) + 8 + header_len)
+
+    arrays = {}
+    for name, info in header.pop("arrays").items():
+        shape = tuple(info["shape"])
+        count = int(np.prod(shape))
+        if count == 0:
+            arrays[name] = np.empty(shape, dtype=np.dtype(info["dtype"]))
+            continue
+        if "compression" in info:
+            start = data_start + info["offset"]
+            arrays[name] = decompress_array(
+                buf[start:start + info["nbytes"]], info["dtype"], shape,
+                info["compression"])
+            continue
+        arrays[name] = np.frombuffer(
+            buf, dtype=np.dtype(info["dtype"]), count=count,
+            offset=data_start + info["offset"]).reshape(shape)
+    return header, arrays
+
+
+def is_binary_mesh(mesh_filename):
+    """Return *True* if *mesh_filename* is a binary mesh."""
+    return has_magic(mesh_filename, _binary_mesh_magic)
+
+
+def write_binary_mesh(mesh_data, mesh_filename):
+    """Write the arrays of :func:`read_gmsh_arrays` to *mesh_filename* with
+    :func:`write_binary_arrays`, the physical names (the boundary tags) go
+    in the header.
+    """
+    def get_index_dtype(ary):
+        if ary.size and max(ary.max(), -ary.min()) >= 2**31:
+            return np.int64
+        return np.int32
+
+    arrays = {
+        "nodes": np.asarray(mesh_data["nodes"], dtype=np.float64),
+        "element_types": np.asarray(mesh_data["element_types"], dtype=np.uint8),
+    }
+    for name in ["element_tags", "element_offsets", "element_nodes"]:
+        arrays[name] = np.asarray(mesh_data[name],
+                                  dtype=get_index_dtype(mesh_data[name]))
+
+    header = {"physical_names": [list(item)
+                                 for item in mesh_data["physical_names"]]}
+    write_binary_arrays(mesh_filename, _binary_mesh_magic, header, arrays)
+
+
+def read_binary_mesh(mesh_filename):
+    """Map the binary mesh in *mesh_filename* and return the arrays as in
+    :func:`read_gmsh_arrays`, as read-only views of the mapped file.
+    """
+    header, mesh_data = read_binary_arrays(mesh_filename, _binary_mesh_magic)
+    mesh_data["physical_names"] = [tuple(item)
+                                   for item in header["physical_names"]]
+    return mesh_data
+
+
+def _get_element_centroids(mesh):
+    vertex_indices = mesh.groups[0].vertex_indices
+    return np.ascontiguousarray(
+        np.mean(mesh.vertices[:, vertex_indices], axis=-1).T)
+
+
+def _match_element_centroids(mesh, centroids):
+    """Return the index in *mesh* of each element of the parts with the
+    element centroids in the list *centroids*, or *None* if an element is
+    not in *mesh*.
+    """
+    global_centroids = _get_element_centroids(mesh)
+    key_dtype = np.dtype((np.void, global_centroids.itemsize
+                          * global_centroids.shape[1]))
+    global_keys = global_centroids.view(key_dtype).ravel()
+    order = np.argsort(global_keys)
+    element_ids = []
+    for part_centroids in centroids:
+        keys = part_centroids.view(key_dtype).ravel()
+        ids = order[np.minimum(np.searchsorted(global_keys[order], keys),
+                               order.size - 1)]
+        if not np.array_equal(global_keys[ids], keys):
+            return None
+        element_ids.append(ids)
+    return element_ids
+
+
+def get_global_element_ids(comm, mesh, local_mesh):
+    """Return the index in *mesh*, given on rank 0 only, of each element of
+    the part *local_mesh* of it.
+
+    The partitioning does not keep the global element numbers, so they are
+    recovered by matching the element centroids, which are computed from
+    the same vertex coordinates and are bitwise equal.
+    """
+    centroids = comm.gather(_get_element_centroids(local_mesh), root=0)
+
+    element_ids = None
+    if comm.Get_rank() == 0:
+        element_ids = _match_element_centroids(mesh, centroids)
+
+    # every rank raises, rather than waiting in the scatter
+    if comm.bcast(comm.Get_rank() == 0 and element_ids is None, root=0):
+        error_message = "Mesh parts do not match the global mesh"
+        raise RuntimeError(error_message)
+
+    return comm.scatter(element_ids, root=0)
+
+
+def get_mesh_cache_filename(cache_path, mesh_filename, mesh_hash, dim, nparts,
+                            rank):
+    """Return the name of the mesh cache file of part *rank* of *nparts* of
+    the mesh in *mesh_filename*, with the hash *mesh_hash* of its contents.
+    """
+    stem = os.path.splitext(os.path.basename(mesh_filename))[0]
+    return os.path.join(
+        cache_path,
+        f"{stem}-{mesh_hash[:16]}-{dim}d-np{nparts:04d}-{rank:04d}.pkl")
+
+
+def _write_mesh_cache(cache_filename, local_mesh, global_nelements,
+                      element_ids, mesh_hash, nparts):
+    # write then rename, so an interrupted write never leaves a partial part
+    cache_data = {
+        "local_mesh": local_mesh,
+        "global_nelements": global_nelements,
+        "element_ids": element_ids,
+        "mesh_hash": mesh_hash,
+        "num_parts": nparts
+    }
+    with open(cache_filename + ".tmp", "wb") as f:
+        pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(cache_filename + ".tmp", cache_filename)
+
+
+def _partition_mesh(mesh, part_per_element, nparts):
+    from inspect import signature
+    from meshmode.mesh.processing import partition_mesh
+
+    # older meshmode returns one part at a time, as MPIMeshDistributor uses it
+    if "part_num" in signature(partition_mesh).parameters:
+        return [partition_mesh(mesh, part_per_element, i)[0]
+                for i in range(nparts)]
+
+    # the parts given by their elements, as mirgecom.simutil.distribute_mesh
+    parts = partition_mesh(mesh, {
+        i: np.where(part_per_element == i)[0] for i in range(nparts)})
+    return [parts[i] for i in range(nparts)]
+
+
+def split_mesh(dim, mesh_filename, nparts, cache_path):
+    """Partition the mesh in *mesh_filename* into *nparts* parts in this
+    process and write them to the mesh cache in *cache_path*, as
+    :func:`distribute_mesh` does, and return the cache file names.
+
+    A run on *nparts* ranks with the same *cache_path* then loads one part
+    on each rank, so no rank reads or partitions the global mesh. The parts
+    are made by :func:`meshmode.distributed.get_partition_by_pymetis` and
+    :func:`meshmode.mesh.processing.partition_mesh`, like a distributed run
+    does on rank 0, so this process needs the memory of the global mesh.
+    """
+    from meshmode.distributed import get_partition_by_pymetis
+
+    mesh_hash = get_mesh_hash(mesh_filename)
+    mesh = get_mesh(dim=dim, mesh_filename=mesh_filename)()
+    part_per_element = np.asarray(get_partition_by_pymetis(mesh, nparts))
+    parts = _partition_mesh(mesh, part_per_element, nparts)
+    element_ids = _match_element_centroids(
+        mesh, [_get_element_centroids(part) for part in parts])
+    if element_ids is None:
+        error_message = "Mesh parts do not match the global mesh"
+        raise RuntimeError(error_message)
+
+    os.makedirs(cache_path, exist_ok=True)
+    cache_filenames = []
+    for rank in range(nparts):
+        cache_filename = get_mesh_cache_filename(
+            cache_path, mesh_filename, mesh_hash, dim, nparts, rank)
+        _write_mesh_cache(cache_filename, parts[rank], mesh.nelements,
+                          element_ids[rank], mesh_hash, nparts)
+        cache_filenames.append(cache_filename)
+
+    return cache_filenames
+
+
+def distribute_mesh(comm, dim, mesh_filename, cache_path=None,
+                    return_element_ids=False):
+    """Return the local part of the mesh and the global number of elements,
+    and with *return_element_ids* the global element ids of the local
+    elements (see :func:`get_global_element_ids`).
+
+    Without *cache_path*, the mesh is read and partitioned on rank 0 by
+    :func:`mirgecom.simutil.generate_and_distribute_mesh`. With *cache_path*,
+    the partitions are cached in *cache_path*, one file per rank, keyed by
+    the hash of the mesh file, the dimension and the number of ranks, with
+    the global element ids. When the cache holds the partitions of every
+    rank, each rank loads its own part and the mesh is neither read nor
+    partitioned. :func:`split_mesh` fills the cache ahead of a run, so that
+    no rank of the run needs the memory of the global mesh.
+    """
+    def generate_and_distribute(with_element_ids):
+        if comm.Get_rank() == 0:
+            mesh = get_mesh(dim=dim, mesh_filename=mesh_filename)()
+        else:
+            mesh = None
+        local_mesh, global_nelements = generate_and_distribute_mesh(
+            comm, lambda: mesh)
+        element_ids = None
+        if with_element_ids:
+            element_ids = get_global_element_ids(comm, mesh, local_mesh)
+        return local_mesh, global_nelements, element_ids
+
+    def result(local_mesh, global_nelements, element_ids):
+        if return_element_ids:
+            return local_mesh, global_nelements, element_ids
+        return local_mesh, global_nelements
+
+    if cache_path is None:
+        return result(*generate_and_distribute(return_element_ids))
+
+    from mpi4py import MPI
+    rank = comm.Get_rank()
+    nparts = comm.Get_size()
+
+    mesh_hash = None
+    if rank == 0:
+        mesh_hash = get_mesh_hash(mesh_filename)
+    mesh_hash = comm.bcast(mesh_hash, root=0)
+
+    cache_filename = get_mesh_cache_filename(
+        cache_path, mesh_filename, mesh_hash, dim, nparts, rank)
+
+    cache_data = None
+    if comm.allreduce(os.path.exists(cache_filename), op=MPI.LAND):
+        with open(cache_filename, "rb") as f:
+            cache_data = pickle.load(f)
+        if comm.allreduce(cache_data["mesh_hash"] != mesh_hash
+                          or cache_data["num_parts"] != nparts, op=MPI.LOR):
+            error_message = f"Mesh cache files in {cache_path} do not match"
+            raise RuntimeError(error_message)
+
+    # caches written without the element ids are regenerated when they are
+    # needed
+    if comm.allreduce(
+            cache_data is not None
+            and (not return_element_ids or "element_ids" in cache_data),
+            op=MPI.LAND):
+        return result(cache_data["local_mesh"], cache_data["global_nelements"],
+                      cache_data.get("element_ids"))
+
+    local_mesh, global_nelements, element_ids = generate_and_distribute(True)
+
+    if rank == 0:
+        os.makedirs(cache_path, exist_ok=True)
+    comm.Barrier()
+
+    _write_mesh_cache(cache_filename, local_mesh, global_nelements,
+                      element_ids, mesh_hash, nparts)
+
+    return result(local_mesh, global_nelements, element_ids)
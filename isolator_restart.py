@@ -0,0 +1,869 @@
+"""Restart input and output shared by the isolator drivers.
+
+Restarts are either the pickles of :func:`mirgecom.restart.write_restart_file`
+(``.pkl``), binary files (``.rst``) holding the DOF arrays as raw arrays
+that are mapped in place on read, or a single binary file of all of the
+ranks (``.srst``) written with MPI-IO. The mesh of a binary or shared
+restart is stored once per run, next to its first restart. The DOF arrays of
+the binary formats can be compressed losslessly.
+
+.. autofunction:: get_restart_filename
+.. autofunction:: is_binary_restart
+.. autofunction:: is_shared_restart
+.. autofunction:: write_binary_restart
+.. autofunction:: write_shared_restart
+.. autofunction:: read_restart_file
+.. autofunction:: read_restart_parts
+.. autofunction:: get_restart_num_parts
+.. autofunction:: read_repartitioned_restart
+.. autofunction:: make_point_interpolator
+.. autofunction:: interpolate_restart_data
+.. autoclass:: RestartWriter
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import os
+import json
+import mmap
+import time
+import queue
+import pickle
+import copyreg
+import logging
+import threading
+import numpy as np
+from pytools.obj_array import make_obj_array
+
+from meshmode.dof_array import DOFArray
+from mirgecom.discretization import create_discretization_collection
+from mirgecom.fluid import ConservedVars, make_conserved
+from mirgecom.restart import read_restart_data
+
+from isolator_mesh import (
+    has_magic,
+    compress_array,
+    decompress_array,
+    write_binary_arrays,
+    read_binary_arrays
+)
+
+logger = logging.getLogger(__name__)
+
+_binary_restart_magic = b"ISORST01"
+_shared_restart_magic = b"ISOSRST1"
+_alignment = 64
+
+
+def _align(pos):
+    return -(-pos // _alignment)*_alignment
+
+
+def get_restart_filename(restart_filename, rank):
+    """Return the file of *rank* of the restart *restart_filename*, given
+    without the rank and extension: the shared file if it exists, else the
+    binary or the pickled file of the rank.
+    """
+    shared_filename = f"{restart_filename}.srst"
+    if os.path.exists(shared_filename):
+        return shared_filename
+    binary_filename = f"{restart_filename}-{rank:04d}.rst"
+    if os.path.exists(binary_filename):
+        return binary_filename
+    return f"{restart_filename}-{rank:04d}.pkl"
+
+
+def is_binary_restart(filename):
+    """Return *True* if *filename* is a binary restart."""
+    return has_magic(filename, _binary_restart_magic)
+
+
+def is_shared_restart(filename):
+    """Return *True* if *filename* is a shared restart."""
+    return has_magic(filename, _shared_restart_magic)
+
+
+def _get_dof_array_data(ary):
+    if len(ary) != 1:
+        error_message = "Binary restarts require a single element group"
+        raise RuntimeError(error_message)
+    return ary[0]
+
+
+def _get_restart_arrays(restart_data, dtype):
+    """Return the DOF arrays of *restart_data* as *dtype* arrays."""
+    cv = restart_data["cv"]
+    mass = _get_dof_array_data(cv.mass)
+    species_mass = [_get_dof_array_data(x) for x in cv.species_mass]
+    arrays = {
+        "mass": mass,
+        "energy": _get_dof_array_data(cv.energy),
+        "momentum": np.stack([_get_dof_array_data(x) for x in cv.momentum]),
+        "species_mass": (np.stack(species_mass) if species_mass
+                         else np.empty((0,) + mass.shape)),
+    }
+    if "temperature_seed" in restart_data:
+        arrays["temperature_seed"] = _get_dof_array_data(
+            restart_data["temperature_seed"])
+    return {name: np.asarray(ary, dtype=dtype) for name, ary in arrays.items()}
+
+
+def _pack_restart_arrays(arrays):
+    """Return the arrays of :func:`_get_restart_arrays` as the rows of a
+    ``(nrows, nelements, nunit)`` block and the list of their names and
+    numbers of rows (*None* for a single, unstacked row, so that an empty
+    stack, such as ``species_mass`` without species, keeps no rows).
+    """
+    nelements, nunit = arrays["mass"].shape
+    block = np.concatenate([ary.reshape(ary.shape if ary.ndim == 3
+                                        else (1, nelements, nunit))
+                            for ary in arrays.values()])
+    fields = [[name, ary.shape[0] if ary.ndim == 3 else None]
+              for name, ary in arrays.items()]
+    return block, fields
+
+
+def _get_packed_nrows(fields):
+    """Return the number of rows of the block of :func:`_pack_restart_arrays`."""
+    return sum(1 if field_nrows is None else field_nrows
+               for _, field_nrows in fields)
+
+
+def _unpack_restart_arrays(block, fields):
+    """Return the arrays packed by :func:`_pack_restart_arrays`."""
+    arrays = {}
+    row = 0
+    for name, field_nrows in fields:
+        if field_nrows is None:
+            arrays[name] = block[row]
+            row += 1
+        else:
+            arrays[name] = block[row:row+field_nrows]
+            row += field_nrows
+    return arrays
+
+
+def _get_restart_header(restart_data):
+    """Return the entries of *restart_data* that are not arrays."""
+    return {
+        key: (value.item() if isinstance(value, np.generic) else value)
+        for key, value in restart_data.items()
+        if key not in ["local_mesh", "cv", "temperature_seed", "element_ids"]}
+
+
+def _make_restart_data(actx, header, arrays, local_mesh):
+    """Return the restart data from the arrays of :func:`_get_restart_arrays`."""
+    def to_dof_array(ary):
+        return DOFArray(actx, (actx.from_numpy(
+            np.asarray(ary, dtype=np.float64)),))
+
+    restart_data = dict(header, local_mesh=local_mesh)
+    restart_data["cv"] = make_conserved(
+        dim=arrays["momentum"].shape[0],
+        mass=to_dof_array(arrays["mass"]),
+        energy=to_dof_array(arrays["energy"]),
+        momentum=make_obj_array([to_dof_array(x) for x in arrays["momentum"]]),
+        species_mass=make_obj_array(
+            [to_dof_array(x) for x in arrays["species_mass"]]))
+    if "temperature_seed" in arrays:
+        restart_data["temperature_seed"] = to_dof_array(
+            arrays["temperature_seed"])
+    return restart_data
+
+
+def write_binary_restart(restart_data, filename, mesh_filename,
+                         dtype=np.float64, compression=None):
+    """Write *restart_data*, with host copies of the DOF arrays, to the
+    binary restart *filename*.
+
+    ``cv`` and the optional ``temperature_seed`` are stored as *dtype*
+    arrays, the optional global ``element_ids`` as integers and the other
+    entries, except the mesh, in the header. The mesh is not written, the
+    header refers to *mesh_filename* instead, which has to be in the same
+    directory. With *compression*, the arrays are compressed as in
+    :func:`isolator_mesh.write_binary_arrays`.
+    """
+    arrays = _get_restart_arrays(restart_data, dtype)
+    if restart_data.get("element_ids") is not None:
+        arrays["element_ids"] = np.asarray(restart_data["element_ids"],
+                                           dtype=np.int64)
+
+    header = _get_restart_header(restart_data)
+    header["mesh_file"] = os.path.basename(mesh_filename)
+
+    write_binary_arrays(filename, _binary_restart_magic, header, arrays,
+                        compression=compression)
+
+
+def write_shared_restart(comm, restart_data, filename, mesh_filename,
+                         dtype=np.float64, compression=None):
+    """Write the *restart_data* of all of the ranks of *comm* to the single
+    file *filename*, collectively with MPI-IO.
+
+    The file holds a JSON header, with the number of elements of each rank,
+    followed by the index of the global element ids of all of the elements
+    and the DOF arrays of each rank, in rank order. Each rank writes its
+    part of the index and its arrays, as in :func:`write_binary_restart`,
+    at offsets following from the element counts. Without ``element_ids``
+    in *restart_data*, the elements are numbered in rank order. The mesh
+    part of each rank is in *mesh_filename*, formatted with the rank.
+
+    With *compression*, the arrays of each rank are compressed by
+    :func:`isolator_mesh.compress_array` and the header holds their
+    compressed sizes instead. The index is not compressed.
+    """
+    from mpi4py import MPI
+    rank = comm.Get_rank()
+
+    arrays = _get_restart_arrays(restart_data, dtype)
+    nelements, nunit = arrays["mass"].shape
+    element_counts = comm.allgather(nelements)
+    element_offset = sum(element_counts[:rank])
+
+    element_ids = restart_data.get("element_ids")
+    header = _get_restart_header(restart_data)
+    header["mesh_element_ids"] = comm.allreduce(element_ids is not None,
+                                                op=MPI.LAND)
+    if not header["mesh_element_ids"]:
+        element_ids = element_offset + np.arange(nelements)
+    block, fields = _pack_restart_arrays(arrays)
+    header.update({
+        "mesh_file": os.path.basename(mesh_filename),
+        "element_counts": element_counts,
+        "nunit": nunit,
+        "dtype": np.dtype(dtype).str,
+        "fields": fields
+    })
+    if compression is None:
+        block_bytes = np.ascontiguousarray(block)
+        block_offset = block.shape[0]*nunit*block.itemsize*element_offset
+    else:
+        block_bytes = compress_array(block, compression)
+        block_nbytes = comm.allgather(len(block_bytes))
+        block_offset = sum(block_nbytes[:rank])
+        header["compression"] = compression
+        header["block_nbytes"] = block_nbytes
+    header_bytes = json.dumps(header).encode()
+
+    index_start = _align(len(_shared_restart_magic) + 8 + len(header_bytes))
+    data_start = _align(index_start + 8*sum(element_counts))
+
+    fh = MPI.File.Open(comm, filename, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+    fh.Set_size(0)
+    if rank == 0:
+        fh.Write_at(0, _shared_restart_magic
+                    + np.uint64(len(header_bytes)).tobytes() + header_bytes)
+    fh.Write_at_all(index_start + 8*element_offset,
+                    np.ascontiguousarray(element_ids, dtype=np.int64))
+    fh.Write_at_all(data_start + block_offset, block_bytes)
+    fh.Close()
+
+
+def _read_shared_restart_arrays(filename, rank):
+    """Return the header, the arrays and the global element ids (*None* if
+    the restart has none) of the part of *rank* of the shared restart
+    *filename*, see :func:`_read_restart_arrays`.
+    """
+    with open(filename, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic_len = len(_shared_restart_magic)
+    header_len = int(np.frombuffer(buf, dtype=np.uint64, count=1,
+                                   offset=magic_len)[0])
+    header = json.loads(buf[magic_len + 8:magic_len + 8 + header_len])
+    element_counts = header.pop("element_counts")
+    if rank >= len(element_counts):
+        error_message = (f"Rank {rank} not in the restart {filename} written "
+                         f"by {len(element_counts)} ranks")
+        raise RuntimeError(error_message)
+    nunit = header.pop("nunit")
+    dtype = np.dtype(header.pop("dtype"))
+    fields = header.pop("fields")
+    nrows = _get_packed_nrows(fields)
+
+    nelements = element_counts[rank]
+    element_offset = sum(element_counts[:rank])
+    index_start = _align(magic_len + 8 + header_len)
+    data_start = _align(index_start + 8*sum(element_counts))
+
+    element_ids = np.frombuffer(buf, dtype=np.int64, count=nelements,
+                                offset=index_start + 8*element_offset)
+    compression = header.pop("compression", None)
+    block = np.empty((nrows, 0, nunit), dtype=dtype)
+    if compression is not None:
+        block_nbytes = header.pop("block_nbytes")
+        block_start = data_start + sum(block_nbytes[:rank])
+        block = decompress_array(
+            buf[block_start:block_start + block_nbytes[rank]], dtype,
+            (nrows, nelements, nunit), compression)
+    elif nelements:
+        block = np.frombuffer(
+            buf, dtype=dtype, count=nrows*nelements*nunit,
+            offset=data_start + nrows*nunit*dtype.itemsize*element_offset
+        ).reshape(nrows, nelements, nunit)
+
+    header["mesh_file"] = header["mesh_file"].format(rank=rank)
+    if not header.pop("mesh_element_ids"):
+        element_ids = None
+    return header, _unpack_restart_arrays(block, fields), element_ids
+
+
+class _HostDOFArray:
+    """Host stand-in for :class:`~meshmode.dof_array.DOFArray`, holding the
+    per-group :mod:`numpy` arrays of its pickled state.
+    """
+
+    def __setstate__(self, state):
+        self._data = tuple(state)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, i):
+        return self._data[i]
+
+
+class _HostRestartUnpickler(pickle.Unpickler):
+    """Unpickle the :class:`~meshmode.dof_array.DOFArray` of a restart as
+    :class:`_HostDOFArray`, without an array context, the counterpart of
+    :class:`_HostRestartPickler`.
+    """
+
+    def find_class(self, module, name):
+        if module == DOFArray.__module__ and name == DOFArray.__name__:
+            return _HostDOFArray
+        return super().find_class(module, name)
+
+
+def _read_restart_arrays(filename, rank=0):
+    """Return the header, the host arrays of :func:`_get_restart_arrays` and
+    the global element ids (*None* if the restart has none) of the restart
+    *filename*, pickled, binary or the part of *rank* of a shared restart.
+
+    Nothing is copied to the device and the mesh is not read. The header of
+    the binary formats holds the name of the mesh file as ``mesh_file``.
+    """
+    if is_shared_restart(filename):
+        return _read_shared_restart_arrays(filename, rank)
+    if is_binary_restart(filename):
+        header, arrays = read_binary_arrays(filename, _binary_restart_magic)
+        return header, arrays, arrays.pop("element_ids", None)
+
+    with open(filename, "rb") as f:
+        restart_data = _HostRestartUnpickler(f).load()
+    return (_get_restart_header(restart_data),
+            _get_restart_arrays(restart_data, np.float64),
+            restart_data.get("element_ids"))
+
+
+def read_restart_file(actx, filename, rank=0):
+    """Read the restart *filename*, pickled, binary or the part of *rank* of
+    a shared restart, into the :class:`dict` of
+    :func:`mirgecom.restart.read_restart_data`.
+    """
+    if not is_binary_restart(filename) and not is_shared_restart(filename):
+        return read_restart_data(actx, filename)
+
+    header, arrays, element_ids = _read_restart_arrays(filename, rank)
+    with open(os.path.join(os.path.dirname(filename),
+                           header.pop("mesh_file")), "rb") as f:
+        local_mesh = pickle.load(f)
+
+    restart_data = _make_restart_data(actx, header, arrays, local_mesh)
+    if element_ids is not None:
+        restart_data["element_ids"] = element_ids
+    return restart_data
+
+
+def read_restart_parts(actx, restart_filename):
+    """Read the restart data of every rank of the run that wrote
+    *restart_filename*, as a list ordered by rank.
+    """
+    restart_data = read_restart_file(
+        actx, get_restart_filename(restart_filename, 0))
+    return [restart_data] + [
+        read_restart_file(actx, get_restart_filename(restart_filename, rank),
+                          rank)
+        for rank in range(1, restart_data["num_parts"])]
+
+
+def get_restart_num_parts(comm, restart_filename):
+    """Return the number of ranks that wrote the restart *restart_filename*,
+    read on rank 0.
+    """
+    num_parts = None
+    if comm.Get_rank() == 0:
+        header, _, _ = _read_restart_arrays(
+            get_restart_filename(restart_filename, 0))
+        num_parts = header["num_parts"]
+    return comm.bcast(num_parts, root=0)
+
+
+def read_repartitioned_restart(actx, comm, restart_filename, restart_num_parts,
+                               local_mesh, element_ids):
+    """Read the restart *restart_filename*, written by *restart_num_parts*
+    ranks, onto the partition of the same mesh given by *local_mesh* and its
+    global *element_ids* (see :func:`isolator_mesh.distribute_mesh`).
+
+    The restart parts are read round-robin by the ranks of *comm*, as host
+    arrays by :func:`_read_restart_arrays`, and the DOF arrays of each
+    element are sent to the rank owning it, found from the global element
+    ids of the restart. The nodal data of an element is the same in any
+    partition, so no interpolation is involved.
+
+    :returns: the restart data of the local part, as
+        :func:`read_restart_file` does, with *local_mesh*.
+    """
+    rank = comm.Get_rank()
+    nparts = comm.Get_size()
+    element_ids = np.asarray(element_ids, dtype=np.int64)
+
+    # the new owner of each global element
+    all_element_ids = comm.allgather(element_ids)
+    owner = np.empty(sum(ids.size for ids in all_element_ids), dtype=np.int32)
+    for part, ids in enumerate(all_element_ids):
+        owner[ids] = part
+
+    header = None
+    fields = None
+    outgoing = [[] for _ in range(nparts)]
+    for part in range(rank, restart_num_parts, nparts):
+        part_filename = get_restart_filename(restart_filename, part)
+        header, arrays, part_ids = _read_restart_arrays(part_filename, part)
+        if part_ids is None:
+            error_message = (f"Restart {part_filename} has no global element "
+                             "ids, it cannot be repartitioned")
+            raise RuntimeError(error_message)
+        header.pop("mesh_file", None)
+        block, fields = _pack_restart_arrays(
+            {name: np.asarray(ary, dtype=np.float64)
+             for name, ary in arrays.items()})
+
+        part_ids = np.asarray(part_ids, dtype=np.int64)
+        part_owner = owner[part_ids]
+        for dest in np.unique(part_owner):
+            selected = part_owner == dest
+            outgoing[dest].append((part_ids[selected], block[:, selected]))
+
+    # rank 0 always reads part 0
+    header, fields = comm.bcast((header, fields), root=0)
+    incoming = [item for items in comm.alltoall(outgoing) for item in items]
+
+    received_ids = np.concatenate([ids for ids, _ in incoming])
+    if received_ids.size != element_ids.size:
+        error_message = (f"Received {received_ids.size} of the "
+                         f"{element_ids.size} elements of rank {rank}")
+        raise RuntimeError(error_message)
+    sorter = np.argsort(element_ids)
+    position = sorter[np.searchsorted(element_ids, received_ids, sorter=sorter)]
+
+    received_block = np.concatenate([block for _, block in incoming], axis=1)
+    block = np.empty_like(received_block)
+    block[:, position] = received_block
+
+    restart_data = _make_restart_data(
+        actx, header, _unpack_restart_arrays(block, fields), local_mesh)
+    restart_data["num_parts"] = nparts
+    restart_data["element_ids"] = element_ids
+    return restart_data
+
+
+def make_point_interpolator(unit_nodes, order, element_nodes, points,
+                            ncandidates=16, block_size=100000):
+    """Return a function that interpolates nodal values on a simplex mesh to
+    *points*.
+
+    The elements containing the *points* are located among the
+    *ncandidates* elements with the nearest centroids, found with a k-d
+    tree, and the points not found among them are searched again among
+    eight times as many candidates, until the farthest candidate is beyond
+    the largest element.
+    Points outside of the mesh, such as near curved boundaries discretized
+    differently, use the nearest point of the closest element.
+
+    :arg unit_nodes: the reference nodes of the elements, ``(dim, nunit)``.
+    :arg order: the polynomial order of the elements.
+    :arg element_nodes: the nodes of the elements, ``(nelements, nunit, dim)``.
+    :arg points: the points to interpolate to, ``(npoints, dim)``.
+    :returns: a tuple of the function, which maps the nodal values
+        ``(nelements, nunit)`` to the values at the points ``(npoints,)``,
+        and the number of points found outside of the mesh.
+    """
+    import modepy as mp
+    from scipy.spatial import cKDTree
+
+    dim = unit_nodes.shape[0]
+    nelements = element_nodes.shape[0]
+    basis = mp.orthonormal_basis_for_space(mp.PN(dim, order), mp.Simplex(dim))
+    vdm_inv = np.linalg.inv(mp.vandermonde(basis.functions, unit_nodes))
+
+    # affine map of each element, x = r @ jac + shift
+    nunit = unit_nodes.shape[1]
+    fit = np.linalg.pinv(np.hstack([unit_nodes.T, np.ones((nunit, 1))]))
+    coeffs = np.einsum("kn,end->ekd", fit, element_nodes)
+    jac_inv = np.linalg.inv(coeffs[:, :dim, :])
+    shift = coeffs[:, dim, :]
+
+    centroids = np.mean(element_nodes, axis=1)
+    tree = cKDTree(centroids)
+    # an element containing a point has its centroid within this distance
+    max_radius = np.max(np.linalg.norm(element_nodes - centroids[:, None, :],
+                                       axis=-1))
+
+    def locate(block, k):
+        """Return the best of the *k* candidates of each point in *block*,
+        its barycentric coordinates and the distance to the farthest
+        candidate.
+        """
+        distances, candidates = tree.query(block, k=k)
+        distances = distances.reshape(block.shape[0], k)
+        candidates = candidates.reshape(block.shape[0], k)
+
+        # barycentric coordinates in each of the candidates
+        ref = np.einsum("pkd,pkde->pke",
+                        block[:, None, :] - shift[candidates],
+                        jac_inv[candidates])
+        bary = np.concatenate([-0.5*np.sum(ref + 1, axis=-1, keepdims=True) + 1,
+                               0.5*(ref + 1)], axis=-1)
+        best = np.argmax(np.min(bary, axis=-1), axis=-1)
+        rows = np.arange(block.shape[0])
+        return candidates[rows, best], bary[rows, best], distances[:, -1]
+
+    npoints = points.shape[0]
+    point_elements = np.empty(npoints, dtype=np.intp)
+    point_bary = np.empty((npoints, dim + 1))
+    searched_distance = np.empty(npoints)
+    k = min(ncandidates, nelements)
+    for start in range(0, npoints, block_size):
+        block = slice(start, start + block_size)
+        point_elements[block], point_bary[block], searched_distance[block] = \
+            locate(points[block], k)
+
+    # on stretched (boundary layer) elements, the element containing a point
+    # can be far down the list of nearest centroids, search the points not
+    # found yet among more candidates until no farther element can hold them
+    outside = np.flatnonzero(np.min(point_bary, axis=-1) < -1e-8)
+    while k < nelements:
+        outside = outside[searched_distance[outside] <= max_radius]
+        if outside.size == 0:
+            break
+        k = min(8*k, nelements)
+        step = max(1, block_size*ncandidates//k)
+        for start in range(0, outside.size, step):
+            indices = outside[start:start+step]
+            point_elements[indices], point_bary[indices], \
+                searched_distance[indices] = locate(points[indices], k)
+        outside = outside[np.min(point_bary[outside], axis=-1) < -1e-8]
+    noutside = int(np.count_nonzero(np.min(point_bary, axis=-1) < -1e-8))
+
+    point_bary = np.clip(point_bary, 0, None)
+    point_bary = point_bary/np.sum(point_bary, axis=-1, keepdims=True)
+    point_unit_nodes = (2*point_bary[:, 1:] - 1).T
+
+    point_basis = mp.vandermonde(basis.functions, point_unit_nodes)
+
+    def interpolate(nodal_values):
+        modal_values = nodal_values @ vdm_inv.T
+        return np.einsum("pi,pi->p", point_basis, modal_values[point_elements])
+
+    return interpolate, noutside
+
+
+def _get_restart_fields(cv, temperature_seed):
+    return ([cv.mass, cv.energy] + list(cv.momentum) + list(cv.species_mass)
+            + [temperature_seed])
+
+
+def interpolate_restart_data(actx, dcoll, restart_parts):
+    """Interpolate the solution of a restart, possibly written on another
+    mesh and number of ranks, to the nodes of *dcoll*.
+
+    Every rank searches the whole restart mesh, which is meant to be the
+    coarse one.
+
+    :arg restart_parts: the restart data of all of the ranks, as returned by
+        :func:`read_restart_parts`.
+    :returns: a tuple of the conserved variables and the temperature seed.
+    """
+    element_nodes = []
+    fields = []
+    unit_nodes = None
+    for restart_data in restart_parts:
+        restart_dcoll = create_discretization_collection(
+            actx, restart_data["local_mesh"], order=int(restart_data["order"]))
+        restart_discr = restart_dcoll.discr_from_dd("vol")
+        if len(restart_discr.groups) != 1:
+            error_message = "Restart interpolation requires a single element group"
+            raise RuntimeError(error_message)
+        unit_nodes = restart_discr.groups[0].unit_nodes
+        element_nodes.append(np.stack(
+            [actx.to_numpy(x[0]) for x in restart_dcoll.nodes()], axis=-1))
+        fields.append([actx.to_numpy(field[0]) for field in _get_restart_fields(
+            restart_data["cv"], restart_data["temperature_seed"])])
+
+    discr = dcoll.discr_from_dd("vol")
+    if len(discr.groups) != 1:
+        error_message = "Restart interpolation requires a single element group"
+        raise RuntimeError(error_message)
+    nodes = [actx.to_numpy(x[0]) for x in dcoll.nodes()]
+    shape = nodes[0].shape
+
+    interpolate, noutside = make_point_interpolator(
+        unit_nodes, int(restart_parts[0]["order"]),
+        np.concatenate(element_nodes),
+        np.stack([x.reshape(-1) for x in nodes], axis=-1))
+    if noutside:
+        logger.warning(f"{noutside} nodes outside of the restart mesh, "
+                       "using the nearest restart element")
+
+    values = [
+        DOFArray(actx, (actx.from_numpy(
+            interpolate(np.concatenate(field)).reshape(shape)),))
+        for field in zip(*fields)]
+
+    dim = dcoll.dim
+    cv = make_conserved(dim=dim, mass=values[0], energy=values[1],
+                        momentum=make_obj_array(values[2:2+dim]),
+                        species_mass=make_obj_array(values[2+dim:-1]))
+    return cv, values[-1]
+
+
+class _HostRestartPickler(pickle.Pickler):
+    """Pickle host copies of :class:`~meshmode.dof_array.DOFArray` with the
+    state that :meth:`~meshmode.dof_array.DOFArray.__getstate__` produces, a
+    list of the per-group :mod:`numpy` arrays, so the file is read back by
+    :func:`mirgecom.restart.read_restart_data` without an array context here.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, DOFArray):
+            return copyreg.__newobj__, (DOFArray,), list(obj._data)
+        return NotImplemented
+
+
+class RestartWriter:
+    """Write the restart files of a run.
+
+    :meth:`write` copies the DOF arrays of the restart data to the host and
+    writes them in *restart_format*:
+
+    - ``"pickle"``, as :func:`mirgecom.restart.write_restart_file` does,
+    - ``"binary"``, with :func:`write_binary_restart`,
+    - ``"shared"``, with :func:`write_shared_restart`.
+
+    The binary formats store *dtype* arrays, compressed with *compression*
+    if given (see :func:`isolator_mesh.compress_array`), and the mesh is
+    written once, next to the first restart, as ``<restart>-mesh.pkl`` or
+    ``<restart>-mesh-<rank>.pkl``.
+
+    Each file is written under a temporary name, ``<file>.tmp``, and renamed
+    once complete, so a run stopped in the middle of a write leaves the
+    previous restarts intact.
+
+    With *keep_last*, only the last *keep_last* restarts written by the
+    writer are kept, plus those at the steps that are multiples of
+    *keep_interval*, if given. Older restarts are removed after the next one
+    is written. Restarts that the writer did not write, such as the one the
+    run started from, are never removed.
+
+    With *asynchronous*, the host copies are queued and written from a
+    background thread, overlapping the time stepping. At most
+    *max_pending* restarts are queued, further writes wait for the queue to
+    drain. Errors of the background writes are raised on every rank by the
+    next call to :meth:`write`, :meth:`flush` or :meth:`close`, which are
+    collective in this mode, so no rank is left waiting in a shared write.
+
+    .. automethod:: __init__
+    .. automethod:: write
+    .. automethod:: flush
+    .. automethod:: close
+    """
+
+    def __init__(self, actx, comm, restart_format="pickle", dtype=np.float64,
+                 compression=None, keep_last=0, keep_interval=0,
+                 asynchronous=False, max_pending=2, logger=None):
+        """Start the background writer thread, if *asynchronous*."""
+        if compression is not None and restart_format == "pickle":
+            error_message = ("Compressed restarts require the binary or shared "
+                             "restart format")
+            raise RuntimeError(error_message)
+        self._actx = actx
+        self._comm = comm
+        self._restart_format = restart_format
+        self._compression = compression
+        self._keep_last = keep_last
+        self._keep_interval = keep_interval
+        # the steps and files of the restarts written so far, oldest first
+        self._written = []
+        # the collective writes of the background thread need their own
+        # communicator
+        self._write_comm = comm
+        if asynchronous and restart_format == "shared":
+            from mpi4py import MPI
+            if MPI.Query_thread() != MPI.THREAD_MULTIPLE:
+                error_message = ("Asynchronous shared restarts require "
+                                 "MPI_THREAD_MULTIPLE")
+                raise RuntimeError(error_message)
+            self._write_comm = comm.Dup()
+        self._dtype = dtype
+        self._logger = logger
+        self._mesh_filename = None
+        self._error = None
+        self._asynchronous = asynchronous
+        self._queue = None
+        if asynchronous:
+            self._queue = queue.Queue(maxsize=max_pending)
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _write_mesh(self, local_mesh, filename):
+        with open(filename + ".tmp", "wb") as f:
+            pickle.dump(local_mesh, f)
+        os.replace(filename + ".tmp", filename)
+
+    def _write(self, restart_data, filename, t_snapshot):
+        t_start = time.perf_counter()
+        rank = self._write_comm.Get_rank()
+        tmp_filename = filename + ".tmp"
+        if self._restart_format == "binary":
+            if self._mesh_filename is None:
+                self._mesh_filename = os.path.splitext(filename)[0] + "-mesh.pkl"
+                self._write_mesh(restart_data["local_mesh"], self._mesh_filename)
+            write_binary_restart(restart_data, tmp_filename, self._mesh_filename,
+                                 dtype=self._dtype, compression=self._compression)
+            os.replace(tmp_filename, filename)
+        elif self._restart_format == "shared":
+            if self._mesh_filename is None:
+                self._mesh_filename = (os.path.splitext(filename)[0]
+                                       + "-mesh-{rank:04d}.pkl")
+                self._write_mesh(restart_data["local_mesh"],
+                                 self._mesh_filename.format(rank=rank))
+            # returns once all of the ranks have written their part
+            write_shared_restart(self._write_comm, restart_data, tmp_filename,
+                                 self._mesh_filename, dtype=self._dtype,
+                                 compression=self._compression)
+            if rank == 0:
+                os.replace(tmp_filename, filename)
+        else:
+            with open(tmp_filename, "wb") as f:
+                _HostRestartPickler(f).dump(restart_data)
+            os.replace(tmp_filename, filename)
+        t_write = time.perf_counter() - t_start
+
+        if self._logger is not None and rank == 0:
+            size = os.path.getsize(filename)/1e6
+            self._logger.info(f"Restart {filename}: snapshot {t_snapshot:.3f} s, "
+                              f"write {t_write:.3f} s, {size:.1f} MB")
+
+        # a file written again counts once, as its latest write
+        self._written = [item for item in self._written if item[1] != filename]
+        self._written.append((restart_data["step"], filename))
+        self._remove_old_restarts()
+
+    def _remove_old_restarts(self):
+        if not self._keep_last:
+            return
+        # the shared file is removed by rank 0 only
+        remove = (self._restart_format != "shared"
+                  or self._write_comm.Get_rank() == 0)
+
+        kept = []
+        for i, (step, filename) in enumerate(self._written):
+            if (i >= len(self._written) - self._keep_last
+                    or (self._keep_interval and step % self._keep_interval == 0)):
+                kept.append((step, filename))
+            elif remove:
+                try:
+                    os.remove(filename)
+                except FileNotFoundError:
+                    pass
+        self._written = kept
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check_error(self):
+        error = self._error
+        failed = error is not None
+        # the ranks agree on whether to go on, so that a failure on one rank
+        # does not leave the others in the next collective write
+        if self._asynchronous:
+            from mpi4py import MPI
+            failed = self._comm.allreduce(failed, op=MPI.LOR)
+        if failed:
+            self._error = None
+            if error is None:
+                error_message = ("Asynchronous restart write failed on "
+                                 "another rank")
+                raise RuntimeError(error_message)
+            error_message = f"Asynchronous restart write failed: {error}"
+            raise RuntimeError(error_message) from error
+
+    def write(self, restart_data, filename):
+        """Write *restart_data* to *filename*, the arguments of
+        :func:`mirgecom.restart.write_restart_file`.
+        """
+        self._check_error()
+
+        # only the DOF arrays live on the device, numpy entries such as the
+        # element ids are already on the host
+        t_start = time.perf_counter()
+        host_data = {
+            key: (self._actx.to_numpy(value)
+                  if isinstance(value, (DOFArray, ConservedVars)) else value)
+            for key, value in restart_data.items()}
+        t_snapshot = time.perf_counter() - t_start
+
+        restart_path = os.path.dirname(filename)
+        if restart_path and self._comm.Get_rank() == 0:
+            os.makedirs(restart_path, exist_ok=True)
+        self._comm.barrier()
+
+        if self._queue is None:
+            self._write(host_data, filename, t_snapshot)
+        else:
+            self._queue.put((host_data, filename, t_snapshot))
+
+    def flush(self):
+        """Wait until the queued restarts are written."""
+        if self._queue is not None:
+            self._queue.join()
+        self._check_error()
+
+    def close(self):
+        """Write the queued restarts and stop the background thread."""
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        self._check_error()
@@ -0,0 +1 @@
+../../../../isolator_mesh.py
\ No newline at end of file
@@ -0,0 +1 @@
+../../../../isolator_init.py
\ No newline at end of file
@@ -0,0 +1 @@
+../../../../isolator_restart.py
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""Benchmark for the ACT-II initializer on the isolator meshes.
+
+Times the mesh read, the discretization and :class:`InitACTII` from
+:mod:`isolator_initializers` on each of the performance test meshes. The
+initialization is timed for the first call, which includes compilation
+with a lazy array context, and as the best of the repeated calls.
+
+Meshes that have not been generated yet (see data/makePerformanceMeshes.sh)
+are skipped.
+
+Usage: python init_benchmark.py [--meshes ../data/oneX ...] [--dim 2]
+                                [--order 1] [--repeat 3] [--lazy]
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import os
+import time
+import numpy as np
+import pyopencl as cl
+
+from meshmode.mesh.io import read_gmsh
+from mirgecom.discretization import create_discretization_collection
+from mirgecom.simutil import force_evaluation
+from mirgecom.eos import IdealSingleGas
+
+from isolator_initializers import InitACTII
+
+mesh_sizes = ["eigthX", "quarterX", "halfX", "oneX", "1p5X", "twoX", "threeX",
+              "fourX"]
+
+
+def make_initializer(dim, geometry_path):
+    geometry_bottom = np.loadtxt(os.path.join(geometry_path, "nozzleBottom.dat"),
+                                 comments="#", unpack=False)
+    geometry_top = np.loadtxt(os.path.join(geometry_path, "nozzleTop.dat"),
+                              comments="#", unpack=False)
+    # the isolator.py flow conditions
+    return InitACTII(dim=dim,
+                     geom_top=geometry_top, geom_bottom=geometry_bottom,
+                     P0=2.745e5, T0=2076.43,
+                     temp_wall=300, temp_sigma=2500, vel_sigma=2000)
+
+
+def run_benchmark(actx, mesh_path, bulk_init, eos, dim, order, repeat):
+    mesh_filename = os.path.join(mesh_path, "isolator.msh")
+    if not os.path.exists(mesh_filename):
+        print(f"\t{mesh_path}: no mesh, skipping")
+        return
+
+    t_start = time.perf_counter()
+    mesh = read_gmsh(mesh_filename, force_ambient_dim=dim)
+    t_mesh = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    dcoll = create_discretization_collection(actx, mesh, order=order)
+    nodes = force_evaluation(actx, actx.thaw(dcoll.nodes()))
+    t_discr = time.perf_counter() - t_start
+
+    def init():
+        cv = force_evaluation(actx, bulk_init(dcoll=dcoll, x_vec=nodes, eos=eos,
+                                              time=0))
+        actx.queue.finish()
+        return cv
+
+    t_start = time.perf_counter()
+    init()
+    t_first = time.perf_counter() - t_start
+
+    t_best = np.inf
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        init()
+        t_best = min(t_best, time.perf_counter() - t_start)
+
+    ndofs = dcoll.discr_from_dd("vol").ndofs
+    print(f"\t{os.path.basename(os.path.normpath(mesh_path)):<12s}"
+          f"{mesh.nelements:>10d}{ndofs:>12d}{t_mesh:12.4e}{t_discr:12.4e}"
+          f"{t_first:12.4e}{t_best:12.4e}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="ACT-II initializer benchmark")
+    parser.add_argument("--meshes", type=str, nargs="+",
+                        default=[f"../data/{size}" for size in mesh_sizes],
+                        help="directories containing isolator.msh")
+    parser.add_argument("--geometry", type=str, default="../data",
+                        help="directory containing the nozzle geometry files")
+    parser.add_argument("--dim", type=int, default=2,
+                        help="mesh dimension")
+    parser.add_argument("--order", type=int, default=1,
+                        help="discretization order")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of repetitions, the best is reported")
+    parser.add_argument("--lazy", action="store_true", default=False,
+                        help="enable lazy evaluation [OFF]")
+    args = parser.parse_args()
+
+    cl_ctx = cl.create_some_context()
+    queue = cl.CommandQueue(cl_ctx)
+
+    from mirgecom.simutil import get_reasonable_memory_pool
+    alloc = get_reasonable_memory_pool(cl_ctx, queue)
+
+    from grudge.array_context import get_reasonable_array_context_class
+    actx_class = get_reasonable_array_context_class(lazy=args.lazy,
+                                                    distributed=False)
+    if args.lazy:
+        actx = actx_class(queue, allocator=alloc)
+    else:
+        actx = actx_class(queue, allocator=alloc, force_device_scalars=True)
+
+    # the isolator.py working gas
+    gamma = 1.4
+    mf_o2 = 0.273
+    mw = 15.999*2*mf_o2 + 14.0067*2*(1.0 - mf_o2)
+    eos = IdealSingleGas(gamma=gamma, gas_const=8314.59/mw)
+
+    bulk_init = make_initializer(args.dim, args.geometry)
+
+    print(f"\n#### {actx.__class__.__name__}, dim = {args.dim}, "
+          f"order = {args.order} ####")
+    print(f"\t{'mesh':<12s}{'nelements':>10s}{'ndofs':>12s}{'read (s)':>12s}"
+          f"{'discr (s)':>12s}{'init 1st (s)':>12s}{'init (s)':>12s}")
+    for mesh_path in args.meshes:
+        run_benchmark(actx, mesh_path, bulk_init, eos, args.dim, args.order,
+                      args.repeat)
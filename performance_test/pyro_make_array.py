@@ -0,0 +1,98 @@
+"""Micro-benchmark for dense vs. object array assembly in the pyrometheus mech.
+
+Times :meth:`Thermochemistry._pyro_make_array` (dense stacking) against
+:meth:`Thermochemistry._pyro_make_object_array`, and the species/mixture
+thermo evaluation using either path, for NumPy bulk data.
+
+Usage: python pyro_make_array.py [--nodes 1e5 1e6 1e7] [--repeat 5]
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import timeit
+import numpy as np
+
+from uiuc import Thermochemistry
+
+
+class ObjectArrayThermochemistry(Thermochemistry):
+    """Mechanism forced onto the object array (non-stacking) path."""
+
+    def _pyro_is_dense(self, argument):
+        return False
+
+
+def best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def run_benchmark(nnodes, repeat):
+    rng = np.random.default_rng(seed=0)
+    temperature = rng.uniform(300., 3000., nnodes)
+    y = rng.uniform(0., 1., (7, nnodes))
+    y = y / np.sum(y, axis=0)
+
+    dense = Thermochemistry()
+    obj = ObjectArrayThermochemistry()
+    y_obj = obj._pyro_make_object_array(list(y))
+
+    res_list = list(dense.get_species_enthalpies_rt(temperature))
+
+    timings = {
+        "make_array": (
+            best_time(lambda: dense._pyro_make_array(res_list), repeat),
+            best_time(lambda: obj._pyro_make_object_array(res_list), repeat)),
+        "species_enthalpies_rt": (
+            best_time(lambda: dense.get_species_enthalpies_rt(temperature),
+                      repeat),
+            best_time(lambda: obj.get_species_enthalpies_rt(temperature),
+                      repeat)),
+        "mixture_cv_mass": (
+            best_time(lambda: dense.get_mixture_specific_heat_cv_mass(
+                temperature, y), repeat),
+            best_time(lambda: obj.get_mixture_specific_heat_cv_mass(
+                temperature, y_obj), repeat)),
+    }
+
+    print(f"\n#### nodes = {nnodes:.1e} ####")
+    print(f"\t{'quantity':<24s}{'dense (s)':>12s}{'object (s)':>12s}"
+          f"{'speedup':>10s}")
+    for name, (t_dense, t_obj) in timings.items():
+        print(f"\t{name:<24s}{t_dense:12.4e}{t_obj:12.4e}"
+              f"{t_obj/t_dense:10.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Pyrometheus dense vs. object array micro-benchmark")
+    parser.add_argument("--nodes", type=float, nargs="+",
+                        default=[1e5, 1e6, 1e7],
+                        help="number of nodes to time")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of repetitions, the best is reported")
+    args = parser.parse_args()
+
+    for nnodes in args.nodes:
+        run_benchmark(int(nnodes), args.repeat)
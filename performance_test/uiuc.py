@@ -0,0 +1 @@
+../pyro_mechs/uiuc.py
\ No newline at end of file
@@ -80,6 +80,7 @@ from mirgecom.boundary import (
 from mirgecom.eos import IdealSingleGas
 from mirgecom.transport import SimpleTransport
 from mirgecom.gas_model import GasModel, make_fluid_state
+from isolator_restart import get_restart_filename, read_restart_file
 
 
 @mpi_entry_point
@@ -143,10 +144,8 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
         restart_path + "{cname}-{step:06d}-{rank:04d}.pkl"
     )
     if restart_filename:  # read the grid from restart data
-        restart_filename = f"{restart_filename}-{rank:04d}.pkl"
-
-        from mirgecom.restart import read_restart_data
-        restart_data = read_restart_data(actx, restart_filename)
+        restart_filename = get_restart_filename(restart_filename, rank)
+        restart_data = read_restart_file(actx, restart_filename, rank)
         current_step = restart_data["step"]
         current_t = restart_data["t"]
         local_mesh = restart_data["local_mesh"]
@@ -154,7 +153,7 @@ def main(ctx_factory=cl.create_some_context, restart_filename=None,
         global_nelements = restart_data["global_nelements"]
         restart_order = int(restart_data["order"])
 
-        assert restart_data["nparts"] == nparts
+        assert restart_data["num_parts"] == nparts
     else:
         error_message = "Restart file not specified"
         raise RuntimeError(error_message)
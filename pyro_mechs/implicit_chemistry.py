@@ -0,0 +1,166 @@
+"""
+.. autofunction:: implicit_chemistry_step
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+def _solve_pointwise(a, b):
+    """Solve the small linear system ``a x = b`` at every node.
+
+    *a* is a list of rows and *b* a list, whose entries are bulk data. The
+    system is solved by Gaussian elimination without pivoting, which only
+    uses arithmetic and so works for any bulk array type, including lazy
+    data. The implicit chemistry matrices have a dominant positive diagonal.
+    """
+    n = len(b)
+    a = [list(row) for row in a]
+    b = list(b)
+
+    inv_pivot = [None]*n
+    for k in range(n):
+        inv_pivot[k] = 1.0 / a[k][k]
+        for i in range(k+1, n):
+            f = a[i][k]*inv_pivot[k]
+            for j in range(k+1, n):
+                a[i][j] = a[i][j] - f*a[k][j]
+            b[i] = b[i] - f*b[k]
+
+    x = [None]*n
+    for i in reversed(range(n)):
+        rhs = b[i]
+        for j in range(i+1, n):
+            rhs = rhs - a[i][j]*x[j]
+        x[i] = rhs*inv_pivot[i]
+    return x
+
+
+def implicit_chemistry_step(pyro_mech, rho, temperature, mass_fractions, dt, *,
+                            num_substeps=1, newton_iter=4):
+    """Advance the chemistry of a constant volume, adiabatic reactor by *dt*.
+
+    Each node is integrated with backward Euler, using *num_substeps*
+    substeps of *newton_iter* Newton iterations each. The unknowns are the
+    extents of the reactions over the substep, so that the species
+    concentrations follow from the stoichiometry, and the temperature follows
+    from the conservation of the mixture internal energy.
+
+    The Newton matrix is built from
+    :meth:`get_net_rates_of_progress_and_jacobian` of *pyro_mech* and solved
+    pointwise by :func:`_solve_pointwise`. The temperature dependence of the
+    rates is lagged within each iteration, as the full linearization through
+    ignition is indefinite (thermal runaway) and Newton then heads away from
+    the burnt state. Steps are damped to keep the concentrations positive and
+    the temperature change bounded. The damping lets a concentration that is
+    already zero go below zero by up to the Jacobian floor of *pyro_mech*,
+    so that a step is never blocked entirely, and such concentrations are
+    clipped to zero. To conserve mass, the mass fractions are rescaled to
+    the sum of the input mass fractions at the end of the step.
+
+    Density and internal energy are unchanged by the step. Returns a tuple
+    ``(mass_fractions, temperature)`` at the end of the step, where the
+    temperature is the Newton estimate, suitable as a temperature seed.
+    """
+    usr_np = pyro_mech.usr_np
+    nspecies = pyro_mech.num_species
+    nreactions = pyro_mech.num_reactions
+    nu = pyro_mech.reaction_nu.tolist()
+    wts = pyro_mech.wts.tolist()
+    iwts = pyro_mech.iwts.tolist()
+
+    tiny = 1.0e-300
+    max_decrease = 0.9
+    max_dtemp = 0.5
+    conc_floor = pyro_mech.jacobian_conc_floor
+
+    def minimum(a, b):
+        return usr_np.where(usr_np.less(a, b), a, b)
+
+    def nonnegative(c):
+        return usr_np.where(usr_np.greater(c, 0*c), c, 0*c)
+
+    def internal_energy_r(c, t):
+        # volumetric internal energy over the gas constant
+        e0_rt = pyro_mech.get_species_enthalpies_rt(t) - 1.0
+        return sum(c[i]*t*e0_rt[i] for i in range(nspecies)), e0_rt
+
+    def stoich(k, j):
+        return nu[k][j] != 0
+
+    c = [nonnegative(iwts[i]*rho*mass_fractions[i]) for i in range(nspecies)]
+    t = temperature
+    energy_r, _ = internal_energy_r(c, t)
+    sub_dt = dt / num_substeps
+
+    for _ in range(num_substeps):
+        c_prev = c
+        extent = [0*t for _ in range(nreactions)]
+        for _ in range(newton_iter):
+            r_net, dq_dc, _ = \
+                pyro_mech.get_net_rates_of_progress_and_jacobian(t, c)
+            e_r, e0_rt = internal_energy_r(c, t)
+            cv_r = pyro_mech.get_species_specific_heats_r(t) - 1.0
+
+            # Newton update of the extents, at the current temperature
+            a = [[(1.0 if i == k else 0.0)
+                  - sub_dt*sum(dq_dc[i][j]*nu[k][j] for j in range(nspecies)
+                               if stoich(k, j))
+                  for k in range(nreactions)]
+                 for i in range(nreactions)]
+            b = [sub_dt*r_net[i] - extent[i] for i in range(nreactions)]
+            dx = _solve_pointwise(a, b)
+
+            # linearized temperature update from the energy balance
+            de_dx = [sum(t*e0_rt[j]*nu[k][j] for j in range(nspecies)
+                         if stoich(k, j))
+                     for k in range(nreactions)]
+            mix_cv_r = sum(c[j]*cv_r[j] for j in range(nspecies))
+            dtemp = (energy_r - e_r
+                     - sum(de_dx[k]*dx[k] for k in range(nreactions)))/mix_cv_r
+
+            # damp the step to keep the concentrations positive and the
+            # temperature change bounded
+            alpha = 1.0 + 0*t
+            for j in range(nspecies):
+                if not any(stoich(k, j) for k in range(nreactions)):
+                    continue
+                dc = sum(nu[k][j]*dx[k] for k in range(nreactions)
+                         if stoich(k, j))
+                decrease = usr_np.where(usr_np.less(dc, -tiny), -dc, tiny)
+                alpha = minimum(alpha, (max_decrease*c[j] + conc_floor)/decrease)
+            abs_dtemp = usr_np.where(usr_np.less(dtemp, 0*t), -dtemp, dtemp)
+            alpha = minimum(alpha, max_dtemp*t/(abs_dtemp + tiny))
+
+            extent = [extent[k] + alpha*dx[k] for k in range(nreactions)]
+            c = [nonnegative(c_prev[j] + sum(nu[k][j]*extent[k]
+                                             for k in range(nreactions)
+                                             if stoich(k, j)))
+                 for j in range(nspecies)]
+            t = t + alpha*dtemp
+
+    # restore the mass lost to the clipping
+    y = [wts[i]*c[i]/rho for i in range(nspecies)]
+    scale = sum(mass_fractions[i] for i in range(nspecies))/sum(y)
+    return pyro_mech.make_array([scale*y[i] for i in range(nspecies)]), t
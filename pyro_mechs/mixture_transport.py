@@ -0,0 +1,89 @@
+"""
+.. autoclass:: MixtureAveragedTransport
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from mirgecom.transport import TransportModel, GasTransportVars
+
+
+class MixtureAveragedTransport(TransportModel):
+    r"""Mixture-averaged transport from the fits of a pyrometheus mechanism.
+
+    The viscosity follows from Wilke's mixing rule, the thermal conductivity
+    from the mean of the arithmetic and harmonic mole fraction averages and
+    the species diffusivities from the mixture-averaged approximation, all
+    evaluated by *pyro_mech* (see
+    :meth:`uiuc.Thermochemistry.get_mixture_transport_mixavg`). The bulk
+    viscosity is taken as $\alpha\mu$, as in
+    :class:`mirgecom.transport.PowerLawTransport`.
+
+    .. automethod:: __init__
+    .. automethod:: bulk_viscosity
+    .. automethod:: viscosity
+    .. automethod:: volume_viscosity
+    .. automethod:: thermal_conductivity
+    .. automethod:: species_diffusivity
+    .. automethod:: transport_vars
+    """
+
+    def __init__(self, pyro_mech, alpha=0.6):
+        """Initialize the transport model for the mechanism *pyro_mech*."""
+        self._pyro_mech = pyro_mech
+        self._alpha = alpha
+
+    def bulk_viscosity(self, cv, dv, eos=None):
+        r"""Get the bulk viscosity for the gas, $\mu_{B} = \alpha\mu$."""
+        return self._alpha*self.viscosity(cv, dv)
+
+    def viscosity(self, cv, dv, eos=None):
+        r"""Get the gas dynamic viscosity, $\mu$."""
+        return self._pyro_mech.get_mixture_viscosity_mixavg(
+            dv.temperature, cv.species_mass_fractions)
+
+    def volume_viscosity(self, cv, dv, eos=None):
+        r"""Get the 2nd viscosity coefficent, $\lambda = (\alpha - 2/3)\mu$."""
+        return (self._alpha - 2.0/3.0)*self.viscosity(cv, dv)
+
+    def thermal_conductivity(self, cv, dv, eos=None):
+        r"""Get the gas thermal conductivity, $\kappa$."""
+        return self._pyro_mech.get_mixture_thermal_conductivity_mixavg(
+            dv.temperature, cv.species_mass_fractions)
+
+    def species_diffusivity(self, cv, dv, eos=None):
+        r"""Get the vector of species diffusivities, ${d}_{i}$."""
+        return self._pyro_mech.get_species_mass_diffusivities_mixavg(
+            dv.pressure, dv.temperature, cv.species_mass_fractions)
+
+    def transport_vars(self, cv, dv, eos=None):
+        """Compute the transport properties, sharing the intermediate
+        quantities of the mixing rules between them.
+        """
+        mu, kappa, diffusivity = self._pyro_mech.get_mixture_transport_mixavg(
+            dv.pressure, dv.temperature, cv.species_mass_fractions)
+        return GasTransportVars(
+            bulk_viscosity=self._alpha*mu,
+            viscosity=mu,
+            thermal_conductivity=kappa,
+            species_diffusivity=diffusivity)
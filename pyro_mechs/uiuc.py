@@ -20,7 +20,55 @@ class Thermochemistry:
     .. attribute:: gas_constant
     .. attribute:: species_names
     .. attribute:: species_indices
+    .. attribute:: nasa_t_mid
 
+        Temperature (K) separating the low and high NASA-7 fit ranges.
+
+    .. attribute:: nasa_coeffs
+
+        NASA-7 coefficients as an array of shape
+        ``(num_species, 2, 7)``, indexed by species, temperature range
+        (low, high) and coefficient.
+
+    .. attribute:: arrhenius_params
+
+        Arrhenius parameters as an array of shape ``(num_reactions, 3)``, so
+        that the log of the forward rate coefficients is the product with
+        ``(1, log(T), 1/T)``. The columns hold ``log(A)``, the temperature
+        exponent ``b`` and ``-Ea/R``.
+
+    .. attribute:: reaction_nu
+
+        Net stoichiometric coefficients (products minus reactants) as an
+        array of shape ``(num_reactions, num_species)``.
+
+    .. attribute:: reaction_reversible
+
+        Boolean array of shape ``(num_reactions,)``.
+
+    .. attribute:: jacobian_conc_floor
+
+        Concentration (kmol/m^3) below which the derivatives of fractional
+        reaction orders are evaluated at the floor value, avoiding their
+        singularity at zero.
+
+    .. attribute:: transport_visc_coeffs
+
+        Species viscosity fits of shape ``(num_species, 5)``, ascending
+        powers of ``log(T)``, such that ``mu_i = sqrt(T)*poly_i**2``.
+
+    .. attribute:: transport_cond_coeffs
+
+        Species thermal conductivity fits of shape ``(num_species, 5)``, such
+        that ``lambda_i = sqrt(T)*poly_i``.
+
+    .. attribute:: transport_diff_pair_coeffs
+
+        Binary diffusivity fits, one row per species pair ``i <= j`` in the
+        order of :func:`numpy.triu_indices`, such that
+        ``p*D_ij = T**1.5*poly_ij``.
+
+    .. automethod:: make_array
     .. automethod:: get_specific_gas_constant
     .. automethod:: get_density
     .. automethod:: get_pressure
@@ -30,12 +78,28 @@ class Thermochemistry:
     .. automethod:: get_mixture_specific_heat_cv_mass
     .. automethod:: get_mixture_enthalpy_mass
     .. automethod:: get_mixture_internal_energy_mass
+    .. automethod:: get_mixture_thermo
     .. automethod:: get_species_specific_heats_r
     .. automethod:: get_species_enthalpies_rt
     .. automethod:: get_species_entropies_r
     .. automethod:: get_species_gibbs_rt
     .. automethod:: get_equilibrium_constants
+    .. automethod:: get_temperature_update_energy
     .. automethod:: get_temperature
+    .. automethod:: get_temperature_and_residual
+    .. automethod:: get_fwd_rate_coefficients
+    .. automethod:: get_net_rates_of_progress
+    .. automethod:: get_net_production_rates
+    .. automethod:: get_net_rates_of_progress_and_jacobian
+    .. automethod:: get_net_production_rates_and_jacobian
+    .. automethod:: get_mole_fractions
+    .. automethod:: get_species_viscosities
+    .. automethod:: get_species_thermal_conductivities
+    .. automethod:: get_species_binary_mass_diffusivities
+    .. automethod:: get_mixture_viscosity_mixavg
+    .. automethod:: get_mixture_thermal_conductivity_mixavg
+    .. automethod:: get_species_mass_diffusivities_mixavg
+    .. automethod:: get_mixture_transport_mixavg
     .. automethod:: __init__
     """
 
@@ -51,6 +115,7 @@ class Thermochemistry:
             - ``usr_np.log(X)`` (like :data:`numpy.log`)
             - ``usr_np.log10(X)`` (like :data:`numpy.log10`)
             - ``usr_np.exp(X)`` (like :data:`numpy.exp`)
+            - ``usr_np.sqrt(X)`` (like :data:`numpy.sqrt`)
             - ``usr_np.where(X > 0, X_yes, X_no)`` (like :func:`numpy.where`)
             - ``usr_np.linalg.norm(X, np.inf)`` (like :func:`numpy.linalg.norm`)
 
@@ -80,11 +145,236 @@ class Thermochemistry:
         self.wts = np.array([28.054, 31.998, 44.009, 28.009999999999998, 18.015, 2.016, 28.014])
         self.iwts = 1/self.wts
 
+        # NASA-7 polynomial coefficients (a1, ..., a7), indexed as
+        # [species, temperature range, coefficient]. Range 0 is valid below
+        # nasa_t_mid and range 1 above it.
+        self.nasa_t_mid = 1000.0
+        self.nasa_coeffs = np.array([
+            # C2H4
+            [[3.95920148, -0.00757052247, 5.70990292e-05, -6.91588753e-08,
+              2.69884373e-11, 5089.77593, 4.09733096],
+             [2.03611116, 0.0146454151, -6.71077915e-06, 1.47222923e-09,
+              -1.25706061e-13, 4939.88614, 10.3053693]],
+            # O2
+            [[3.78245636, -0.00299673416, 9.84730201e-06, -9.68129509e-09,
+              3.24372837e-12, -1063.94356, 3.65767573],
+             [3.28253784, 0.00148308754, -7.57966669e-07, 2.09470555e-10,
+              -2.16717794e-14, -1088.45772, 5.45323129]],
+            # CO2
+            [[2.35677352, 0.00898459677, -7.12356269e-06, 2.45919022e-09,
+              -1.43699548e-13, -48371.9697, 9.90105222],
+             [3.85746029, 0.00441437026, -2.21481404e-06, 5.23490188e-10,
+              -4.72084164e-14, -48759.166, 2.27163806]],
+            # CO
+            [[3.57953347, -0.00061035368, 1.01681433e-06, 9.07005884e-10,
+              -9.04424499e-13, -14344.086, 3.50840928],
+             [2.71518561, 0.00206252743, -9.98825771e-07, 2.30053008e-10,
+              -2.03647716e-14, -14151.8724, 7.81868772]],
+            # H2O
+            [[4.19864056, -0.0020364341, 6.52040211e-06, -5.48797062e-09,
+              1.77197817e-12, -30293.7267, -0.849032208],
+             [3.03399249, 0.00217691804, -1.64072518e-07, -9.7041987e-11,
+              1.68200992e-14, -30004.2971, 4.9667701]],
+            # H2
+            [[2.34433112, 0.00798052075, -1.9478151e-05, 2.01572094e-08,
+              -7.37611761e-12, -917.935173, 0.683010238],
+             [3.3372792, -4.94024731e-05, 4.99456778e-07, -1.79566394e-10,
+              2.00255376e-14, -950.158922, -3.20502331]],
+            # N2
+            [[3.298677, 0.0014082404, -3.963222e-06, 5.641515e-09, -2.444854e-12,
+              -1020.8999, 3.950372],
+             [2.92664, 0.0014879768, -5.68476e-07, 1.0097038e-10, -6.753351e-15,
+              -922.7977, 5.980528]],
+            ])
+
+        # Each species thermo function is tabulated as (b0, ..., b6) for
+        #   b0 + b1*T + b2*T**2 + b3*T**3 + b4*T**4 + b5/T + b6*log(T)
+        a = self.nasa_coeffs
+        zero = np.zeros_like(a[..., 0])
+        self._cp_r_table = np.stack(
+            [a[..., 0], a[..., 1], a[..., 2], a[..., 3], a[..., 4], zero, zero],
+            axis=-1)
+        self._h_rt_table = np.stack(
+            [a[..., 0], a[..., 1]/2, a[..., 2]/3, a[..., 3]/4, a[..., 4]/5,
+             a[..., 5], zero],
+            axis=-1)
+        self._s_r_table = np.stack(
+            [a[..., 6], a[..., 1], a[..., 2]/2, a[..., 3]/3, a[..., 4]/4,
+             zero, a[..., 0]],
+            axis=-1)
+        # g/RT = h/RT - s/R, so the Gibbs energies take a single pass
+        self._g_rt_table = self._h_rt_table - self._s_r_table
+
+        self.arrhenius_params = np.array([
+            [26.594857854425133, 0.0, -17864.293439206183],
+            [12.693776816787125, 0.7, -6038.634401985189],
+            [18.302572655472037, 0.0, -17612.683672456802],
+            ])
+        self.reaction_nu = np.array([
+            [-1.0, -1.0, 0.0, 2.0, 0.0, 2.0, 0.0],
+            [0.0, -0.5, 1.0, -1.0, 0.0, 0.0, 0.0],
+            [0.0, -0.5, 0.0, 0.0, 1.0, -1.0, 0.0],
+            ])
+        self.reaction_reversible = np.array([False, True, True])
+        self.jacobian_conc_floor = 1.0e-20
+
+        # Transport fits in log(T), ascending powers, over 300-3500 K. Species
+        # properties from Chapman-Enskog theory with the GRI-Mech 3.0
+        # Lennard-Jones parameters, conductivities by the modified Eucken
+        # correction.
+        self.transport_visc_coeffs = np.array([
+            [0.0008420088224979875, -0.0009810962013121433, 0.00036044184581091314,
+             -4.3744160622354894e-05, 1.8024257962361855e-06],
+            [-0.00910532218591301, 0.005251793281957111, -0.0010260681998139924,
+             9.035328522608053e-05, -2.970328892900013e-06],
+            [0.00012085633454826115, -0.0006206274488821603, 0.00031186476446041193,
+             -4.151643260530838e-05, 1.8044548741430205e-06],
+            [-0.008167023489817888, 0.004782875641543484, -0.0009463755970906028,
+             8.439762657974592e-05, -2.809519828793906e-06],
+            [0.025920494616779987, -0.015111080743250162, 0.003302867174686988,
+             -0.0003113952223881478, 1.0831850918961293e-05],
+            [0.00016464475025502914, 0.0002066131629052434, -3.447144822134022e-05,
+             3.338567491803078e-06, -1.1352248784347695e-07],
+            [-0.008207054100688466, 0.004811149644763851, -0.0009525969051878662,
+             8.50101326617575e-05, -2.8317738609809766e-06],
+            ])
+        self.transport_cond_coeffs = np.array([
+            [0.20310388261316734, -0.11156831080882156, 0.022261259247374626,
+             -0.0019005410049378303, 5.935729021288754e-05],
+            [0.06323762787662987, -0.038341428994688675, 0.008713287339008786,
+             -0.0008652555380354288, 3.214255601971664e-05],
+            [0.09061761704780111, -0.05351870710577633, 0.011621994944295898,
+             -0.0010926065563830435, 3.8016042793044244e-05],
+            [0.04051327545044606, -0.021683930371272676, 0.0043469388649863385,
+             -0.000374102101763146, 1.1931728753100745e-05],
+            [-0.18623741557371717, 0.12042511827534588, -0.02892299228461395,
+             0.0030582137709779314, -0.00011843642541935158],
+            [-0.694314769727465, 0.4137141181043832, -0.09066753383125604,
+             0.008755772095278837, -0.000312107526712354],
+            [0.014590876056491836, -0.006208594795360665, 0.0009144543321112849,
+             -3.864551290286132e-05, -2.5590630067597696e-07],
+            ])
+        self.transport_diff_pair_coeffs = np.array([
+            # C2H4-C2H4
+            [0.0006940502547063561, -0.0007265205184051101, 0.00022284272576854003,
+             -2.4813409629383308e-05, 9.75252972847583e-07],
+            # C2H4-O2
+            [-0.0019123705578603684, 0.0008145481292402423, -0.00010350358620944897,
+             5.421877774200436e-06, -5.78610146900147e-08],
+            # C2H4-CO2
+            [-0.00019491041205996416, -0.0001976933174832422, 0.00010742185032730104,
+             -1.386349181637359e-05, 5.904442418430197e-07],
+            # C2H4-CO
+            [-0.001775616178985271, 0.0007518333981853212, -9.24107295198732e-05,
+             4.488332365856374e-06, -2.6871159113117753e-08],
+            # C2H4-H2O
+            [0.011321377486053484, -0.006936441149026955, 0.0015615042480961205,
+             -0.00015034788231722083, 5.343072848675377e-06],
+            # C2H4-H2
+            [-0.005447072922630708, 0.002620659918012793, -0.00037710696737905413,
+             2.3871925084136114e-05, -4.302722097712693e-07],
+            # C2H4-N2
+            [-0.0017820373273179316, 0.0007541670897099168, -9.245520313089144e-05,
+             4.4625156736695775e-06, -2.4928424289298345e-08],
+            # O2-O2
+            [-0.0017254169108841355, 0.0008066405741947311, -0.00010852155449755987,
+             6.1430964198076446e-06, -7.419815621662157e-08],
+            # O2-CO2
+            [-0.0016605019803265068, 0.0006997504475445284, -8.395643756099028e-05,
+             3.84145644581347e-06, -7.920901040757919e-09],
+            # O2-CO
+            [-0.0018391462990060062, 0.0008887746549810483, -0.00012917996292977058,
+             8.301621855966176e-06, -1.5589162903102706e-07],
+            # O2-H2O
+            [-0.0014442978581501466, 0.00022484373723991193, 8.143946812709396e-05,
+             -1.518499764405067e-05, 7.437741509174306e-07],
+            # O2-H2
+            [-0.011395854518737805, 0.006482473964664679, -0.0012557040693171645,
+             0.00011150407012511097, -3.6325423652207154e-06],
+            # O2-N2
+            [-0.0018647091134804405, 0.0009029457362745118, -0.00013183319153060736,
+             8.528834544204491e-06, -1.629767360013537e-07],
+            # CO2-CO2
+            [-0.0008044570217260042, 0.00017965640778867275, 2.239927721919889e-05,
+             -5.646871798412524e-06, 2.9776698548913947e-07],
+            # CO2-CO
+            [-0.0015298446127363819, 0.0006381846649506346, -7.26471173385173e-05,
+             2.86365119516166e-06, 2.5238873181379838e-08],
+            # CO2-H2O
+            [0.009175511851309942, -0.005740668222113269, 0.0013155098006942835,
+             -0.0001280965404147181, 4.5937819882425185e-06],
+            # CO2-H2
+            [-0.006571892076516829, 0.003306594193653521, -0.0005239269823466012,
+             3.782213872670438e-05, -9.172740136173954e-07],
+            # CO2-N2
+            [-0.0015348269300327192, 0.0006398297969375441, -7.256658377727595e-05,
+             2.827381698167847e-06, 2.7520248865254843e-08],
+            # CO-CO
+            [-0.0019692791374238193, 0.0009800951943079725, -0.00015184168000651578,
+             1.0656938631727093e-05, -2.4490462669278266e-07],
+            # CO-H2O
+            [-0.002071078769655811, 0.0006171893979860305, -7.4445082386775316e-06,
+             -6.573338554525959e-06, 4.3679114499054945e-07],
+            # CO-H2
+            [-0.01069132150974989, 0.006128339048961598, -0.0011947678915375862,
+             0.00010678668283066779, -3.5017863304984584e-06],
+            # CO-N2
+            [-0.0019964974021883905, 0.0009953838523224044, -0.00015477547736526798,
+             1.0913761375810994e-05, -2.5313563968852774e-07],
+            # H2O-H2O
+            [0.029417538134260547, -0.0169967154563532, 0.0036197138515497483,
+             -0.0003329068312638157, 1.133997377730675e-05],
+            # H2O-H2
+            [-0.007861121220951473, 0.0032450735097922134, -0.0003470834538598017,
+             1.0920219324108973e-05, 3.138536969996967e-07],
+            # H2O-N2
+            [-0.0021290962448748535, 0.0006459134562196855, -1.2455534682771449e-05,
+             -6.170561296142741e-06, 4.2474672939381906e-07],
+            # H2-H2
+            [-0.00802359167217222, 0.005251517146257363, -0.0010296260782741654,
+             9.596958956815093e-05, -3.2056382689077463e-06],
+            # H2-N2
+            [-0.010775766517324986, 0.006179757393094601, -0.0012052357480380029,
+             0.00010776387300203197, -3.5351636579156234e-06],
+            # N2-N2
+            [-0.0020241504973925748, 0.0010109226317079221, -0.00015775961266889431,
+             1.1175178209302159e-05, -2.6152145506246504e-07],
+            ])
+
+        # Wilke mixing rule factors, phi_ij = k_ij*(1 + c_ij*q_i/q_j)**2 with
+        # q_i the viscosity fit, as sqrt(mu_i/mu_j) = q_i/q_j
+        w_ratio = self.wts[:, np.newaxis] / self.wts[np.newaxis, :]
+        self._wilke_k = 1/np.sqrt(8*(1 + w_ratio))
+        self._wilke_c = w_ratio**-0.25
+
+        # index into the pair table for each (i, j), both orders
+        pair_i, pair_j = np.triu_indices(self.num_species)
+        self._diff_pair_index = np.empty((self.num_species, self.num_species),
+                                         dtype=np.int64)
+        self._diff_pair_index[pair_i, pair_j] = np.arange(len(pair_i))
+        self._diff_pair_index[pair_j, pair_i] = np.arange(len(pair_i))
+
     def _pyro_zeros_like(self, argument):
         # FIXME: This is imperfect, as a NaN will stay a NaN.
         return 0 * argument
 
     def _pyro_make_array(self, res_list):
+        """Assemble per-species (or per-reaction) results into one array.
+
+        If all entries are NumPy bulk data or scalars, they are broadcast to a
+        common shape and stacked into a dense :class:`numpy.ndarray` with the
+        species (or reaction) index as the leading axis. Otherwise, e.g. for
+        :class:`meshmode.dof_array.DOFArray` entries, an object array is made
+        by :meth:`_pyro_make_object_array`.
+        """
+
+        if all(self._pyro_is_dense(e) for e in res_list):
+            return np.stack(np.broadcast_arrays(*res_list)).astype(np.float64,
+                                                                   copy=False)
+
+        return self._pyro_make_object_array(res_list)
+
+    def _pyro_make_object_array(self, res_list):
         """This works around (e.g.) numpy.exp not working with object
         arrays of numpy scalars. It defaults to making object arrays, however
         if an array consists of all scalars, it makes a "plain old"
@@ -97,7 +387,7 @@ class Thermochemistry:
         from numbers import Number
         all_numbers = all(isinstance(e, Number) for e in res_list)
 
-        dtype = np.float64 if all_numbers else np.object
+        dtype = np.float64 if all_numbers else object
         result = np.empty((len(res_list),), dtype=dtype)
 
         # 'result[:] = res_list' may look tempting, however:
@@ -107,6 +397,141 @@ class Thermochemistry:
 
         return result
 
+    def _pyro_is_dense(self, argument):
+        """Return *True* if *argument* is NumPy bulk data (or a scalar) that can
+        be evaluated for all species at once by broadcasting.
+        """
+
+        from numbers import Number
+        if isinstance(argument, Number):
+            return True
+        return isinstance(argument, np.ndarray) and argument.dtype != object
+
+    def _pyro_matvec(self, matrix, vector):
+        """Return the product of the constant *matrix* with *vector*, a
+        sequence of bulk data.
+
+        NumPy bulk data is contracted with a single :func:`numpy.tensordot`.
+        Otherwise, each row is summed over the nonzero entries of *matrix*.
+        """
+
+        if all(self._pyro_is_dense(v) for v in vector):
+            return np.tensordot(matrix, np.stack(np.broadcast_arrays(*vector)),
+                                axes=(1, 0))
+
+        zeros = self._pyro_zeros_like(vector[0])
+        return self._pyro_make_array([
+            sum((m_ij*v_j for m_ij, v_j in zip(row, vector) if m_ij), zeros)
+            for row in matrix.tolist()])
+
+    def _pyro_eval_nasa7(self, table, temperature, log_t=None, inv_t=None):
+        """Evaluate the species function described by *table* for all species.
+
+        Each entry ``table[i, r]`` holds ``(b0, ..., b6)`` for species *i* in
+        temperature range *r* and describes
+        ``b0 + T*(b1 + T*(b2 + T*(b3 + T*b4))) + b5/T + b6*log(T)``, which is
+        evaluated in Horner form. *log_t* and *inv_t* may be passed if they
+        are already known.
+
+        For NumPy bulk data, the nodes are split by temperature range, which all
+        species share, so that each node is evaluated once with the
+        coefficients of its own range, and the results are written into a dense
+        array of shape ``(num_species,) + temperature.shape``. Other bulk array
+        types evaluate both ranges per species and select the result with
+        ``usr_np.where``.
+        """
+
+        has_log = bool(np.any(table[..., 6]))
+
+        def horner(b, t, log_t, inv_t):
+            result = b[0] + t*(b[1] + t*(b[2] + t*(b[3] + t*b[4])))
+            if b[5]:
+                result = result + b[5]*inv_t
+            if b[6]:
+                result = result + b[6]*log_t
+            return result
+
+        if self._pyro_is_dense(temperature):
+            t = np.asarray(temperature, dtype=np.float64)
+            t_flat = t.reshape(-1)
+            is_high = t_flat > self.nasa_t_mid
+
+            result = np.empty((self.num_species, t_flat.size))
+            for r, nodes in ((0, ~is_high), (1, is_high)):
+                nodes = np.flatnonzero(nodes)
+                if not nodes.size:
+                    continue
+                # with all nodes in one range, the rows are written directly
+                whole = nodes.size == t_flat.size
+                t_r = t_flat if whole else t_flat[nodes]
+                scratch = None if whole else np.empty(nodes.size)
+                log_t_r = None
+                if has_log:
+                    log_t_r = (np.log(t_r) if log_t is None
+                               else np.reshape(log_t, -1)[nodes])
+                inv_t_r = (1.0 / t_r if inv_t is None
+                           else np.reshape(inv_t, -1)[nodes])
+
+                for i in range(self.num_species):
+                    # in-place Horner, avoids a fresh temporary per operation
+                    b = table[i, r].tolist()
+                    row = result[i] if whole else scratch
+                    np.multiply(t_r, b[4], out=row)
+                    for k in (3, 2, 1):
+                        row += b[k]
+                        row *= t_r
+                    row += b[0]
+                    if b[5]:
+                        row += b[5]*inv_t_r
+                    if b[6]:
+                        row += b[6]*log_t_r
+                    if not whole:
+                        result[i, nodes] = row
+
+            return result.reshape((self.num_species,) + t.shape)
+
+        if has_log and log_t is None:
+            log_t = self.usr_np.log(temperature)
+        if inv_t is None:
+            inv_t = 1.0 / temperature
+        is_high = self.usr_np.greater(temperature, self.nasa_t_mid)
+        return self._pyro_make_array([
+            self.usr_np.where(
+                is_high,
+                horner(table[i, 1].tolist(), temperature, log_t, inv_t),
+                horner(table[i, 0].tolist(), temperature, log_t, inv_t))
+            for i in range(self.num_species)])
+
+    def _pyro_eval_log_poly(self, coeffs, log_t, scale=None):
+        """Evaluate the transport fits *coeffs* of shape ``(n, degree+1)``,
+        polynomials in *log_t* in ascending powers, each multiplied by *scale*
+        if given, and return an array of shape ``(n,) + log_t.shape``.
+
+        NumPy bulk data is evaluated for all fits at once, otherwise each fit
+        is evaluated in Horner form.
+        """
+
+        if self._pyro_is_dense(log_t) and (scale is None
+                                            or self._pyro_is_dense(scale)):
+            log_t = np.asarray(log_t, dtype=np.float64)
+            c = coeffs.T.reshape(coeffs.T.shape + (1,)*log_t.ndim)
+            result = c[-1]*log_t
+            for c_k in c[-2:0:-1]:
+                result += c_k
+                result *= log_t
+            result += c[0]
+            if scale is not None:
+                result *= scale
+            return result
+
+        def horner(b):
+            result = b[-1]
+            for b_k in b[-2::-1]:
+                result = b_k + log_t*result
+            return result if scale is None else scale*result
+
+        return self._pyro_make_array([horner(b) for b in coeffs.tolist()])
+
     def _pyro_norm(self, argument, normord):
         """This works around numpy.linalg norm not working with scalars.
 
@@ -127,6 +552,13 @@ class Thermochemistry:
     def species_index(self, species_name):
         return self.species_indices[species_name]
 
+    def make_array(self, res_list):
+        """Return the per-species (or per-reaction) bulk data in *res_list* as
+        one array, dense for NumPy data and an object array otherwise, as the
+        mechanism returns its own results.
+        """
+        return self._pyro_make_array(res_list)
+
     def get_specific_gas_constant(self, mass_fractions):
         return self.gas_constant * (
                     + self.iwts[0]*mass_fractions[0]
@@ -160,6 +592,10 @@ class Thermochemistry:
                 )
 
     def get_concentrations(self, rho, mass_fractions):
+        if self._pyro_is_dense(mass_fractions):
+            # species axis leads, broadcast the weights over the bulk axes
+            iwts = self.iwts.reshape((-1,) + (1,)*(np.ndim(mass_fractions) - 1))
+            return iwts * rho * mass_fractions
         return self.iwts * rho * mass_fractions
 
     def get_mass_average_property(self, mass_fractions, spec_property):
@@ -186,108 +622,386 @@ class Thermochemistry:
         emix = self.get_mass_average_property(mass_fractions, e0_rt)
         return self.gas_constant * temperature * emix
 
+    def get_mixture_thermo(self, temperature, mass_fractions, do_energy=False):
+        """Return the mixture energetics and heat capacity from one evaluation.
+
+        Returns a tuple ``(h, cp, dcp_dt)`` of the mixture enthalpy, the
+        specific heat at constant pressure and its temperature derivative, all
+        per unit mass. If *do_energy* is *True*, ``(e, cv, dcv_dt)`` is
+        returned instead.
+
+        Since all species share *nasa_t_mid*, the NASA-7 coefficients are
+        mass-averaged first, and the mixture polynomials for both ranges are
+        then evaluated from one shared set of powers of the temperature.
+        """
+        if self._pyro_is_dense(mass_fractions):
+            y = np.asarray(mass_fractions, dtype=np.float64)
+            yw = self.iwts.reshape((-1,) + (1,)*(y.ndim - 1)) * y
+            coeffs = np.tensordot(self.nasa_coeffs[..., :6], yw, axes=(0, 0))
+            r_mix = np.sum(yw, axis=0)
+        else:
+            a = self.nasa_coeffs.tolist()
+            yw = [self.iwts[i]*mass_fractions[i] for i in range(self.num_species)]
+            coeffs = [[sum(a[i][r][k]*yw[i] for i in range(self.num_species))
+                       for k in range(6)]
+                      for r in range(2)]
+            r_mix = sum(yw)
+
+        t = temperature
+        t2 = t*t
+        t3 = t2*t
+        t4 = t3*t
+
+        def mixture_thermo(c):
+            h_rt = (c[0] + c[1]/2*t + c[2]/3*t2 + c[3]/4*t3 + c[4]/5*t4
+                    + c[5]/t)
+            cp_r = c[0] + c[1]*t + c[2]*t2 + c[3]*t3 + c[4]*t4
+            dcp_r = c[1] + 2*c[2]*t + 3*c[3]*t2 + 4*c[4]*t3
+            return h_rt, cp_r, dcp_r
+
+        is_high = self.usr_np.greater(temperature, self.nasa_t_mid)
+        h_rt, cp_r, dcp_r = [
+            self.usr_np.where(is_high, hi, lo)
+            for hi, lo in zip(mixture_thermo(coeffs[1]), mixture_thermo(coeffs[0]))]
+
+        if do_energy:
+            h_rt = h_rt - r_mix
+            cp_r = cp_r - r_mix
+
+        return (self.gas_constant * temperature * h_rt,
+                self.gas_constant * cp_r,
+                self.gas_constant * dcp_r)
+
     def get_species_specific_heats_r(self, temperature):
-        return self._pyro_make_array([
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.03611116 + 0.0146454151*temperature + -6.71077915e-06*temperature**2 + 1.47222923e-09*temperature**3 + -1.25706061e-13*temperature**4, 3.95920148 + -0.00757052247*temperature + 5.70990292e-05*temperature**2 + -6.91588753e-08*temperature**3 + 2.69884373e-11*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.28253784 + 0.00148308754*temperature + -7.57966669e-07*temperature**2 + 2.09470555e-10*temperature**3 + -2.16717794e-14*temperature**4, 3.78245636 + -0.00299673416*temperature + 9.84730201e-06*temperature**2 + -9.68129509e-09*temperature**3 + 3.24372837e-12*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.85746029 + 0.00441437026*temperature + -2.21481404e-06*temperature**2 + 5.23490188e-10*temperature**3 + -4.72084164e-14*temperature**4, 2.35677352 + 0.00898459677*temperature + -7.12356269e-06*temperature**2 + 2.45919022e-09*temperature**3 + -1.43699548e-13*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.71518561 + 0.00206252743*temperature + -9.98825771e-07*temperature**2 + 2.30053008e-10*temperature**3 + -2.03647716e-14*temperature**4, 3.57953347 + -0.00061035368*temperature + 1.01681433e-06*temperature**2 + 9.07005884e-10*temperature**3 + -9.04424499e-13*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.03399249 + 0.00217691804*temperature + -1.64072518e-07*temperature**2 + -9.7041987e-11*temperature**3 + 1.68200992e-14*temperature**4, 4.19864056 + -0.0020364341*temperature + 6.52040211e-06*temperature**2 + -5.48797062e-09*temperature**3 + 1.77197817e-12*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.3372792 + -4.94024731e-05*temperature + 4.99456778e-07*temperature**2 + -1.79566394e-10*temperature**3 + 2.00255376e-14*temperature**4, 2.34433112 + 0.00798052075*temperature + -1.9478151e-05*temperature**2 + 2.01572094e-08*temperature**3 + -7.37611761e-12*temperature**4),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.92664 + 0.0014879768*temperature + -5.68476e-07*temperature**2 + 1.0097038e-10*temperature**3 + -6.753351e-15*temperature**4, 3.298677 + 0.0014082404*temperature + -3.963222e-06*temperature**2 + 5.641515e-09*temperature**3 + -2.444854e-12*temperature**4),
-                ])
+        return self._pyro_eval_nasa7(self._cp_r_table, temperature)
 
     def get_species_enthalpies_rt(self, temperature):
-        return self._pyro_make_array([
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.03611116 + 0.00732270755*temperature + -2.2369263833333335e-06*temperature**2 + 3.680573075e-10*temperature**3 + -2.51412122e-14*temperature**4 + 4939.88614 / temperature, 3.95920148 + -0.003785261235*temperature + 1.9033009733333333e-05*temperature**2 + -1.7289718825e-08*temperature**3 + 5.3976874600000004e-12*temperature**4 + 5089.77593 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.28253784 + 0.00074154377*temperature + -2.526555563333333e-07*temperature**2 + 5.236763875e-11*temperature**3 + -4.33435588e-15*temperature**4 + -1088.45772 / temperature, 3.78245636 + -0.00149836708*temperature + 3.282434003333333e-06*temperature**2 + -2.4203237725e-09*temperature**3 + 6.48745674e-13*temperature**4 + -1063.94356 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.85746029 + 0.00220718513*temperature + -7.382713466666667e-07*temperature**2 + 1.30872547e-10*temperature**3 + -9.44168328e-15*temperature**4 + -48759.166 / temperature, 2.35677352 + 0.004492298385*temperature + -2.3745208966666665e-06*temperature**2 + 6.14797555e-10*temperature**3 + -2.8739909599999997e-14*temperature**4 + -48371.9697 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.71518561 + 0.001031263715*temperature + -3.329419236666667e-07*temperature**2 + 5.7513252e-11*temperature**3 + -4.07295432e-15*temperature**4 + -14151.8724 / temperature, 3.57953347 + -0.00030517684*temperature + 3.3893811e-07*temperature**2 + 2.26751471e-10*temperature**3 + -1.808848998e-13*temperature**4 + -14344.086 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.03399249 + 0.00108845902*temperature + -5.469083933333333e-08*temperature**2 + -2.426049675e-11*temperature**3 + 3.36401984e-15*temperature**4 + -30004.2971 / temperature, 4.19864056 + -0.00101821705*temperature + 2.17346737e-06*temperature**2 + -1.371992655e-09*temperature**3 + 3.54395634e-13*temperature**4 + -30293.7267 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.3372792 + -2.470123655e-05*temperature + 1.6648559266666665e-07*temperature**2 + -4.48915985e-11*temperature**3 + 4.00510752e-15*temperature**4 + -950.158922 / temperature, 2.34433112 + 0.003990260375*temperature + -6.4927169999999995e-06*temperature**2 + 5.03930235e-09*temperature**3 + -1.4752235220000002e-12*temperature**4 + -917.935173 / temperature),
-            self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.92664 + 0.0007439884*temperature + -1.8949200000000001e-07*temperature**2 + 2.5242595e-11*temperature**3 + -1.3506701999999999e-15*temperature**4 + -922.7977 / temperature, 3.298677 + 0.0007041202*temperature + -1.3210739999999999e-06*temperature**2 + 1.41037875e-09*temperature**3 + -4.889707999999999e-13*temperature**4 + -1020.8999 / temperature),
-                ])
+        return self._pyro_eval_nasa7(self._h_rt_table, temperature)
 
     def get_species_entropies_r(self, temperature):
-        return self._pyro_make_array([
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.03611116*self.usr_np.log(temperature) + 0.0146454151*temperature + -3.355389575e-06*temperature**2 + 4.907430766666667e-10*temperature**3 + -3.142651525e-14*temperature**4 + 10.3053693, 3.95920148*self.usr_np.log(temperature) + -0.00757052247*temperature + 2.85495146e-05*temperature**2 + -2.3052958433333332e-08*temperature**3 + 6.747109325e-12*temperature**4 + 4.09733096),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.28253784*self.usr_np.log(temperature) + 0.00148308754*temperature + -3.789833345e-07*temperature**2 + 6.982351833333333e-11*temperature**3 + -5.41794485e-15*temperature**4 + 5.45323129, 3.78245636*self.usr_np.log(temperature) + -0.00299673416*temperature + 4.923651005e-06*temperature**2 + -3.2270983633333334e-09*temperature**3 + 8.109320925e-13*temperature**4 + 3.65767573),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.85746029*self.usr_np.log(temperature) + 0.00441437026*temperature + -1.10740702e-06*temperature**2 + 1.7449672933333335e-10*temperature**3 + -1.18021041e-14*temperature**4 + 2.27163806, 2.35677352*self.usr_np.log(temperature) + 0.00898459677*temperature + -3.561781345e-06*temperature**2 + 8.197300733333333e-10*temperature**3 + -3.5924887e-14*temperature**4 + 9.90105222),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.71518561*self.usr_np.log(temperature) + 0.00206252743*temperature + -4.994128855e-07*temperature**2 + 7.6684336e-11*temperature**3 + -5.0911929e-15*temperature**4 + 7.81868772, 3.57953347*self.usr_np.log(temperature) + -0.00061035368*temperature + 5.08407165e-07*temperature**2 + 3.023352946666667e-10*temperature**3 + -2.2610612475e-13*temperature**4 + 3.50840928),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.03399249*self.usr_np.log(temperature) + 0.00217691804*temperature + -8.2036259e-08*temperature**2 + -3.2347329e-11*temperature**3 + 4.2050248e-15*temperature**4 + 4.9667701, 4.19864056*self.usr_np.log(temperature) + -0.0020364341*temperature + 3.260201055e-06*temperature**2 + -1.82932354e-09*temperature**3 + 4.429945425e-13*temperature**4 + -0.849032208),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 3.3372792*self.usr_np.log(temperature) + -4.94024731e-05*temperature + 2.49728389e-07*temperature**2 + -5.985546466666667e-11*temperature**3 + 5.0063844e-15*temperature**4 + -3.20502331, 2.34433112*self.usr_np.log(temperature) + 0.00798052075*temperature + -9.7390755e-06*temperature**2 + 6.7190698e-09*temperature**3 + -1.8440294025e-12*temperature**4 + 0.683010238),
-                self.usr_np.where(self.usr_np.greater(temperature, 1000.0), 2.92664*self.usr_np.log(temperature) + 0.0014879768*temperature + -2.84238e-07*temperature**2 + 3.3656793333333334e-11*temperature**3 + -1.68833775e-15*temperature**4 + 5.980528, 3.298677*self.usr_np.log(temperature) + 0.0014082404*temperature + -1.981611e-06*temperature**2 + 1.8805050000000002e-09*temperature**3 + -6.112135e-13*temperature**4 + 3.950372),
-                ])
-
-    def get_species_gibbs_rt(self, temperature):
-        h0_rt = self.get_species_enthalpies_rt(temperature)
-        s0_r = self.get_species_entropies_r(temperature)
-        return h0_rt - s0_r
+        return self._pyro_eval_nasa7(self._s_r_table, temperature)
 
-    def get_equilibrium_constants(self, temperature):
-        rt = self.gas_constant * temperature
-        c0 = self.usr_np.log(self.one_atm / rt)
+    def get_species_gibbs_rt(self, temperature, log_t=None, inv_t=None):
+        return self._pyro_eval_nasa7(self._g_rt_table, temperature,
+                                     log_t=log_t, inv_t=inv_t)
 
-        g0_rt = self.get_species_gibbs_rt(temperature)
-        return self._pyro_make_array([
-                    -0.17364695002734*temperature,
-                    g0_rt[2] + -1*-0.5*c0 + -1*(g0_rt[3] + 0.5*g0_rt[1]),
-                    g0_rt[4] + -1*-0.5*c0 + -1*(g0_rt[5] + 0.5*g0_rt[1]),
-                ])
+    def get_equilibrium_constants(self, temperature, log_t=None, g0_rt=None):
+        """Return the log of the inverse equilibrium constants in
+        concentration units, i.e. ``reaction_nu @ g0_rt - sum(nu)*c0``, with
+        ``c0 = log(one_atm/RT)``. Entries of irreversible reactions are not
+        used.
+        """
+        if log_t is None:
+            log_t = self.usr_np.log(temperature)
+        if g0_rt is None:
+            g0_rt = self.get_species_gibbs_rt(temperature, log_t=log_t)
+        c0 = np.log(self.one_atm / self.gas_constant) - log_t
 
-    def get_temperature(self, enthalpy_or_energy, t_guess, y, do_energy=False):
-        if do_energy is False:
-            pv_fun = self.get_mixture_specific_heat_cp_mass
-            he_fun = self.get_mixture_enthalpy_mass
-        else:
-            pv_fun = self.get_mixture_specific_heat_cv_mass
-            he_fun = self.get_mixture_internal_energy_mass
+        nu = np.hstack([self.reaction_nu,
+                        -np.sum(self.reaction_nu, axis=1, keepdims=True)])
+        return self._pyro_matvec(nu, list(g0_rt) + [c0])
+
+    def get_temperature_update_energy(self, e_in, t_in, y):
+        e, cv, _ = self.get_mixture_thermo(t_in, y, do_energy=True)
+        return (e_in - e) / cv
 
+    def get_temperature(self, enthalpy_or_energy, t_guess, y, do_energy=False):
         num_iter = 500
         tol = 1.0e-6
         ones = self._pyro_zeros_like(enthalpy_or_energy) + 1.0
         t_i = t_guess * ones
 
         for _ in range(num_iter):
-            f = enthalpy_or_energy - he_fun(t_i, y)
-            j = -pv_fun(t_i, y)
-            dt = -f / j
+            he, pv, _ = self.get_mixture_thermo(t_i, y, do_energy=do_energy)
+            dt = (enthalpy_or_energy - he) / pv
             t_i += dt
             if self._pyro_norm(dt, np.inf) < tol:
                 return t_i
 
         raise RuntimeError("Temperature iteration failed to converge")
 
-    def get_fwd_rate_coefficients(self, temperature, concentrations):
+    def get_temperature_and_residual(self, energy, t_guess, y, num_iter=1):
+        """Return the temperature from *num_iter* Newton iterations on the
+        mixture internal energy, starting from *t_guess*, its residual, the
+        relative size ``|dT|/T`` of the Newton update evaluated at that
+        temperature, and the temperature with that update applied, to seed a
+        later solve with.
+        """
+        t_i = t_guess
+        for _ in range(num_iter):
+            t_i = t_i + self.get_temperature_update_energy(energy, t_i, y)
+        dt = self.get_temperature_update_energy(energy, t_i, y)
+        return t_i, self.usr_np.abs(dt) / t_i, t_i + dt
+
+    def get_fwd_rate_coefficients(self, temperature, concentrations,
+                                  log_t=None, inv_t=None):
+        """Return the forward rate coefficients, evaluated in log space as the
+        product of :attr:`arrhenius_params` with ``(1, log(T), 1/T)``.
+        """
+        if log_t is None:
+            log_t = self.usr_np.log(temperature)
+        if inv_t is None:
+            inv_t = 1.0 / temperature
         ones = self._pyro_zeros_like(temperature) + 1.0
-        k_fwd = [
-            self.usr_np.exp(26.594857854425133 + -1*(17864.293439206183 / temperature)) * ones,
-            self.usr_np.exp(12.693776816787125 + 0.7*self.usr_np.log(temperature) + -1*(6038.634401985189 / temperature)) * ones,
-            self.usr_np.exp(18.302572655472037 + -1*(17612.683672456802 / temperature)) * ones,
-                ]
-
-        return self._pyro_make_array(k_fwd)
+        log_k_fwd = self._pyro_matvec(self.arrhenius_params, [ones, log_t, inv_t])
+        return self._pyro_make_array([self.usr_np.exp(log_k_fwd[i])
+                                      for i in range(self.num_reactions)])
 
     def get_net_rates_of_progress(self, temperature, concentrations):
-        k_fwd = self.get_fwd_rate_coefficients(temperature, concentrations)
-        log_k_eq = self.get_equilibrium_constants(temperature)
-        k_eq = self.usr_np.exp(log_k_eq)
+        """Return the net rates of progress.
+
+        ``log(T)`` and ``1/T`` are computed once and shared by the forward
+        rate coefficients and the species Gibbs energies, which in turn take
+        a single NASA-7 evaluation. Only reversible reactions evaluate their
+        equilibrium constant.
+        """
+        log_t = self.usr_np.log(temperature)
+        inv_t = 1.0 / temperature
+        k_fwd = self.get_fwd_rate_coefficients(temperature, concentrations,
+                                               log_t=log_t, inv_t=inv_t)
+        g0_rt = self.get_species_gibbs_rt(temperature, log_t=log_t, inv_t=inv_t)
+        log_k_eq = self.get_equilibrium_constants(temperature, log_t=log_t,
+                                                  g0_rt=g0_rt)
+        k_eq = [self.usr_np.exp(log_k_eq[i]) if self.reaction_reversible[i]
+                else None for i in range(self.num_reactions)]
         return self._pyro_make_array([
                     k_fwd[0]*concentrations[0]**0.5*concentrations[1]**0.65,
-                    k_fwd[1]*(concentrations[3]*concentrations[1]**0.5 + -1*k_eq[1]*concentrations[2]),
-                    k_fwd[2]*(concentrations[5]*concentrations[1]**0.5 + -1*k_eq[2]*concentrations[4]),
+                    k_fwd[1]*(concentrations[3]*concentrations[1]**0.5
+                              + -1*k_eq[1]*concentrations[2]),
+                    k_fwd[2]*(concentrations[5]*concentrations[1]**0.5
+                              + -1*k_eq[2]*concentrations[4]),
                ])
 
     def get_net_production_rates(self, rho, temperature, mass_fractions):
         c = self.get_concentrations(rho, mass_fractions)
         r_net = self.get_net_rates_of_progress(temperature, c)
-        ones = self._pyro_zeros_like(r_net[0]) + 1.0
+        return self._pyro_matvec(self.reaction_nu.T, r_net)
+
+    def get_net_rates_of_progress_and_jacobian(self, temperature, concentrations):
+        """Return the net rates of progress and their analytic Jacobian.
+
+        Returns a tuple ``(r_net, dq_dc, dq_dt)`` of the net rates of progress,
+        their derivatives ``dq_dc[i][j]`` of reaction *i* with respect to the
+        concentration of species *j*, and ``dq_dt[i]`` with respect to
+        temperature, at constant concentrations.
+        """
+        c = concentrations
+        log_t = self.usr_np.log(temperature)
+        inv_t = 1.0 / temperature
+        k_fwd = self.get_fwd_rate_coefficients(temperature, c,
+                                               log_t=log_t, inv_t=inv_t)
+        h0_rt = self._pyro_eval_nasa7(self._h_rt_table, temperature, inv_t=inv_t)
+        g0_rt = h0_rt - self._pyro_eval_nasa7(self._s_r_table, temperature,
+                                              log_t=log_t, inv_t=inv_t)
+        log_k_eq = self.get_equilibrium_constants(temperature, log_t=log_t,
+                                                  g0_rt=g0_rt)
+        k_eq = [self.usr_np.exp(log_k_eq[i]) if self.reaction_reversible[i]
+                else None for i in range(self.num_reactions)]
+
+        # d(log(k_fwd))/dT = (b - (-Ea/R)/T)/T
+        dlog_k_fwd = [inv_t*(b - ea_r*inv_t)
+                      for _, b, ea_r in self.arrhenius_params.tolist()]
+        # d(g/RT)/dT = -(h/RT)/T and d(c0)/dT = -1/T
+        nu = self.reaction_nu.tolist()
+        dlog_k_eq = [
+            inv_t*(sum(nu[i]) - sum(nu_ij*h0_rt[j]
+                                     for j, nu_ij in enumerate(nu[i]) if nu_ij))
+            for i in range(self.num_reactions)]
+
+        floor = self.jacobian_conc_floor
+        c_fl = [self.usr_np.where(self.usr_np.greater(c[i], floor), c[i], floor)
+                for i in (0, 1)]
+
+        # forward and reverse rates of progress, and their nonzero
+        # derivatives with respect to concentration, by species index
+        q_fwd = [k_fwd[0]*c[0]**0.5*c[1]**0.65,
+                 k_fwd[1]*c[3]*c[1]**0.5,
+                 k_fwd[2]*c[5]*c[1]**0.5]
+        q_rev = [None,
+                 k_fwd[1]*k_eq[1]*c[2],
+                 k_fwd[2]*k_eq[2]*c[4]]
+        dq_dc = [
+            {0: k_fwd[0]*0.5*c_fl[0]**-0.5*c[1]**0.65,
+             1: k_fwd[0]*0.65*c[0]**0.5*c_fl[1]**-0.35},
+            {3: k_fwd[1]*c[1]**0.5,
+             1: k_fwd[1]*0.5*c[3]*c_fl[1]**-0.5,
+             2: -1*k_fwd[1]*k_eq[1]},
+            {5: k_fwd[2]*c[1]**0.5,
+             1: k_fwd[2]*0.5*c[5]*c_fl[1]**-0.5,
+             4: -1*k_fwd[2]*k_eq[2]},
+            ]
+
+        r_net = []
+        dq_dt = []
+        for i in range(self.num_reactions):
+            if q_rev[i] is None:
+                r_net.append(q_fwd[i])
+                dq_dt.append(dlog_k_fwd[i]*q_fwd[i])
+            else:
+                r_net.append(q_fwd[i] - q_rev[i])
+                dq_dt.append(dlog_k_fwd[i]*(q_fwd[i] - q_rev[i])
+                             - dlog_k_eq[i]*q_rev[i])
+
+        zeros = self._pyro_zeros_like(temperature)
+        dq_dc = self._pyro_make_array([
+            self._pyro_make_array([dq_dc[i].get(j, zeros)
+                                   for j in range(self.num_species)])
+            for i in range(self.num_reactions)])
+
+        return (self._pyro_make_array(r_net), dq_dc,
+                self._pyro_make_array(dq_dt))
+
+    def get_net_production_rates_and_jacobian(self, temperature, concentrations):
+        """Return the net production rates and their analytic Jacobian.
+
+        Returns a tuple ``(omega, jac_c, jac_t)`` of the net production rates
+        in terms of the *concentrations*, their derivatives ``jac_c[i][j]``
+        with respect to the concentration of species *j*, and ``jac_t[i]``
+        with respect to temperature, at constant concentrations.
+        """
+        r_net, dq_dc, dq_dt = self.get_net_rates_of_progress_and_jacobian(
+            temperature, concentrations)
+
+        nu = self.reaction_nu.tolist()
+        zeros = self._pyro_zeros_like(temperature)
+        jac_c = self._pyro_make_array([
+            self._pyro_make_array([
+                sum((nu[r][i]*dq_dc[r][j] for r in range(self.num_reactions)
+                     if nu[r][i]), zeros)
+                for j in range(self.num_species)])
+            for i in range(self.num_species)])
+
+        return (self._pyro_matvec(self.reaction_nu.T, r_net),
+                jac_c,
+                self._pyro_matvec(self.reaction_nu.T, dq_dt))
+
+    def get_mole_fractions(self, mix_mol_weight, mass_fractions):
         return self._pyro_make_array([
-                -1*r_net[0] * ones,
-                -1*(r_net[0] + 0.5*r_net[1] + 0.5*r_net[2]) * ones,
-                r_net[1] * ones,
-                2.0*r_net[0] + -1*r_net[1] * ones,
-                r_net[2] * ones,
-                2.0*r_net[0] + -1*r_net[2] * ones,
-                0.0 * ones,
-               ])
+            self.iwts[i] * mass_fractions[i] * mix_mol_weight
+            for i in range(self.num_species)])
+
+    def get_species_viscosities(self, temperature, log_t=None):
+        """Return the species viscosities (Pa s) from the fits
+        ``mu_i = sqrt(T)*q_i(log(T))**2``.
+        """
+        if log_t is None:
+            log_t = self.usr_np.log(temperature)
+        sqrt_t = self.usr_np.sqrt(temperature)
+        q = self._pyro_eval_log_poly(self.transport_visc_coeffs, log_t)
+        return self._pyro_make_array([sqrt_t*q[i]**2
+                                      for i in range(self.num_species)])
+
+    def get_species_thermal_conductivities(self, temperature, log_t=None):
+        """Return the species thermal conductivities (W/m/K) from the fits
+        ``lambda_i = sqrt(T)*poly_i(log(T))``.
+        """
+        if log_t is None:
+            log_t = self.usr_np.log(temperature)
+        return self._pyro_eval_log_poly(self.transport_cond_coeffs, log_t,
+                                        scale=self.usr_np.sqrt(temperature))
+
+    def get_species_binary_mass_diffusivities(self, temperature, log_t=None):
+        """Return the binary mass diffusivities times pressure (Pa m^2/s),
+        indexed ``[i][j]``, from the fits ``p*D_ij = T**1.5*poly_ij(log(T))``.
+
+        The table is symmetric, so only the pairs in
+        :attr:`transport_diff_pair_coeffs` are evaluated.
+        """
+        if log_t is None:
+            log_t = self.usr_np.log(temperature)
+        pair_diff = self._pyro_eval_log_poly(
+            self.transport_diff_pair_coeffs, log_t,
+            scale=temperature*self.usr_np.sqrt(temperature))
+
+        if self._pyro_is_dense(pair_diff):
+            return pair_diff[self._diff_pair_index]
+
+        index = self._diff_pair_index.tolist()
+        return self._pyro_make_array([
+            self._pyro_make_array([pair_diff[index[i][j]]
+                                   for j in range(self.num_species)])
+            for i in range(self.num_species)])
+
+    def _get_mixture_viscosity_wilke(self, temperature, log_t, x):
+        # sqrt(mu_i/mu_j) = q_i/q_j, so the Wilke factors need no square
+        # roots and only one reciprocal per species
+        q = self._pyro_eval_log_poly(self.transport_visc_coeffs, log_t)
+        inv_q = [1.0 / q[j] for j in range(self.num_species)]
+        k = self._wilke_k.tolist()
+        c = self._wilke_c.tolist()
+
+        mu_mix = 0
+        for i in range(self.num_species):
+            denom = x[i] + sum(
+                x[j]*k[i][j]*(1.0 + c[i][j]*q[i]*inv_q[j])**2
+                for j in range(self.num_species) if j != i)
+            mu_mix = mu_mix + x[i]*q[i]**2/denom
+        return self.usr_np.sqrt(temperature) * mu_mix
+
+    def _get_mixture_thermal_conductivity(self, temperature, log_t, x):
+        lam = self.get_species_thermal_conductivities(temperature, log_t=log_t)
+        return 0.5*(
+            sum(x[i]*lam[i] for i in range(self.num_species))
+            + 1.0/sum(x[i]/lam[i] for i in range(self.num_species)))
+
+    def _get_species_mass_diffusivities(self, pressure, temperature, log_t,
+                                        mass_fractions, x):
+        # (1 - Y_i)/(p*sum_{j != i} X_j/D_ij), with the self diffusivity
+        # where no other species is present
+        p_diff = self.get_species_binary_mass_diffusivities(temperature,
+                                                            log_t=log_t)
+        nspecies = self.num_species
+        inv_p_diff = {}
+        for i in range(nspecies):
+            for j in range(i+1, nspecies):
+                inv_p_diff[i, j] = inv_p_diff[j, i] = 1.0 / p_diff[i][j]
+
+        tiny = 1.0e-300
+        diff = []
+        for i in range(nspecies):
+            x_sum = sum(x[j]*inv_p_diff[i, j] for j in range(nspecies) if j != i)
+            diff.append(self.usr_np.where(
+                self.usr_np.greater(x_sum, 0*x_sum),
+                (1.0 - mass_fractions[i]) / (pressure*(x_sum + tiny)),
+                p_diff[i][i] / pressure))
+        return self._pyro_make_array(diff)
+
+    def get_mixture_viscosity_mixavg(self, temperature, mass_fractions):
+        """Return the mixture viscosity (Pa s) from Wilke's mixing rule."""
+        log_t = self.usr_np.log(temperature)
+        mmw = self.get_mix_molecular_weight(mass_fractions)
+        x = self.get_mole_fractions(mmw, mass_fractions)
+        return self._get_mixture_viscosity_wilke(temperature, log_t, x)
+
+    def get_mixture_thermal_conductivity_mixavg(self, temperature, mass_fractions):
+        """Return the mixture thermal conductivity (W/m/K), the mean of the
+        mole fraction weighted arithmetic and harmonic averages.
+        """
+        log_t = self.usr_np.log(temperature)
+        mmw = self.get_mix_molecular_weight(mass_fractions)
+        x = self.get_mole_fractions(mmw, mass_fractions)
+        return self._get_mixture_thermal_conductivity(temperature, log_t, x)
+
+    def get_species_mass_diffusivities_mixavg(self, pressure, temperature,
+                                              mass_fractions):
+        """Return the mixture-averaged species mass diffusivities (m^2/s)."""
+        log_t = self.usr_np.log(temperature)
+        mmw = self.get_mix_molecular_weight(mass_fractions)
+        x = self.get_mole_fractions(mmw, mass_fractions)
+        return self._get_species_mass_diffusivities(
+            pressure, temperature, log_t, mass_fractions, x)
+
+    def get_mixture_transport_mixavg(self, pressure, temperature,
+                                     mass_fractions):
+        """Return a tuple ``(viscosity, thermal_conductivity, diffusivities)``
+        of the mixture-averaged transport properties, sharing ``log(T)`` and
+        the mole fractions between them.
+        """
+        log_t = self.usr_np.log(temperature)
+        mmw = self.get_mix_molecular_weight(mass_fractions)
+        x = self.get_mole_fractions(mmw, mass_fractions)
+        return (
+            self._get_mixture_viscosity_wilke(temperature, log_t, x),
+            self._get_mixture_thermal_conductivity(temperature, log_t, x),
+            self._get_species_mass_diffusivities(
+                pressure, temperature, log_t, mass_fractions, x))
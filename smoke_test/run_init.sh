@@ -0,0 +1,2 @@
+#!/bin/bash
+mpirun -n 1 python -u -O -m mpi4py isolator_init.py -i run_params.yaml
@@ -1,2 +1,2 @@
 #!/bin/bash
-mpirun -n 1 python -u -O -m mpi4py isolator.py -i run_params.yaml -r restart_data/isolator-000010 --log
+mpirun -n 1 python -u -O -m mpi4py isolator.py -i run_params.yaml -r restart_data/isolator-000010 -t restart_data/isolator_init-000000 --log
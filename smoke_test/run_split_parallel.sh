@@ -0,0 +1,4 @@
+#!/bin/bash
+rm -rf mesh_cache
+python -u split_mesh.py --dim 2 --nparts 4 data/isolator.msh
+mpirun -n 4 python -u -O -m mpi4py isolator.py -i run_params.yaml --log --lazy
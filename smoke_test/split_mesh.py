@@ -0,0 +1 @@
+../split_mesh.py
\ No newline at end of file
@@ -0,0 +1,10 @@
+#!/bin/bash
+set -e
+rm -rf restart_data
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_init.py -i run_params_binary.yaml --lazy
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_run.py -i run_params_binary.yaml -r restart_data/isolator_init-000000 --log --lazy
+# the last 2 restarts and those at multiples of 10 steps are kept
+test ! -e restart_data/isolator-000005-0000.rst
+test -e restart_data/isolator-000010-0000.rst
+# restart from the compressed binary restart
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_run.py -i run_params_binary.yaml -r restart_data/isolator-000010 --log --lazy
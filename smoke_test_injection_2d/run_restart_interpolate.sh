@@ -0,0 +1,6 @@
+#!/bin/bash
+set -e
+rm -rf restart_data
+# initialize on 2 ranks, then interpolate the restart on 1 rank
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_init.py -i run_params_scalar.yaml --lazy
+mpirun -n 1 python -u -O -m mpi4py isolator_injection_run.py -i run_params_scalar.yaml -r restart_data/isolator_init-000000 --log --lazy --interpolate
@@ -0,0 +1,8 @@
+#!/bin/bash
+set -e
+rm -rf restart_data
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_init.py -i run_params_shared.yaml --lazy
+# repartition the per-rank restart of 2 ranks to 3 ranks
+mpirun -n 3 python -u -O -m mpi4py isolator_injection_run.py -i run_params_shared.yaml -r restart_data/isolator_init-000000 --log --lazy
+# repartition the shared restart of 3 ranks to 2 ranks
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_run.py -i run_params_shared.yaml -r restart_data/isolator-000010 --log --lazy
@@ -0,0 +1,7 @@
+#!/bin/bash
+set -e
+rm -rf restart_data
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_init.py -i run_params_shared.yaml --lazy
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_run.py -i run_params_shared.yaml -r restart_data/isolator_init-000000 --log --lazy
+# restart from the compressed shared restart
+mpirun -n 2 python -u -O -m mpi4py isolator_injection_run.py -i run_params_shared.yaml -r restart_data/isolator-000010 --log --lazy
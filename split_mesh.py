@@ -0,0 +1,73 @@
+"""Split a mesh ahead of a parallel run into the per-rank mesh cache of
+:func:`isolator_mesh.distribute_mesh`.
+
+The mesh (gmsh or binary, see ``convert_mesh.py``) is read and partitioned
+once in this process, and each part is written to ``mesh_cache/`` under the
+name the drivers look for. A run on the same number of ranks with
+``use_mesh_cache`` on (the default) then loads one part on each rank, and no
+rank reads or partitions the global mesh.
+
+Usage: python split_mesh.py --dim 3 --nparts 64 data/oneX/isolator.msh
+"""
+
+__copyright__ = """
+Copyright (C) 2020 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import sys
+import time
+
+from isolator_mesh import split_mesh
+
+
+def main(mesh_filename, dim, nparts, cache_path="mesh_cache/"):
+
+    t_start = time.perf_counter()
+    cache_filenames = split_mesh(dim=dim, mesh_filename=mesh_filename,
+                                 nparts=nparts, cache_path=cache_path)
+    t_split = time.perf_counter() - t_start
+
+    print(f"{mesh_filename} -> {nparts} parts in {cache_path}")
+    print(f"\tfirst part: {cache_filenames[0]}")
+    print(f"\tsplit time = {t_split:.2f} s")
+
+
+if __name__ == "__main__":
+
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Split a mesh into the mesh cache of a parallel run")
+    parser.add_argument("mesh_file", type=str,
+                        help="gmsh (msh2, ASCII) or binary mesh file")
+    parser.add_argument("--dim", type=int, dest="dim", required=True,
+                        help="dimension of the mesh")
+    parser.add_argument("-n", "--nparts", type=int, dest="nparts",
+                        required=True, help="number of ranks of the run")
+    parser.add_argument("-o", "--output", type=str, dest="output",
+                        default="mesh_cache/",
+                        help="mesh cache directory [mesh_cache/]")
+
+    args = parser.parse_args()
+
+    print(f"Running {sys.argv[0]}\n")
+    main(args.mesh_file, dim=args.dim, nparts=args.nparts,
+         cache_path=args.output)
@@ -0,0 +1 @@
+../../../pyro_mechs/implicit_chemistry.py
\ No newline at end of file
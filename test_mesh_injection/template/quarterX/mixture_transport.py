@@ -0,0 +1 @@
+../../../pyro_mechs/mixture_transport.py
\ No newline at end of file
@@ -0,0 +1 @@
+../isolator_initializers.py
\ No newline at end of file